@@ -0,0 +1,190 @@
+from benchmarks.synthetic_log import SyntheticLog
+from qgate_graph.graph_performance import GraphPerformance
+from qgate_graph.graph_executor import GraphExecutor
+from qgate_graph.output_writer import OutputWriter
+from qgate_graph.perf_reader import PerfReader
+from qgate_graph import __version__ as version
+from io import StringIO
+import os.path, os
+import tempfile
+import platform
+import time
+import json
+import click
+
+
+class _CaptureWriter(OutputWriter):
+    """Writer without output, it keeps aggregated data for the next stages"""
+
+    def __init__(self):
+        super().__init__("BENCH", ".none")
+        self.items = []
+
+    def create_output(self, graph, percentiles, title, file_name, output_dir, context = None) -> str:
+        self.items.append((dict(percentiles), title, file_name.replace(".none", ".png"), output_dir))
+        return os.path.join(output_dir, file_name)
+
+
+class _CaptureExecutor(GraphExecutor):
+    """Executor graph without output, it keeps aggregated data for the next stages"""
+
+    def __init__(self):
+        super().__init__()
+        self.items = []
+
+    def _show_graph(self, start_date, executors, end_date, title, file_name, output_dir, context = None) -> str:
+        self.items.append((start_date, {key: list(value) for key, value in executors.items()}, end_date, title,
+                           file_name, output_dir))
+        return os.path.join(output_dir, file_name)
+
+
+class Benchmark:
+    """
+    Measure duration of each processing stage (parsing, aggregation and rendering) based
+    on synthetic performance log
+
+        example::
+
+            from benchmarks.bench import Benchmark
+            from benchmarks.synthetic_log import SyntheticLog
+
+            result = Benchmark(SyntheticLog(runs = 20, groups = 2)).run()
+            print(result["stages"])
+    """
+
+    # stored baseline (relative to this module)
+    BASELINE_FILE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+    def __init__(self, log: SyntheticLog, repeat = 3, render_limit = 5):
+        """
+        :param log:             Synthetic log
+        :param repeat:          Amount of repeats, the best time is used (default is 3)
+        :param render_limit:    Maximal amount of rendered graphs/tables in each stage (default is 5)
+        """
+        self._log = log
+        self._repeat = repeat
+        self._render_limit = render_limit
+
+    def _measure(self, function, items):
+        """Return the best duration (seconds per item) from repeats"""
+        best = None
+        for i in range(self._repeat):
+            start = time.perf_counter()
+            function()
+            duration = time.perf_counter() - start
+            best = duration if best is None else min(best, duration)
+        return {"seconds": best, "items": items, "per_item": best / items if items else 0}
+
+    def run(self) -> dict:
+        """Run all stages and return measured durations"""
+        text = self._log.text()
+        events = list(PerfReader(StringIO(text)))
+        stages = {}
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            # parsing of input
+            stages["parse"] = self._measure(lambda: list(PerfReader(StringIO(text))), text.count("\n"))
+
+            # aggregation (without rendering)
+            writer = _CaptureWriter()
+            performance = GraphPerformance(writers = [writer])
+
+            def aggregate_performance():
+                writer.items.clear()
+                performance._generate_from_events(events, output_dir)
+            stages["aggregate_performance"] = self._measure(aggregate_performance, len(events))
+
+            executor = _CaptureExecutor()
+
+            def aggregate_executor():
+                executor.items.clear()
+                executor._generate_from_events(events, output_dir)
+            stages["aggregate_executor"] = self._measure(aggregate_executor, len(events))
+
+            # rendering
+            tables = writer.items[:self._render_limit]
+            stages["create_table"] = self._measure(
+                lambda: [performance._create_table(item[0]).get_csv_string() for item in tables], len(tables))
+            stages["create_graph"] = self._measure(
+                lambda: [performance._create_graph(*item) for item in tables], len(tables))
+
+            graphs = executor.items[:self._render_limit]
+            stages["show_graph"] = self._measure(
+                lambda: [GraphExecutor()._show_graph(*item) for item in graphs], len(graphs))
+
+        return {"version": version,
+                "python": platform.python_version(),
+                "scale": {"runs": self._log.runs, "groups": self._log.groups, "executors": self._log.executors,
+                          "details": self._log.details, "percentile": self._log.percentile,
+                          "lines": text.count("\n"), "events": len(events)},
+                "stages": stages}
+
+    @staticmethod
+    def load_baseline(baseline_file = None) -> dict:
+        baseline_file = baseline_file if baseline_file else Benchmark.BASELINE_FILE
+        if not os.path.exists(baseline_file):
+            return None
+        with open(baseline_file, "r") as f:
+            return json.load(f)
+
+    @staticmethod
+    def save_baseline(result: dict, baseline_file = None):
+        baseline_file = baseline_file if baseline_file else Benchmark.BASELINE_FILE
+        with open(baseline_file, "w") as f:
+            json.dump(result, f, indent = 1)
+
+    @staticmethod
+    def compare(result: dict, baseline: dict, threshold = 0.5) -> list[str]:
+        """
+        Compare result with baseline (duration per item)
+
+        :param result:          Result of benchmark
+        :param baseline:        Baseline
+        :param threshold:       Accepted slowdown (default is 0.5, it means 50%)
+        :return:                List of stages with regression
+        """
+        regressions = []
+        for stage, value in result["stages"].items():
+            base = baseline["stages"].get(stage)
+            if base and base["per_item"] > 0 and value["per_item"] > base["per_item"] * (1 + threshold):
+                regressions.append(stage)
+        return regressions
+
+
+@click.command()
+@click.option("--runs", help="amount of runs in synthetic log (default is 20)", default=20)
+@click.option("--groups", help="amount of groups in each run (default is 2)", default=2)
+@click.option("--executors", help="executors for plans in group (default is '1,2,4,8,16,32')", default="1,2,4,8,16,32")
+@click.option("--details", help="amount of detail records for each plan (default is one for each executor)", default=None, type=int)
+@click.option("--percentile", help="percentile of runs (default is 0.95)", default=0.95)
+@click.option("--repeat", help="amount of repeats, the best time is used (default is 3)", default=3)
+@click.option("--render-limit", help="maximal amount of rendered outputs in each stage (default is 5)", default=5)
+@click.option("--baseline", help="baseline file (default is 'benchmarks/baseline.json')", default=None)
+@click.option("--save-baseline", help="store the result as new baseline", is_flag=True)
+@click.option("--threshold", help="accepted slowdown against baseline (default is 0.5, it means 50%)", default=0.5)
+def bench(runs, groups, executors, details, percentile, repeat, render_limit, baseline, save_baseline, threshold):
+    """Measure parsing, aggregation and rendering based on synthetic log."""
+    log = SyntheticLog(runs = runs, groups = groups, executors = [int(item) for item in executors.split(",")],
+                       details = details, percentile = percentile)
+    result = Benchmark(log, repeat, render_limit).run()
+
+    base = Benchmark.load_baseline(baseline)
+    for stage, value in result["stages"].items():
+        line = f"{stage:<24} {value['per_item'] * 1000:10.4f} ms/item {value['seconds']:9.4f} s ({value['items']} items)"
+        if base and stage in base["stages"] and base["stages"][stage]["per_item"] > 0:
+            line += f" {value['per_item'] / base['stages'][stage]['per_item']:6.2f}x baseline"
+        click.echo(line)
+
+    if save_baseline:
+        Benchmark.save_baseline(result, baseline)
+    elif base:
+        if base["scale"] != result["scale"]:
+            click.echo("Warning: different scale of synthetic log than in baseline")
+        regressions = Benchmark.compare(result, base, threshold)
+        if regressions:
+            click.echo(f"Regression in stages: {', '.join(regressions)}")
+            raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    bench()
@@ -0,0 +1,135 @@
+from qgate_graph.file_marker import FileMarker as const
+import datetime
+import json
+import random
+
+
+class SyntheticLog:
+    """
+    Generate synthetic performance log (the same format as output from qgate-perf)
+
+        example::
+
+            from benchmarks.synthetic_log import SyntheticLog
+
+            log = SyntheticLog(runs = 10, groups = 2, executors = [1, 2, 4, 8, 16], percentile = 0.95)
+            log.write("input/synthetic.txt")
+    """
+
+    def __init__(self, runs = 1, groups = 1, executors = (1, 2, 4, 8), details = None, percentile = 1,
+                 bulk = (1, 10), duration = 5, seed = 0):
+        """
+        :param runs:            Amount of runs (blocks with header)
+        :param groups:          Amount of groups in each run (lines in graph)
+        :param executors:       Amount of executors for each plan in group
+        :param details:         Amount of detail records for each plan (default is None, one detail for each executor)
+        :param percentile:      Percentile of run (default is 1, without percentile)
+        :param bulk:            Bulk (rows, columns) size
+        :param duration:        Duration of each plan in seconds
+        :param seed:            Seed for random values (the same seed, the same output)
+        """
+        self.runs = runs
+        self.groups = groups
+        self.executors = list(executors)
+        self.details = details
+        self.percentile = percentile
+        self.bulk = list(bulk)
+        self.duration = duration
+        self.seed = seed
+
+    def _suffixes(self) -> list[tuple]:
+        """Suffixes of values and ratio of response time (percentile has faster response than all calls)"""
+        return [(f"_{int(self.percentile * 100)}", 0.85), ("", 1)] if self.percentile < 1 else [("", 1)]
+
+    @staticmethod
+    def _time(value: datetime.datetime) -> str:
+        return value.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+    @staticmethod
+    def _line(indent, item: dict) -> str:
+        return " " * indent + json.dumps(item, separators = (",", ":")) + "\n"
+
+    def _header(self, run, now: datetime.datetime) -> dict:
+        header = {const.PRF_TYPE: const.PRF_HDR_TYPE,
+                  const.PRF_HDR_LABEL: f"synthetic-{run:03d}",
+                  const.PRF_HDR_BULK: self.bulk,
+                  const.PRF_HDR_DURATION: self.duration}
+        if self.percentile < 1:
+            header[const.PRF_HDR_PERCENTILE] = self.percentile
+        header.update({const.PRF_HDR_AVIALABLE_CPU: 8,
+                       const.PRF_HDR_MEMORY: "15.1 GB",
+                       const.PRF_HDR_MEMORY_FREE: "12.7 GB",
+                       const.PRF_HDR_HOST: "synthetic/127.0.0.1",
+                       const.PRF_HDR_NOW: self._time(now)})
+        return header
+
+    def _detail(self, rnd: random.Random, process_id, init, start, end) -> dict:
+        detail = {const.PRF_TYPE: const.PRF_DETAIL_TYPE, const.PRF_DETAIL_PROCESSID: process_id}
+        response = rnd.uniform(0.01, 0.05)
+        for suffix, ratio in self._suffixes():
+            avrg = response * ratio
+            calls = int(self.duration / avrg)
+            detail.update({const.PRF_DETAIL_CALLS + suffix: calls,
+                           const.PRF_DETAIL_AVRG + suffix: avrg,
+                           const.PRF_DETAIL_MIN + suffix: avrg * rnd.uniform(0.2, 0.5),
+                           const.PRF_DETAIL_MAX + suffix: avrg * rnd.uniform(2, 10),
+                           const.PRF_DETAIL_STDEV + suffix: avrg * rnd.uniform(0.2, 0.8),
+                           const.PRF_DETAIL_TOTAL + suffix: calls * avrg})
+        detail.update({const.PRF_DETAIL_TIME_INIT: self._time(init),
+                       const.PRF_DETAIL_TIME_START: self._time(start),
+                       const.PRF_DETAIL_TIME_END: self._time(end)})
+        return detail
+
+    def _core(self, rnd: random.Random, group, executors, threads, end) -> dict:
+        core = {const.PRF_TYPE: const.PRF_CORE_TYPE,
+                const.PRF_CORE_PLAN_EXECUTOR_ALL: executors * threads,
+                const.PRF_CORE_PLAN_EXECUTOR: [executors, threads],
+                const.PRF_CORE_REAL_EXECUTOR: executors * threads,
+                const.PRF_CORE_GROUP: group}
+        response = rnd.uniform(0.01, 0.05) * (1 + executors / 16)
+        for suffix, ratio in self._suffixes():
+            avrg = response * ratio
+            per_sec_raw = executors * threads / avrg
+            core.update({const.PRF_CORE_TOTAL_CALL + suffix: int(per_sec_raw * self.duration),
+                         const.PRF_CORE_TOTAL_CALL_PER_SEC_RAW + suffix: per_sec_raw,
+                         const.PRF_CORE_TOTAL_CALL_PER_SEC + suffix: per_sec_raw * self.bulk[0],
+                         const.PRF_CORE_AVRG_TIME + suffix: avrg,
+                         const.PRF_CORE_STD_DEVIATION + suffix: avrg * rnd.uniform(0.2, 0.8)})
+        core[const.PRF_CORE_TIME_END] = self._time(end)
+        return core
+
+    def lines(self):
+        """Generate lines of synthetic log"""
+        rnd = random.Random(self.seed)
+        now = datetime.datetime(2024, 10, 11, 14, 36, 7, 799293)
+        process_id = 1000
+        for run in range(self.runs):
+            yield f"############### {self._time(now)} ###############\n"
+            yield self._line(0, self._header(run, now))
+            run_start = now
+            for group_number in range(self.groups):
+                group = f"{group_number + 1}x threads"
+                for executors in self.executors:
+                    init = now + datetime.timedelta(seconds = 0.3)
+                    start = init + datetime.timedelta(seconds = 1)
+                    end = start + datetime.timedelta(seconds = self.duration)
+                    for detail in range(self.details if self.details is not None else executors):
+                        process_id += 1
+                        yield self._line(4, self._detail(rnd, process_id,
+                                                         init + datetime.timedelta(microseconds = rnd.randint(0, 99999)),
+                                                         start + datetime.timedelta(microseconds = rnd.randint(0, 99999)),
+                                                         end + datetime.timedelta(microseconds = rnd.randint(0, 99999))))
+                    yield self._line(2, self._core(rnd, group, executors, group_number + 1, end))
+                    now = end + datetime.timedelta(seconds = 1)
+            duration = (now - run_start).total_seconds()
+            yield f"############### State: OK,  Duration: {int(duration)} sec ({round(duration, 1)} seconds) ###############\n"
+            now += datetime.timedelta(minutes = 1)
+
+    def text(self) -> str:
+        """Return synthetic log as text"""
+        return "".join(self.lines())
+
+    def write(self, output_file):
+        """Write synthetic log to the file"""
+        with open(output_file, "w") as f:
+            f.writelines(self.lines())
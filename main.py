@@ -1,5 +1,11 @@
 from qgate_graph.graph_performance import GraphPerformance
 from qgate_graph.graph_executor import GraphExecutor
+from qgate_graph.graph_pipeline import GraphPipeline
+from qgate_graph.parse_cache import ParseCache
+from qgate_graph.render_cache import RenderCache
+from qgate_graph.graph_stats import GraphStats
+from qgate_graph.dir_watcher import DirWatcher
+from qgate_graph.input_finder import InputFinder
 import qgate_graph
 import click
 import logging
@@ -7,15 +13,51 @@ import logging
 @click.command()
 @click.option("--input", help="input directory (default is directory 'input')", default="input")
 @click.option("--output", help="output directory (default is directory 'output')", default="output")
-def graph(input,output):
+@click.option("--workers", help="amount of worker processes (default is 1, without parallel processing)", default=1)
+@click.option("--cache", help="directory for cache of parsed inputs (default is without cache)", default=None)
+@click.option("--clear-cache", help="invalidate the caches (parsed inputs, rendered graphs) before generation", is_flag=True)
+@click.option("--render-cache", help="directory for cache of rendered graphs (default is without cache)", default=None)
+@click.option("--resolution", help="time resolution in seconds for executors graphs or 'auto' (default is 1)", default="1")
+@click.option("--profile", help="show duration of stages (read, decode, aggregate, render, save) and counts", is_flag=True)
+@click.option("--watch", help="watch input directory and generate only new/changed outputs (until Ctrl+C)", is_flag=True)
+@click.option("--poll-interval", help="interval in seconds for check of input directory in watch mode (default is 2)", default=2.0)
+@click.option("--debounce", help="time in seconds without change of file before its generation in watch mode (default is 2)", default=2.0)
+@click.option("--recursive", help="scan also subdirectories of input directory", is_flag=True)
+@click.option("--include", help="glob pattern of included input files e.g. '*.txt' (can be repeated)", multiple=True)
+@click.option("--exclude", help="glob pattern of excluded input files/directories (can be repeated)", multiple=True)
+@click.option("--changed-since", help="only input files modified since the time e.g. '2024-10-01 12:00'", type=click.DateTime(formats=["%Y-%m-%d", "%Y-%m-%d %H:%M", "%Y-%m-%d %H:%M:%S"]), default=None)
+def graph(input,output,workers,cache,clear_cache,render_cache,resolution,profile,watch,poll_interval,debounce,recursive,include,exclude,changed_since):
     """Generate graphs based in input data."""
     logging.basicConfig()
     logging.getLogger().setLevel(logging.INFO)
 
-    graph=GraphPerformance()
-    graph.generate_from_dir(input, output)
-    graph=GraphExecutor()
-    graph.generate_from_dir(input, output)
+    parse_cache = ParseCache(cache) if cache else None
+    if parse_cache and clear_cache:
+        parse_cache.clear()
+    graph_cache = RenderCache(render_cache) if render_cache else None
+    if graph_cache and clear_cache:
+        graph_cache.clear()
+
+    # parse each input only once for all graphs
+    graph=GraphPipeline([GraphPerformance(only_new = watch, render_cache = graph_cache),
+                         GraphExecutor(only_new = watch,
+                                       resolution = resolution if resolution == "auto" else float(resolution),
+                                       render_cache = graph_cache)])
+    stats = GraphStats() if profile else None
+    finder = InputFinder(recursive = recursive, include = list(include), exclude = list(exclude),
+                         changed_since = changed_since)
+    if watch:
+        watcher = DirWatcher(graph, input, output, poll_interval = poll_interval, debounce = debounce,
+                             workers = workers, cache = parse_cache, finder = finder)
+        try:
+            watcher.run(stats = stats)
+        except KeyboardInterrupt:
+            pass
+    else:
+        graph.generate_from_dir(input, output, workers = workers, cache = parse_cache, stats = stats,
+                                finder = finder)
+    if stats:
+        click.echo(stats)
 #    graph.generate_from_file("input/prf_nonprod_BDP_NoSQL.txt", output)
 
 
@@ -0,0 +1,191 @@
+from qgate_graph.file_marker import FileMarker as const
+from qgate_graph.perf_reader import PerfReader
+from qgate_graph.input_codec import InputCodec
+import os.path, os
+import hashlib
+import json
+import logging
+
+
+class BlockItem:
+    """One block (run of performance test) in input file, the block starts with header line"""
+
+    def __init__(self, offset, size, label, now, bulk, percentile = 1, hash = None):
+        """
+        :param offset:          Byte offset of header line
+        :param size:            Size of block in bytes (till the next header or end of file)
+        :param label:           Label of performance test
+        :param now:             Date of performance test
+        :param bulk:            Bulk (rows, columns) size
+        :param percentile:      Percentile (1 is without percentile)
+        :param hash:            Hash of block content
+        """
+        self.offset = offset
+        self.size = size
+        self.label = label
+        self.now = now
+        self.bulk = bulk
+        self.percentile = percentile
+        self.hash = hash
+
+    def to_dict(self) -> dict:
+        return {"offset": self.offset, "size": self.size, "label": self.label,
+                "now": self.now, "bulk": self.bulk, "percentile": self.percentile, "hash": self.hash}
+
+    @staticmethod
+    def from_dict(item: dict):
+        return BlockItem(item["offset"], item["size"], item["label"], item["now"], item["bulk"], item["percentile"],
+                         item.get("hash"))
+
+
+class BlockIndex:
+    """
+    Index of blocks (runs separated by '#' lines) in input file with byte offsets. The index
+    is stored next to the input file (or in cache directory) and it is rebuilt in case of
+    change of input file (size or modification time). The offsets of compressed input file
+    are in decompressed content (the reading of block decompresses the file till the block).
+
+        example::
+
+            from qgate_graph.block_index import BlockIndex
+            from qgate_graph.graph_performance import GraphPerformance
+
+            index = BlockIndex("input/perf_test.txt")
+            graph = GraphPerformance()
+            for block in index.blocks:
+                if block.label == "Germany perf":
+                    graph.generate_from_block("input/perf_test.txt", block, "output")
+    """
+
+    # extension of stored index
+    EXTENSION = ".qgidx"
+
+    def __init__(self, input_file, cache_dir = None, store = True):
+        """
+        Load valid index or build the new one
+
+        :param input_file:      Input file
+        :param cache_dir:       Directory for index (default is None, index is stored next to input file)
+        :param store:           Store index for next usage (default is True)
+        """
+        self._input_file = input_file
+        self._index_file = BlockIndex.index_file(input_file, cache_dir)
+        self.blocks = self._load()
+        if self.blocks is None:
+            self.blocks = BlockIndex.build(input_file)
+            if store:
+                self._save()
+
+    @staticmethod
+    def index_file(input_file, cache_dir = None) -> str:
+        """Return name of index file for input file"""
+        if cache_dir:
+            key = hashlib.sha1(os.path.abspath(input_file).encode("utf-8")).hexdigest()[:16]
+            return os.path.join(cache_dir, f"{os.path.basename(input_file)}-{key}{BlockIndex.EXTENSION}")
+        return input_file + BlockIndex.EXTENSION
+
+    @staticmethod
+    def build(input_file) -> list[BlockItem]:
+        """
+        Build index, scan input file and record byte offset (and content hash) of each header
+
+        :param input_file:      Input file
+        :return:                List of blocks
+        """
+        blocks = []
+        offset = 0
+        block_hash = None
+        hashing = False
+        with InputCodec.open(input_file, binary = True) as f:
+            for line in f:
+                if b'"' + const.PRF_HDR_TYPE.encode() + b'"' in line:
+                    text = line.decode("utf-8")
+                    if PerfReader.line_type(text) == const.PRF_HDR_TYPE:
+                        input_dict = PerfReader.load_json(text)
+                        if input_dict:
+                            if blocks:
+                                BlockIndex._close_block(blocks[-1], offset, block_hash)
+                            block_hash = hashlib.blake2b(digest_size = 16)
+                            hashing = True
+                            blocks.append(BlockItem(offset,
+                                                    0,
+                                                    input_dict[const.PRF_HDR_LABEL],
+                                                    input_dict[const.PRF_HDR_NOW],
+                                                    input_dict[const.PRF_HDR_BULK],
+                                                    input_dict.get(const.PRF_HDR_PERCENTILE, 1)))
+                if hashing:
+                    # hash the block content including the closing separator (without next separators)
+                    block_hash.update(line)
+                    hashing = line[:1] != b'#'
+                offset += len(line)
+        if blocks:
+            BlockIndex._close_block(blocks[-1], offset, block_hash)
+        return blocks
+
+    @staticmethod
+    def _close_block(block: BlockItem, offset, block_hash):
+        block.size = offset - block.offset
+        block.hash = block_hash.hexdigest()
+
+    def read(self, block: BlockItem) -> str:
+        """Read text of the block (seek directly to the block)"""
+        return BlockIndex.read_block(self._input_file, block)
+
+    @staticmethod
+    def read_block(input_file, block: BlockItem) -> str:
+        return BlockIndex.read_range(input_file, block.offset, block.size)
+
+    @staticmethod
+    def read_range(input_file, offset, size) -> str:
+        """Read text of part of input file based on byte offset and size"""
+        with InputCodec.open(input_file, binary = True) as f:
+            f.seek(offset)
+            return f.read(size).decode("utf-8")
+
+    @staticmethod
+    def line_numbers(input_file, offsets) -> list[int]:
+        """
+        Numbers of lines at byte offsets (one pass with count of new lines, without decoding)
+
+        :param input_file:      Input file
+        :param offsets:         Sorted byte offsets of line starts
+        :return:                List of line numbers (the first line is 1)
+        """
+        numbers = []
+        position = 0
+        lines = 1
+        with InputCodec.open(input_file, binary = True) as f:
+            for offset in offsets:
+                while position < offset:
+                    data = f.read(min(1024 * 1024, offset - position))
+                    if not data:
+                        break
+                    lines += data.count(b"\n")
+                    position += len(data)
+                numbers.append(lines)
+        return numbers
+
+    def _fingerprint(self) -> dict:
+        stat = os.stat(self._input_file)
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def _load(self):
+        if not os.path.exists(self._index_file):
+            return None
+        try:
+            with open(self._index_file, "r") as f:
+                index = json.load(f)
+            if index.get("fingerprint") != self._fingerprint():
+                return None
+            return [BlockItem.from_dict(item) for item in index["blocks"]]
+        except Exception as ex:
+            logging.info(f"  ... Invalid index '{self._index_file}', '{type(ex)}'")
+            return None
+
+    def _save(self):
+        index_dir = os.path.dirname(self._index_file)
+        if index_dir:
+            os.makedirs(index_dir, mode = 0o777, exist_ok = True)
+        with open(self._index_file, "w") as f:
+            json.dump({"fingerprint": self._fingerprint(),
+                       "blocks": [block.to_dict() for block in self.blocks]}, f)
@@ -0,0 +1,166 @@
+from qgate_graph.graph_base import GraphBase, _generate_task
+from qgate_graph.input_finder import InputFinder
+from qgate_graph.parse_cache import ParseCache
+from qgate_graph.graph_stats import GraphStats
+from concurrent.futures import ProcessPoolExecutor
+import os.path, os
+import logging
+import time
+
+
+class DirWatcher:
+    """
+    Watch input directory and generate outputs for new/changed input files. The changes are
+    detected by stat snapshots (size and mtime) of the directory, the file is generated after
+    the time without next change (debounce for burst of writes). The graph with 'only_new'
+    regenerates only outputs of new/changed blocks.
+
+        example::
+
+            from qgate_graph.graph_performance import GraphPerformance
+            from qgate_graph.dir_watcher import DirWatcher
+
+            watcher=DirWatcher(GraphPerformance(only_new = True), "input_adr", "output_adr", workers = 4)
+            watcher.run()
+    """
+
+    def __init__(self, graph: GraphBase, input_dir: str = "input", output_dir: str = "output", poll_interval = 2.0,
+                 debounce = 2.0, workers = 1, cache: ParseCache = None, suppress_error = True,
+                 finder: InputFinder = None):
+        """
+        :param graph:           Graph for generation of outputs (typically with only_new = True)
+        :param input_dir:       Input directory (default "input")
+        :param output_dir:      Output directory (default "output")
+        :param poll_interval:   Interval in seconds for snapshot of input directory (default is 2 seconds)
+        :param debounce:        Time in seconds without change of file before its generation (default is 2 seconds)
+        :param workers:         Amount of worker processes (default is 1, generation in the current process)
+        :param cache:           Cache of parsed input files (default is None, without cache)
+        :param suppress_error:  Ability to suppress error (default is True, the error does not stop watching)
+        :param finder:          Discovery of input files (default is None, all files in input directory
+                                without subdirectories), see InputFinder
+        """
+        self._graph = graph
+        self._input_dir = input_dir
+        self._output_dir = output_dir
+        self._poll_interval = poll_interval
+        self._debounce = debounce
+        self._workers = workers
+        self._cache = cache
+        self._suppress_error = suppress_error
+        self._finder = finder if finder else InputFinder()
+
+        # stat of files in time of their generation
+        self._generated = {}
+        # changed files, path -> (stat, time of the last change)
+        self._pending = {}
+
+    def snapshot(self) -> dict:
+        """
+        Snapshot of input directory
+
+        :return:        Dictionary of input files with (size, mtime) of each file
+        """
+        snapshot = {}
+        for input_file in self._finder.find(self._input_dir):
+            try:
+                stat = os.stat(input_file)
+            except FileNotFoundError:
+                continue
+            snapshot[input_file] = (stat.st_size, stat.st_mtime_ns)
+        return snapshot
+
+    def _ready_files(self) -> list[str]:
+        """Update pending files based on new snapshot and return files ready for generation"""
+        now = time.monotonic()
+        snapshot = self.snapshot()
+
+        for input_file in list(self._pending.keys()) + list(self._generated.keys()):
+            if input_file not in snapshot:
+                self._pending.pop(input_file, None)
+                self._generated.pop(input_file, None)
+
+        for input_file, stat in snapshot.items():
+            if self._generated.get(input_file) == stat:
+                self._pending.pop(input_file, None)
+                continue
+            pending = self._pending.get(input_file)
+            if pending is None or pending[0] != stat:
+                # the file without change for longer time (e.g. before start of watching) is ready immediately
+                age = time.time() - stat[1] / 1e9
+                self._pending[input_file] = (stat, now - age if age >= 0 else now)
+
+        return sorted([input_file for input_file, (stat, changed) in self._pending.items()
+                       if now - changed >= self._debounce])
+
+    def _generate(self, executor, input_files) -> list[str]:
+        """Generate outputs for input files (in process pool, if it is available)"""
+        output_list = []
+        stats = GraphStats.current()
+        if executor:
+            futures = [executor.submit(_generate_task, self._graph, input_file, None, self._output_dir,
+                                       self._suppress_error, self._cache, stats is not None)
+                       for input_file in input_files]
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as ex:
+                    if not self._suppress_error:
+                        raise
+                    logging.info(f"  ... Error in generation '{type(ex)}'")
+            for output, task_stats in results:
+                output_list.extend(output)
+                if task_stats:
+                    stats.merge(task_stats)
+        else:
+            for input_file in input_files:
+                try:
+                    output_list.extend(self._graph.generate_from_file(input_file, self._output_dir,
+                                                                      self._suppress_error, self._cache))
+                except Exception as ex:
+                    if not self._suppress_error:
+                        raise
+                    logging.info(f"  ... Error in generation of '{input_file}', '{type(ex)}'")
+        return output_list
+
+    def poll(self, executor: ProcessPoolExecutor = None) -> list[str]:
+        """
+        One check of input directory, the new/changed files (after debounce) are generated
+
+        :param executor:    Process pool for generation (default is None, generation in the current process)
+        :return:            List of generated files
+        """
+        input_files = self._ready_files()
+        if not input_files:
+            return []
+
+        logging.info(f"Changed files {len(input_files)} in '{self._input_dir}' ...")
+        output_list = self._generate(executor, input_files)
+        for input_file in input_files:
+            self._generated[input_file] = self._pending.pop(input_file)[0]
+        return output_list
+
+    def run(self, stop = None, stats: GraphStats = None):
+        """
+        Watch input directory until the stop
+
+        :param stop:        Event for end of watching such as threading.Event (default is None, without end)
+        :param stats:       Statistics of generation, it is filled during generation (default is None)
+        """
+        if stats:
+            with stats.activate():
+                return self.run(stop)
+
+        logging.info(f"Watching '{self._input_dir}' ...")
+        executor = ProcessPoolExecutor(max_workers = self._workers) if self._workers > 1 else None
+        try:
+            while stop is None or not stop.is_set():
+                self.poll(executor)
+                if stop is None:
+                    time.sleep(self._poll_interval)
+                else:
+                    stop.wait(self._poll_interval)
+        finally:
+            if executor:
+                executor.shutdown()
+        logging.info("Done")
@@ -0,0 +1,167 @@
+from qgate_graph.graph_base import GraphBase
+from qgate_graph.parse_cache import ParseCache
+from qgate_graph.input_finder import InputFinder
+from qgate_graph.input_codec import InputCodec
+from concurrent.futures import Executor
+from functools import partial
+import asyncio
+import weakref
+import logging
+
+
+def _render_file(graph: GraphBase, input_file, suppress_error) -> dict:
+    """Render outputs of input file into memory (task for executor)"""
+    logging.info(f"Rendering '{input_file}' ...")
+    with InputCodec.open(input_file) as f:
+        return graph.render_from_stream(f, None, suppress_error)
+
+
+class GraphAsync:
+    """
+    Asynchronous (asyncio) generation of outputs, the parsing and rendering are offloaded
+    to executor (threads or processes), so that the event loop is not blocked. The amount
+    of concurrently processed inputs is limited (backpressure).
+
+        example::
+
+            import asyncio
+            from qgate_graph.graph_performance import GraphPerformance
+            from qgate_graph.graph_async import GraphAsync
+
+            async def main():
+                graph = GraphAsync(GraphPerformance(), concurrency = 4)
+                async for output_file in graph.generate_from_dir("input_adr", "output_adr"):
+                    print(output_file)
+
+            asyncio.run(main())
+    """
+
+    def __init__(self, graph: GraphBase, executor: Executor = None, concurrency = 4):
+        """
+        :param graph:           Graph for generation of outputs (e.g. GraphPerformance, GraphPipeline)
+        :param executor:        Executor for parsing and rendering, ThreadPoolExecutor or ProcessPoolExecutor
+                                (default is None, the default executor of event loop)
+        :param concurrency:     Maximal amount of concurrently processed inputs (default is 4)
+        """
+        if concurrency < 1:
+            raise ValueError(f"Invalid concurrency '{concurrency}', expected positive number")
+        self._graph = graph
+        self._executor = executor
+        self._concurrency = concurrency
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def _limit(self) -> asyncio.Semaphore:
+        # the semaphore is bound to the running event loop (one semaphore for each loop)
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def _run(self, function, *args):
+        """Run function in executor with limit of concurrency"""
+        async with self._limit():
+            return await asyncio.get_running_loop().run_in_executor(self._executor, partial(function, *args))
+
+    async def generate_from_file(self, input_file: str, output_dir: str = "output", suppress_error = False,
+                                 cache: ParseCache = None) -> list[str]:
+        """
+        Generate outputs based on input file
+
+        :param input_file:      Input file (plain or compressed by gzip, bz2, xz, zstd)
+        :param output_dir:      Output directory (default "output")
+        :param suppress_error:  Ability to suppress error (default is False)
+        :param cache:           Cache of parsed input files (default is None, without cache)
+        :return:                List of generated files
+        """
+        return await self._run(self._graph.generate_from_file, input_file, output_dir, suppress_error, cache)
+
+    async def generate_from_text(self, text: str, output_dir: str = "output", suppress_error = False) -> list[str]:
+        """
+        Generate outputs based on input text
+
+        :param text:            Input text (content of file from qgate-perf)
+        :param output_dir:      Output directory (default "output")
+        :param suppress_error:  Ability to suppress error (default is False)
+        :return:                List of generated files
+        """
+        return await self._run(self._graph.generate_from_text, text, output_dir, suppress_error)
+
+    async def render_from_text(self, text: str, suppress_error = False) -> dict:
+        """
+        Render outputs based on input text into memory (without files)
+
+        :param text:            Input text (content of file from qgate-perf)
+        :param suppress_error:  Ability to suppress error (default is False)
+        :return:                Dictionary of outputs, file name -> bytes
+        """
+        return await self._run(self._graph.render_from_text, text, None, suppress_error)
+
+    async def render_from_file(self, input_file: str, suppress_error = False) -> dict:
+        """
+        Render outputs based on input file into memory (without files)
+
+        :param input_file:      Input file (plain or compressed by gzip, bz2, xz, zstd)
+        :param suppress_error:  Ability to suppress error (default is False)
+        :return:                Dictionary of outputs, file name -> bytes
+        """
+        return await self._run(_render_file, self._graph, input_file, suppress_error)
+
+    async def generate_from_dir(self, input_dir: str = "input", output_dir: str = "output", suppress_error = False,
+                                cache: ParseCache = None, finder: InputFinder = None):
+        """
+        Generate outputs based on input directory, the generated files are returned immediately
+        after processing of each input file (in order of completion)
+
+        :param input_dir:       Input directory (default "input")
+        :param output_dir:      Output directory (default "output")
+        :param suppress_error:  Ability to suppress error (default is False)
+        :param cache:           Cache of parsed input files (default is None, without cache)
+        :param finder:          Discovery of input files (default is None, all files in input directory
+                                without subdirectories), see InputFinder
+        :return:                Async iterator of generated files
+        """
+        async for outputs in self._from_dir(input_dir, finder, self.generate_from_file,
+                                            output_dir, suppress_error, cache):
+            for output_file in outputs:
+                yield output_file
+
+    async def render_from_dir(self, input_dir: str = "input", suppress_error = False, finder: InputFinder = None):
+        """
+        Render outputs based on input directory into memory, the outputs are returned immediately
+        after processing of each input file (in order of completion)
+
+        :param input_dir:       Input directory (default "input")
+        :param suppress_error:  Ability to suppress error (default is False)
+        :param finder:          Discovery of input files (default is None, all files in input directory
+                                without subdirectories), see InputFinder
+        :return:                Async iterator of pairs (file name, bytes)
+        """
+        async for outputs in self._from_dir(input_dir, finder, self.render_from_file, suppress_error):
+            for item in outputs.items():
+                yield item
+
+    async def _from_dir(self, input_dir, finder, process, *args):
+        """Process input files of directory with limit of pending tasks, results in order of completion"""
+        loop = asyncio.get_running_loop()
+        input_files = (finder if finder else InputFinder()).find(input_dir)
+        pending = set()
+        try:
+            while True:
+                # lazy discovery of the next file (without blocking of event loop)
+                input_file = await loop.run_in_executor(None, next, input_files, None)
+                if input_file is None:
+                    break
+                pending.add(asyncio.ensure_future(process(input_file, *args)))
+                if len(pending) >= self._concurrency:
+                    done, pending = await asyncio.wait(pending, return_when = asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield task.result()
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when = asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
@@ -1,8 +1,43 @@
 from qgate_graph import __version__ as version
-from matplotlib import get_backend, use
+from qgate_graph.file_marker import FileMarker as const
 from qgate_graph.percentile_item import PercentileItem
+from qgate_graph.perf_reader import PerfReader
+from qgate_graph.perf_record import HeaderRecord, CoreRecord, DetailRecord
+from qgate_graph.stream_state import StreamState
+from qgate_graph.block_index import BlockIndex, BlockItem
+from qgate_graph.parse_cache import ParseCache
+from qgate_graph.tail_reader import TailReader
+from qgate_graph.input_finder import InputFinder
+from qgate_graph.input_codec import InputCodec
+from qgate_graph.output_manifest import OutputManifest
+from qgate_graph.output_target import OutputTarget, MemoryTarget
+from qgate_graph.render_context import RenderContext
+from qgate_graph.render_cache import RenderCache
+from qgate_graph.graph_stats import GraphStats
 from prettytable import PrettyTable
-import json
+import os.path, os
+import datetime
+import logging
+from io import StringIO
+from concurrent.futures import ProcessPoolExecutor
+import threading
+
+
+def _generate_task(graph, input_file, chunk, output_dir, suppress_error, cache, profile = False) -> tuple:
+    """
+    Generate outputs for input file or chunk of input file (task for process pool), the chunk
+    is triple (byte offset, size, number of the first line) and it is read directly by the worker
+    """
+    stats = GraphStats() if profile else None
+    if chunk is None:
+        return graph.generate_from_file(input_file, output_dir, suppress_error, cache, stats), stats
+    offset, size, first_line = chunk
+    logging.info(f"Processing part of '{input_file}' (offset {offset}, line {first_line}) ...")
+    with StringIO(BlockIndex.read_range(input_file, offset, size)) as f:
+        if stats:
+            with stats.activate():
+                return graph._generate_from_stream(f, output_dir, suppress_error, first_line), stats
+        return graph._generate_from_stream(f, output_dir, suppress_error, first_line), stats
 
 
 class GraphBase:
@@ -20,26 +55,97 @@ class GraphBase:
             graph=grp.Graph()
             graph.generate_from_dir("input_adr", "output_adr")
     """
-    def __init__(self, dpi=100):
+    # minimal size of chunk (in bytes) for split of large input file, see generate_from_dir with workers
+    PARALLEL_CHUNK_SIZE = 1024 * 1024
+
+    # style of graphs is applied only once per process (it changes global rcParams of matplotlib)
+    STYLE = "bmh"   #"ggplot" "seaborn-v0_8-poster"
+    _style_lock = threading.Lock()
+    _style_applied = False
+
+    def __init__(self, dpi=100, render_cache: RenderCache = None):
         self.dpi=dpi
+        self.render_cache = render_cache
+        self._only_new = False
+
+    @staticmethod
+    def _apply_style():
+        from matplotlib import style, rcParams
+
+        with GraphBase._style_lock:
+            if not GraphBase._style_applied:
+                style.use(GraphBase.STYLE)
 
-        # use 'Agg' as non-interactive backend for matplotlib
-        if get_backend().lower()!="agg":
-            use('Agg', force = True)
+                # fixed salt for ids in SVG (the same graph produces the same bytes)
+                rcParams["svg.hashsalt"] = "qgate_graph"
+                GraphBase._style_applied = True
 
-    def _watermark(self, plt, ax):
+    def _new_figure(self, figsize):
+        """
+        Create figure with own 'Agg' canvas (without global state of pyplot, safe for threads),
+        the matplotlib is imported only for rendering of graphs (not for CSV/TXT outputs)
+        :param figsize:     Size of figure in inches
+        :return:            New figure
+        """
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        GraphBase._apply_style()
+        fig = Figure(figsize = figsize)
+        FigureCanvasAgg(fig)
+        return fig
+
+    def _watermark(self, ax):
         """
         Add watermark to the graph
-        :param plt:
         :param ax:
         """
         watermark=f'qgate_graph (v{version})'
-        plt.text(1.0, 0, watermark,
+        ax.text(1.0, 0, watermark,
                  horizontalalignment='right',
                  verticalalignment='bottom',
                  transform = ax.transAxes,
                  alpha=0.4, fontsize=8)
 
+    def _render_key(self, context: RenderContext, file_name, *parts) -> str:
+        """
+        Key of graph in render cache based on data and render parameters
+
+        :param context:     Settings for rendering
+        :param file_name:   Output file name (only the extension is part of key)
+        :param parts:       Data and parameters of graph (e.g. aggregated values, title)
+        :return:            Key or None (without render cache)
+        """
+        if context.render_cache is None:
+            return None
+        from matplotlib import __version__ as mpl_version
+
+        return RenderCache.key(type(self).__name__, mpl_version, GraphBase.STYLE, os.path.splitext(file_name)[1],
+                               context.dpi, *parts)
+
+    def _cached_graph(self, context: RenderContext, key, output_dir, file_name) -> str:
+        """
+        Write graph from render cache (without rendering)
+
+        :return:            Generated output or None (missing in cache)
+        """
+        if key is None:
+            return None
+        content = context.render_cache.get(key)
+        if content is None:
+            return None
+        GraphStats.increment("cached")
+        return context.target.write_bytes(content, output_dir, file_name)
+
+    def _write_graph(self, fig, context: RenderContext, key, output_dir, file_name) -> str:
+        """Write rendered figure to the target, the rendered bytes are stored in render cache (if any)"""
+        if key is None:
+            return context.target.write_figure(fig, output_dir, file_name, context.dpi)
+        with GraphStats.measure("save"):
+            content = OutputTarget.figure_bytes(fig, file_name, context.dpi)
+        context.render_cache.put(key, content)
+        return context.target.write_bytes(content, output_dir, file_name)
+
     def _unique_file_name(self, prefix, label, report_date, bulk, raw_format = False, extension = None):
         """
         Generate unique file name based on key information
@@ -88,10 +194,465 @@ class GraphBase:
 
     @staticmethod
     def load_json(line):
-        try:
-            return json.loads(line.strip())
-        except Exception as ex:
-            pass
+        return PerfReader.load_json(line)
+
+    def generate_from_dir(self, input_dir: str = "input", output_dir: str = "output", suppress_error = False,
+                          workers = 1, cache: ParseCache = None, stats: GraphStats = None,
+                          finder: InputFinder = None) -> list[str]:
+        """
+        Generate outputs based on input directory
+
+        example::
+
+            import qgate_graph.graph_performance as grp
+            from qgate_graph.input_finder import InputFinder
+
+            graph=grp.GraphPerformance()
+            graph.generate_from_dir("input_adr", "output_adr", workers = 8)
+
+            # all *.txt files in directory tree
+            graph.generate_from_dir("input_adr", "output_adr", finder = InputFinder(recursive = True,
+                                                                                      include = ["*.txt"]))
+
+        :param input_dir:       Input directory (default "input")
+        :param output_dir:      Output directory (default "output")
+        :param suppress_error:  Ability to suppress error (default is False)
+        :param workers:         Amount of worker processes (default is 1, without parallel processing).
+                                The files and the blocks of large files are spread across process pool.
+        :param cache:           Cache of parsed input files (default is None, without cache). The cached
+                                files (and files with manifest for only_new) are not split to blocks.
+        :param stats:           Statistics of generation, it is filled during generation (default is None)
+        :param finder:          Discovery of input files (default is None, all files in input directory
+                                without subdirectories), see InputFinder
+        :return:                List of generated files (in the same order as without parallel processing)
+        """
+        if stats:
+            with stats.activate():
+                return self.generate_from_dir(input_dir, output_dir, suppress_error, workers, cache, None, finder)
+
+        output_list=[]
+        # lazy discovery, the processing starts before the end of directory walk
+        input_files = (finder if finder else InputFinder()).find(input_dir)
+        if workers > 1:
+            stats = GraphStats.current()
+            with ProcessPoolExecutor(max_workers = workers) as executor:
+                futures = [executor.submit(_generate_task, self, input_file, chunk, output_dir, suppress_error,
+                                           cache, stats is not None)
+                           for input_file in input_files
+                           for chunk in ([None] if cache or self._use_manifest()
+                                         else self._number_lines(input_file, self._split_offsets(input_file)))]
+                for future in futures:
+                    output, task_stats = future.result()
+                    output_list.extend(output)
+                    if task_stats:
+                        stats.merge(task_stats)
+        else:
+            for input_file in input_files:
+                for file in self.generate_from_file(input_file, output_dir, suppress_error, cache):
+                    output_list.append(file)
+        logging.info("Done")
+        return output_list
+
+    def _split_offsets(self, input_file, parts = None) -> list:
+        """
+        Split large input file to chunks on header boundaries (each chunk can be processed
+        independently). The file is not read as a whole, the reading seeks to expected end
+        of chunk and scans lines till the next header.
+
+        :param input_file:      Input file
+        :param parts:           Expected amount of chunks (default is None, chunks with size
+                                PARALLEL_CHUNK_SIZE)
+        :return:                List of chunks (byte offset, size), [None] for processing of the whole file
+        """
+        file_size = os.path.getsize(input_file)
+        # the compressed file is decompressed sequentially, it is processed as a whole
+        if file_size <= self.PARALLEL_CHUNK_SIZE or InputCodec.detect(input_file):
+            return [None]
+
+        step = max(self.PARALLEL_CHUNK_SIZE, file_size // parts if parts else 0)
+        header = b'"' + const.PRF_HDR_TYPE.encode() + b'"'
+        offsets = [0]
+        with open(input_file, "rb") as f:
+            position = step
+            while position < file_size:
+                # start of the next line (after the position - 1)
+                f.seek(position - 1)
+                f.readline()
+                offset = f.tell()
+                for line in iter(f.readline, b""):
+                    if header in line and PerfReader.line_type(line.decode("utf-8")) == const.PRF_HDR_TYPE:
+                        offsets.append(offset)
+                        break
+                    offset += len(line)
+                else:
+                    break
+                position = offsets[-1] + step
+
+        offsets.append(file_size)
+        return [(offsets[i], offsets[i + 1] - offsets[i]) for i in range(len(offsets) - 1)]
+
+    @staticmethod
+    def _number_lines(input_file, chunks) -> list:
+        """Add number of the first line to chunks (line numbers of invalid lines are relative to input file)"""
+        if chunks == [None]:
+            return chunks
+        first_lines = BlockIndex.line_numbers(input_file, [offset for offset, size in chunks])
+        return [(offset, size, first_line) for (offset, size), first_line in zip(chunks, first_lines)]
+
+    def generate_from_text(self, text: str, output_dir: str = "output", suppress_error = False,
+                           stats: GraphStats = None) -> list[str]:
+        """
+        Generate outputs based on input text
+
+        :param text:            Input text (content of file from qgate-perf)
+        :param output_dir:      Output directory (default "output")
+        :param suppress_error:  Ability to suppress error (default is False)
+        :param stats:           Statistics of generation, it is filled during generation (default is None)
+        :return:                List of generated files
+        """
+        if stats:
+            with stats.activate():
+                return self.generate_from_text(text, output_dir, suppress_error)
+
+        logging.info(f"Processing 'text' ...")
+        with StringIO(text) as f:
+            output_list=self._generate_from_stream(f, output_dir, suppress_error)
+        return output_list
+
+    def render_from_text(self, text: str, outputs: dict = None, suppress_error = False,
+                         stats: GraphStats = None) -> dict:
+        """
+        Render outputs based on input text into memory (without files)
+
+        example::
+
+            import qgate_graph.graph_performance as grp
+
+            graph=grp.GraphPerformance(image_format = "svg")
+            for name, content in graph.render_from_text(text).items():
+                upload(name, content)
+
+        :param text:            Input text (content of file from qgate-perf)
+        :param outputs:         Dictionary for outputs (default is None, new dictionary)
+        :param suppress_error:  Ability to suppress error (default is False)
+        :param stats:           Statistics of generation, it is filled during generation (default is None)
+        :return:                Dictionary of outputs, file name -> bytes (the same names as for files)
+        """
+        logging.info(f"Rendering 'text' ...")
+        with StringIO(text) as f:
+            return self.render_from_stream(f, outputs, suppress_error, stats)
+
+    def render_from_stream(self, f, outputs: dict = None, suppress_error = False, stats: GraphStats = None) -> dict:
+        """
+        Render outputs based on input stream into memory (without files)
+
+        :param f:               Input stream (text)
+        :param outputs:         Dictionary for outputs (default is None, new dictionary)
+        :param suppress_error:  Ability to suppress error (default is False)
+        :param stats:           Statistics of generation, it is filled during generation (default is None)
+        :return:                Dictionary of outputs, file name -> bytes (the same names as for files)
+        """
+        if stats:
+            with stats.activate():
+                return self.render_from_stream(f, outputs, suppress_error)
+
+        target = MemoryTarget(outputs)
+        self._generate_from_events(PerfReader(f, record_types = self._record_types()), "", suppress_error,
+                                   target = target)
+        return target.outputs
+
+    def generate_from_file(self, input_file: str, output_dir: str = "output", suppress_error = False,
+                           cache: ParseCache = None, stats: GraphStats = None, follow = False, poll_interval = 1.0,
+                           idle_timeout = None, offset = 0, workers = 1) -> list[str]:
+        """
+        Generate outputs based on input file
+
+        example::
+
+            import qgate_graph.graph_performance as grp
+
+            # generate graph for each finished block of live output from qgate-perf
+            graph=grp.GraphPerformance(only_new = True)
+            graph.generate_from_file("input/perf_test.txt", "output_adr", follow = True, idle_timeout = 3600)
+
+            # split huge file to chunks (on block boundaries) for 8 worker processes
+            graph=grp.GraphPerformance()
+            graph.generate_from_file("input/perf_test.txt", "output_adr", workers = 8)
+
+        :param input_file:      Input file (plain or compressed by gzip, bz2, xz, zstd)
+        :param output_dir:      Output directory (default "output")
+        :param suppress_error:  Ability to suppress error (default is False)
+        :param cache:           Cache of parsed input files (default is None, without cache)
+        :param stats:           Statistics of generation, it is filled during generation (default is None)
+        :param follow:          Follow the growing file (default is False), the outputs of each block are generated
+                                immediately after its closing separator. The cache and manifest are not used.
+        :param poll_interval:   Interval in seconds for check of new data in follow mode (default is 1 second)
+        :param idle_timeout:    End of follow mode after the time in seconds without new data (default is None,
+                                without end)
+        :param offset:          Byte offset for start of follow mode (default is 0), it has to be on start of block
+        :param workers:         Amount of worker processes (default is 1, without parallel processing). The large
+                                file is split on block boundaries and the chunks are processed in process pool
+                                (without split for cache, only_new, compressed file and follow mode).
+        :return:                List of generated files (in the same order as without parallel processing)
+        """
+        if stats:
+            with stats.activate():
+                return self.generate_from_file(input_file, output_dir, suppress_error, cache, None, follow,
+                                               poll_interval, idle_timeout, offset, workers)
+
+        GraphStats.increment("files")
+        if follow:
+            return self._generate_from_tail(input_file, output_dir, suppress_error, poll_interval, idle_timeout,
+                                            offset)
+
+        logging.info(f"Processing '{input_file}' ...")
+        manifest = None
+        if self._use_manifest():
+            manifest = OutputManifest(output_dir, self._output_key(), input_file)
+            if manifest.unchanged():
+                logging.info(f"  ... without change")
+                GraphStats.increment("unchanged")
+                return []
+
+        if workers > 1 and not cache and not manifest:
+            # more chunks than workers for balance of load
+            chunks = self._split_offsets(input_file, workers * 4)
+            if len(chunks) > 1:
+                return self._generate_from_chunks(input_file, self._number_lines(input_file, chunks), output_dir,
+                                                  suppress_error, workers)
+
+        if cache:
+            record_types = self._record_types()
+            with GraphStats.measure("read"):
+                events = cache.get(input_file, record_types)
+            if events is None:
+                with InputCodec.open(input_file) as f:
+                    events = list(PerfReader(f, record_types = record_types))
+                with GraphStats.measure("read"):
+                    cache.put(input_file, events, record_types)
+            else:
+                logging.info(f"  ... using cache")
+            output_list=self._generate_from_events(events, output_dir, suppress_error, manifest)
+        else:
+            with InputCodec.open(input_file) as f:
+                output_list=self._generate_from_events(PerfReader(f, record_types = self._record_types()),
+                                                       output_dir, suppress_error, manifest)
+
+        if manifest:
+            manifest.save()
+        return output_list
+
+    def _generate_from_chunks(self, input_file, chunks, output_dir, suppress_error, workers) -> list[str]:
+        """Generate outputs based on chunks of input file in process pool (the outputs in original order)"""
+        logging.info(f"  ... {len(chunks)} parts in {workers} workers")
+        output_list = []
+        stats = GraphStats.current()
+        with ProcessPoolExecutor(max_workers = workers) as executor:
+            futures = [executor.submit(_generate_task, self, input_file, chunk, output_dir, suppress_error, None,
+                                       stats is not None)
+                       for chunk in chunks]
+            for future in futures:
+                output, task_stats = future.result()
+                output_list.extend(output)
+                if task_stats:
+                    stats.merge(task_stats)
+        return output_list
+
+    def _generate_from_tail(self, input_file, output_dir, suppress_error, poll_interval, idle_timeout,
+                            offset) -> list[str]:
+        """Generate outputs based on growing input file (follow mode)"""
+        if InputCodec.detect(input_file):
+            raise ValueError(f"Follow mode is not supported for compressed file '{input_file}'")
+        logging.info(f"Following '{input_file}' from offset {offset} ...")
+        with TailReader(input_file, offset, poll_interval, idle_timeout) as f:
+            output_list = self._generate_from_events(PerfReader(f, record_types = self._record_types()),
+                                                     output_dir, suppress_error)
+        logging.info(f"  ... end of following '{input_file}', the last separator at offset {f.separator_offset}")
+        return output_list
+
+    def generate_from_block(self, input_file: str, block: BlockItem, output_dir: str = "output",
+                            suppress_error = False) -> list[str]:
+        """
+        Generate outputs only for one block (run) of input file, the block is read directly
+        based on its byte offset (see BlockIndex)
+
+        :param input_file:      Input file
+        :param block:           Block from BlockIndex
+        :param output_dir:      Output directory (default "output")
+        :param suppress_error:  Ability to suppress error (default is False)
+        :return:                List of generated files
+        """
+        logging.info(f"Processing '{input_file}' (block '{block.label}', {block.now}) ...")
+        with StringIO(BlockIndex.read_block(input_file, block)) as f:
+            output_list=self._generate_from_stream(f, output_dir, suppress_error)
+        return output_list
+
+    def _generate_from_stream(self, f, output_dir: str = "output", suppress_error = False, first_line = 1) -> list[str]:
+        """
+        Generate outputs based on input stream (the stream is parsed only once)
+
+        :param f:               Input stream
+        :param output_dir:      Output directory (default "output")
+        :param suppress_error:  Ability to suppress error (default is False)
+        :param first_line:      Number of the first line in stream, e.g. for part of input file (default is 1)
+        :return:                List of generated files
+        """
+        return self._generate_from_events(PerfReader(f, record_types = self._record_types(), first_line = first_line),
+                                          output_dir, suppress_error)
+
+    def _generate_from_events(self, events, output_dir: str = "output", suppress_error = False,
+                              manifest: OutputManifest = None, target: OutputTarget = None) -> list[str]:
+        """
+        Generate outputs based on events (from PerfReader or from cache)
+
+        :param events:          Iterable of events (event type, record)
+        :param output_dir:      Output directory (default "output")
+        :param suppress_error:  Ability to suppress error (default is False)
+        :param manifest:        Manifest of outputs for only_new (default is None)
+        :param target:          Target of outputs (default is None, files in output directory)
+        :return:                List of generated files
+        """
+        state = self._open_stream(output_dir, suppress_error, manifest, target)
+        stats = GraphStats.current()
+        if stats:
+            for event_type, record in events:
+                if event_type == const.PRF_HDR_TYPE:
+                    stats.count("blocks")
+                with stats.stage("aggregate"):
+                    self._process(state, event_type, record)
+        else:
+            for event_type, record in events:
+                self._process(state, event_type, record)
+        return self._close_stream(state)
+
+    def _render_context(self, target: OutputTarget = None) -> RenderContext:
+        """Create settings for rendering of one input stream"""
+        return RenderContext(target, dpi = self.dpi, render_cache = self.render_cache)
+
+    def _new_state(self, output_dir, suppress_error, manifest = None, context = None) -> StreamState:
+        """Create state for processing of one input stream"""
+        return StreamState(output_dir, suppress_error, manifest, context)
+
+    def _open_stream(self, output_dir, suppress_error, manifest = None, target = None):
+        """Start processing of input stream and return its state"""
+        state = self._new_state(output_dir, suppress_error, manifest, self._render_context(target))
+
+        # create output dir, if not exist
+        state.context.target.makedirs(state.output_dir_target)
+        return state
+
+    def _close_stream(self, state) -> list[str]:
+        """Finish processing of input stream and return list of generated files"""
+        return state.output_list
+
+    def _process(self, state, event_type, record):
+        """Process one event from input stream"""
+        if event_type == PerfReader.SEPARATOR:
+            self._on_separator(state)
+        elif event_type == const.PRF_HDR_TYPE:
+            self._on_header(state, record)
+        elif event_type == const.PRF_CORE_TYPE:
+            self._on_core(state, record)
+        elif event_type == const.PRF_DETAIL_TYPE:
+            self._on_detail(state, record)
+
+    def _on_separator(self, state):
+        pass
+
+    def _on_header(self, state, record: HeaderRecord):
+        """Process common header items (date, label, bulk, duration and response unit)"""
+        state.block_number += 1
+        state.start_date = record.now
+        state.report_date = datetime.datetime.fromisoformat(state.start_date).strftime("%Y-%m-%d %H-%M-%S")
+        state.label = record.label
+        state.bulk = record.bulk
+        state.duration = record.duration
+        if state.duration >= 0:
+            # update output dir based on duration (e.g. 1 min, 5 sec, etc.) and date
+            state.output_dir_target = os.path.join(state.output_dir,
+                                                   self._readable_duration(state.duration),
+                                                   datetime.datetime.fromisoformat(state.start_date).strftime("%Y-%m-%d"))
+            # create subdirectory based on duration
+            state.context.target.makedirs(state.output_dir_target)
+
+        # setup response unit (only for this stream)
+        state.context.response_time_unit = record.response_unit
+
+        state.title = (f"'{state.label}', {state.report_date}, bulk {state.bulk[0]}/{state.bulk[1]}, "
+                       f"duration '{self._readable_duration(state.duration)}'")
+
+    def _on_core(self, state, record: CoreRecord):
+        pass
+
+    def _on_detail(self, state, record: DetailRecord):
+        pass
+
+    def _add_output(self, state, file_name, create_output, *args):
+        """
+        Create output and add it to the list of generated files
+
+        :param state:           State of processed stream
+        :param file_name:       Name of output (for error message)
+        :param create_output:   Function for output creation (return name of generated file)
+        :param args:            Arguments for function
+        """
+        if state.suppress_error:
+            try:
+                with GraphStats.measure("render"):
+                    output_file = create_output(*args)
+            except Exception as ex:
+                self._output_error(state, file_name, ex)
+                return
+        else:
+            with GraphStats.measure("render"):
+                output_file = create_output(*args)
+        GraphStats.increment("outputs")
+        state.output_list.append(output_file)
+        if state.manifest:
+            state.manifest.add_output(state.block_number, output_file)
+
+    def _output_error(self, state, file_name, ex):
+        """Report suppressed error of output (the output is not generated)"""
+        logging.info(f"  ... Error in '{file_name}', '{type(ex)}'")
+        GraphStats.increment("errors")
+        if state.manifest:
+            state.manifest.add_error(state.block_number)
+
+    def _record_types(self) -> set:
+        """Types of records used by the graph (the other lines are not decoded)"""
+        return {const.PRF_HDR_TYPE, const.PRF_CORE_TYPE, const.PRF_DETAIL_TYPE}
+
+    def _use_manifest(self) -> bool:
+        """Use manifest of outputs (for only_new)"""
+        return self._only_new
+
+    def _output_key(self) -> str:
+        """Key of outputs for manifest (the graph type and its setting)"""
+        return type(self).__name__
+
+    def _skip_output(self, state, file_name) -> bool:
+        """
+        Check, if it is necessity to generate output (in case of only_new)
+
+        :param state:           State of processed stream
+        :param file_name:       Name of output
+        :return:                True - skip the output, False - generate the output
+        """
+        if not self._only_new:
+            return False
+        if state.manifest and state.manifest.known():
+            # skip all outputs of unchanged block (based on manifest)
+            skip = not state.manifest.block_changed(state.block_number)
+        else:
+            # in case of focusing on only_new and file exists, jump it
+            output_file = os.path.join(state.output_dir_target, file_name)
+            skip = state.context.target.exists(state.output_dir_target, file_name)
+            if skip and state.manifest:
+                # adopt the existing output (without previous manifest)
+                state.manifest.add_output(state.block_number, output_file)
+        if skip:
+            GraphStats.increment("skipped")
+        return skip
 
     def _create_table(self, percentiles: {PercentileItem}) -> PrettyTable:
         summary_table = PrettyTable()
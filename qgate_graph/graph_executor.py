@@ -1,12 +1,10 @@
-from matplotlib import pyplot as plt
-from qgate_graph.file_marker import FileMarker as const
 from qgate_graph.graph_base import GraphBase
 from qgate_graph.circle_queue import ColorQueue, MarkerQueue
-from qgate_graph.graph_setup import GraphSetup
-import os.path, os
+from qgate_graph.render_context import RenderContext
+from qgate_graph.render_cache import RenderCache
+from qgate_graph.stream_state import ExecutorState
+from qgate_graph.perf_record import HeaderRecord, CoreRecord, DetailRecord
 import datetime
-import logging
-from io import StringIO
 
 
 class GraphExecutor(GraphBase):
@@ -24,245 +22,193 @@ class GraphExecutor(GraphBase):
             graph=grp.GraphExecutor()
             graph.generate_from_dir("input_adr", "output_adr")
     """
-    def __init__(self, dpi = 100, only_new = False):
+    # possible time resolutions (in seconds) for resolution 'auto'
+    AUTO_RESOLUTIONS = [1, 0.1, 0.01, 0.001]
+    # minimal amount of time buckets for resolution 'auto'
+    AUTO_MIN_POINTS = 50
+
+    def __init__(self, dpi = 100, only_new = False, resolution = 1, image_format = "png",
+                 render_cache: RenderCache = None):
         """
         Generate graphs about executors in time in graphical format (*.png files)
 
         :param dpi:             quality of output file in DPI (default is 100 DPI)
         :param only_new:        generate only new/not existing outputs (default is False, rewrite/regenerate all)
+        :param resolution:      time resolution in seconds e.g. 0.001, 0.01, 0.1, 1 (default is 1 second)
+                                or 'auto' (resolution based on duration of run)
+        :param image_format:    format of graphs "png" or "svg" (default is "png")
+        :param render_cache:    cache of rendered graphs (default is None, without cache), see RenderCache
         """
 
-        super().__init__(dpi)
+        super().__init__(dpi, render_cache)
+        if resolution != "auto" and (not isinstance(resolution, (int, float)) or resolution <= 0):
+            raise ValueError(f"Invalid resolution '{resolution}', expected positive number of seconds or 'auto'")
         self._only_new = only_new
-        self._output_file_format = ("EXE", ".png")
+        self._resolution = resolution
+        self._output_file_format = ("EXE", f".{image_format}")
 
-    def generate_from_dir(self, input_dir: str = "input", output_dir: str = "output") -> list[str]:
+    @staticmethod
+    def _parse_times(values):
         """
-        Generate graphs about executors in time based on input directory
+        Parse timestamps (ISO format) in bulk
 
-        example::
+        :param values:          List of timestamps in ISO format
+        :return:                Array of datetime64 (in UTC for timestamps with time zone)
+        """
+        import numpy as np
+
+        if not GraphExecutor._with_time_zone(values):
+            try:
+                return np.array(values, dtype = "datetime64[us]")
+            except ValueError:
+                pass
+
+        # slow path, e.g. timestamps with time zone
+        times = []
+        for value in values:
+            time = datetime.datetime.fromisoformat(value)
+            if time.tzinfo:
+                time = time.astimezone(datetime.timezone.utc).replace(tzinfo = None)
+            times.append(time)
+        return np.array(times, dtype = "datetime64[us]")
+
+    @staticmethod
+    def _with_time_zone(values) -> bool:
+        """
+        Cheap check of time zone in timestamps (one pass over joined timestamps), 'Z' at the end,
+        '+' offset or '-' offset (more than two '-' of date part)
 
-            import qgate_graph.graph as grp
+        :param values:          List of timestamps in ISO format
+        :return:                True, if some timestamp can be with time zone (parsed in slow path)
+        """
+        joined = "\n".join(values) + "\n"
+        return "Z\n" in joined or "+" in joined or joined.count("-") != 2 * len(values)
 
-            graph=grp.Graph()
-            graph.generate_from_dir("input_adr", "output_adr")
+    def _auto_resolution(self, times):
+        """Choose resolution (in seconds) based on duration of run"""
+        import numpy as np
+
+        duration = (times.max() - times.min()) / np.timedelta64(1, "s")
+        for resolution in GraphExecutor.AUTO_RESOLUTIONS:
+            if duration / resolution >= GraphExecutor.AUTO_MIN_POINTS:
+                return resolution
+        return GraphExecutor.AUTO_RESOLUTIONS[-1]
 
-        :param input_dir:       Input directory (default "input")
-        :param output_dir:      Output directory (default "output")
-        :return:                List of generated files
+    def _bucket_times(self, times):
         """
-        output_list=[]
-        for input_file in os.listdir(input_dir):
-            for file in self.generate_from_file(os.path.join(input_dir, input_file), output_dir):
-                output_list.append(file)
-        logging.info("Done")
-        return output_list
-
-    def _order(self, date_arr: list):
-        date_arr.sort(key=lambda x: x[0])
-
-    def _add_counter2(self, itm, new_array, new_array_count):
-
-        if itm:
-            for j in range(len(itm)):
-                new_item=datetime.datetime.fromisoformat(itm[j]).replace(microsecond=0)
-
-                found = False
-                for i in new_array:
-                    if i[0] == new_item:
-                        if j==1:
-                            i[1]=i[1]+1
-                        elif j==2:
-                            i[1] = i[1] - 1
-                        found = True
-                        break
-                if found == False:
-                    if j==0:
-                        new_array.append([new_item, 0])
-                    elif j==1:
-                        new_array.append([new_item, 1])
-                    elif j==2:
-                        new_array.append([new_item, -1])
-
-    def generate_from_text(self, text: str, output_dir: str = "output", suppress_error = False) -> list[str]:
-
-        logging.info(f"Processing 'text' ...")
-        with StringIO(text) as f:
-            output_list=self._generate_from_stream(f,output_dir, suppress_error)
-        return output_list
-
-    def generate_from_file(self, input_file: str, output_dir: str = "output", suppress_error = False) -> list[str]:
+        Truncate times to the resolution
+
+        :param times:           Times (datetime64 in microseconds)
+        :return:                Truncated times
         """
-        Generate graphs about executors based on input file
+        import numpy as np
+
+        resolution = self._auto_resolution(times) if self._resolution == "auto" else self._resolution
+        if resolution == 1:
+            return times.astype("datetime64[s]")
+        step = max(int(round(resolution * 1000000)), 1)
+        return ((times.astype(np.int64) // step) * step).astype("datetime64[us]")
 
-        :param input_file:      Input file
-        :param output_dir:      Output directory (default "output")
-        :param suppress_error:  Ability to suppress error (default is False)
-        :return:                List of generated files
+    def _executors_in_time(self, executors: dict):
         """
+        Calculate amount of executors in time (sweep-line, each executor has +1 for start
+        and -1 for end, the init time adds only point without change)
 
-        logging.info(f"Processing '{input_file}' ...")
-        with open(input_file, "r") as f:
-            output_list=self._generate_from_stream(f,output_dir, suppress_error)
-        return output_list
-
-    def _generate_from_stream(self, f, output_dir: str = "output", suppress_error = False) -> list[str]:
-
-        file_name = None
-        executors = {}
-        executor = []
-        input_dict = {}
-        end_date = None
-        start_date = None
-        output_list = []
-
-        #logging.info(f"Processing '{input_file}' ...")
-
-        # copy dir because the path can be modificated
-        output_dir_target = output_dir
-
-        # create output dir if not exist
-        if not os.path.exists(output_dir_target):
-            os.makedirs(output_dir_target, mode=0o777)
-
-#        with open(input_file, "r") as f:
-        while True:
-            line = f.readline()
-            if not line:
-                break
-            if line[0] == '#':
-                file_name = None
-                executors.clear()
-                executor.clear()
-                continue
-            input_dict = GraphBase.load_json(line)
-            if not input_dict:
-                continue
-            if input_dict[const.PRF_TYPE] == const.PRF_HDR_TYPE:
-                # header
-                start_date=input_dict[const.PRF_HDR_NOW]
-                report_date = datetime.datetime.fromisoformat(start_date).strftime(
-                    "%Y-%m-%d %H-%M-%S")
-                label = input_dict[const.PRF_HDR_LABEL]
-                bulk = input_dict[const.PRF_HDR_BULK]
-                duration = int(input_dict.get(const.PRF_HDR_DURATION, -1))
-                if duration >= 0:
-                    # update output dir based on duration (e.g. 1 min, 5 sec, etc.) and date
-                    output_dir_target = os.path.join(output_dir,
-                                                     self._readable_duration(duration),
-                                                     datetime.datetime.fromisoformat(start_date).strftime("%Y-%m-%d"))
-                    # create subdirectory based on duration
-                    if not os.path.exists(output_dir_target):
-                        os.makedirs(output_dir_target, mode=0o777)
-
-                # setup response unit
-                GraphSetup().response_time_unit=input_dict.get(const.PRF_HDR_RESPONSE_UNIT, "sec")
-
-                bulk_name=f"{bulk[0]}/{bulk[1]}"
-                file_name = self._unique_file_name(self._output_file_format[0],
-                                                   label,
-                                                   report_date,
-                                                   bulk,
-                                                   False,
-                                                    None)
-                title = f"'{label}', {report_date}, bulk {bulk[0]}/{bulk[1]}, duration '{self._readable_duration(duration)}'"
-
-            elif input_dict[const.PRF_TYPE] == const.PRF_CORE_TYPE:
-                # core
-                if executor:
-                    plan=f"{input_dict[const.PRF_CORE_PLAN_EXECUTOR][0]:03d}x{input_dict[const.PRF_CORE_PLAN_EXECUTOR][1]:02d}"
-                    executors[plan]=executor
-
-                    if input_dict.get(const.PRF_CORE_TIME_END):
-                        end_date=input_dict[const.PRF_CORE_TIME_END]
-
-                    new_file_name = f"{file_name}-plan-{plan}{self._output_file_format[1]}"
-
-                    # it is necessity to generate file?
-                    if self._only_new:
-                        # in case of focusing on only_new and file exists, jump it
-                        if os.path.exists(os.path.join(output_dir_target, new_file_name)):
-                            new_file_name=None
-
-                    if new_file_name:
-                        if suppress_error:
-                            try:
-                                output_list.append(
-                                    self._show_graph(start_date, executors, end_date, title, new_file_name, output_dir_target))
-                            except Exception as ex:
-                                logging.info(f"  ... Error in '{new_file_name}', '{type(ex)}'")
-                        else:
-                            output_list.append(
-                                self._show_graph(start_date, executors, end_date, title, new_file_name, output_dir_target))
-
-                    executors.clear()
-                    executor.clear()
-            elif input_dict[const.PRF_TYPE] == const.PRF_DETAIL_TYPE:
-                # detail
-                if not input_dict.get(const.PRF_DETAIL_ERR):
-                    executor.append([
-                        input_dict[const.PRF_DETAIL_TIME_INIT],
-                        input_dict[const.PRF_DETAIL_TIME_START],
-                        input_dict[const.PRF_DETAIL_TIME_END]])
-        return output_list
-
-    def _show_graph(self, start_date, executors, end_date, title, file_name, output_dir) -> str :
-        plt.style.use("bmh") #"ggplot" "seaborn-v0_8-poster"
-        ax=plt.figure(figsize = (15, 6))
-        plt.grid()
+        :param executors:       Executors (init, start and end time) for each plan
+        :return:                Times (datetime64 truncated to the resolution) and amount of executors in these times
+        """
+        import numpy as np
+
+        items = [itm for key in executors.keys() for itm in executors[key] if itm]
+        if not items:
+            return np.array([], dtype = "datetime64[s]"), np.array([], dtype = np.int64)
+
+        # order of times is init, start, end for each executor
+        times = self._bucket_times(self._parse_times([time for itm in items for time in itm]))
+        deltas = np.tile(np.array([0, 1, -1], dtype = np.int64), len(items))
+
+        # group values by time and recalc (+/- values)
+        unique_times, inverse = np.unique(times, return_inverse = True)
+        counts = np.bincount(inverse.ravel(), weights = deltas, minlength = len(unique_times))
+        return unique_times, np.cumsum(counts).astype(np.int64)
+
+    def _new_state(self, output_dir, suppress_error, manifest = None, context = None) -> ExecutorState:
+        return ExecutorState(output_dir, suppress_error, manifest, context)
+
+    def _output_key(self) -> str:
+        return "".join(self._output_file_format) + (f"-{self._resolution}" if self._resolution != 1 else "")
+
+    def _on_separator(self, state: ExecutorState):
+        state.file_name = None
+        state.executors.clear()
+        state.executor.clear()
+
+    def _on_header(self, state: ExecutorState, record: HeaderRecord):
+        super()._on_header(state, record)
+
+        state.file_name = self._unique_file_name(self._output_file_format[0],
+                                                 state.label,
+                                                 state.report_date,
+                                                 state.bulk,
+                                                 False,
+                                                 None)
+
+    def _on_core(self, state: ExecutorState, record: CoreRecord):
+        if state.executor:
+            plan=f"{record.plan_executors_detail[0]:03d}x{record.plan_executors_detail[1]:02d}"
+            state.executors[plan]=state.executor
+
+            if record.end:
+                state.end_date=record.end
+
+            new_file_name = f"{state.file_name}-plan-{plan}{self._output_file_format[1]}"
+
+            # it is necessity to generate file?
+            if self._skip_output(state, new_file_name):
+                new_file_name=None
+
+            if new_file_name:
+                self._add_output(state, new_file_name, self._show_graph,
+                                 state.start_date, state.executors, state.end_date, state.title,
+                                 new_file_name, state.output_dir_target, state.context)
+
+            state.executors.clear()
+            state.executor.clear()
+
+    def _on_detail(self, state: ExecutorState, record: DetailRecord):
+        if not record.err:
+            state.executor.append([record.init, record.start, record.end])
+
+    def _show_graph(self, start_date, executors, end_date, title, file_name, output_dir,
+                    context: RenderContext = None) -> str :
+        if context is None:
+            context = self._render_context()
+        cache_key = self._render_key(context, file_name, executors, title, self._resolution)
+        output = self._cached_graph(context, cache_key, output_dir, file_name)
+        if output:
+            return output
+
+        fig = self._new_figure(figsize = (15, 6))
         color = ColorQueue(init = 6)
         marker = MarkerQueue()
 
         # view total performance
-        ax=plt.subplot(1,1,1)
-        self._watermark(plt,ax)
+        ax=fig.add_subplot(1,1,1)
+        ax.grid()
+        self._watermark(ax)
 
-        plt.suptitle("Executors in time",weight='bold', fontsize=18, ha="center", va="top")
-        plt.title(title, fontsize=14,ha="center", va="top")
+        fig.suptitle("Executors in time",weight='bold', fontsize=18, ha="center", va="top")
+        ax.set_title(title, fontsize=14,ha="center", va="top")
 
-        new_array=[]
-        new_array_count=[]
+        new_array2, new_array_count = self._executors_in_time(executors)
 
-        # group values
         for key in executors.keys():
-            for itm in executors[key]:
-                self._add_counter2(itm, new_array, new_array_count)
-
-
-        # add start
-#        new_array.insert(0, [datetime.datetime.fromisoformat(start_date).replace(microsecond=0),0])
-
-        # add end
-#        new_array.append([datetime.datetime.fromisoformat(end_date).replace(microsecond=0),0])
+            ax.step(new_array2,new_array_count,where='post',
+                    color = color.next(), #self._next_color(),
+                    linestyle="-",
+                    marker=marker.next(), #self._next_marker(),
+                    label=f"{key}")
 
-        # order
-        self._order(new_array)
-
-        # recalc (+/- values)
-        for i in range(len(new_array)):
-            if i==0:
-                count=new_array[i][1]
-            else:
-                count+=new_array[i][1]
-                new_array[i][1]=count
-
-        # transform
-        new_array2=[]
-        for i in new_array:
-            new_array_count.append(i[1])
-            new_array2.append(i[0])
-
-        for key in executors.keys():
-            plt.step(new_array2,new_array_count,where='post',
-                     color = color.next(), #self._next_color(),
-                     linestyle="-",
-                     marker=marker.next(), #self._next_marker(),
-                     label=f"{key}")
-
-        output_file = os.path.join(output_dir, file_name)
-        plt.savefig(output_file, dpi=self.dpi)
-        logging.info(f"  ... {output_file}")
-        plt.close()
-        return output_file
+        return self._write_graph(fig, context, cache_key, output_dir, file_name)
 
 
@@ -1,17 +1,15 @@
 import string
 
-from matplotlib import axes
-from matplotlib import pyplot as plt
 from qgate_graph.file_marker import FileMarker as const
-from numpy import std, average
 from qgate_graph.graph_base import GraphBase
 from qgate_graph.percentile_item import PercentileItem
 from qgate_graph.circle_queue import CircleQueue, ColorQueue, MarkerQueue
-from qgate_graph.graph_setup import GraphSetup
-import os.path, os
-import datetime
-import logging
-from io import StringIO
+from qgate_graph.stream_state import PerformanceState
+from qgate_graph.perf_record import HeaderRecord, CoreRecord
+from qgate_graph.output_writer import OutputWriter, GraphWriter
+from qgate_graph.output_target import OutputTarget
+from qgate_graph.render_context import RenderContext
+from qgate_graph.render_cache import RenderCache
 
 
 class GraphPerformance(GraphBase):
@@ -33,7 +31,8 @@ class GraphPerformance(GraphBase):
             graph=grp.GraphPerformance()
             graph.generate_from_dir("input_adr", "output_adr")
     """
-    def __init__(self, dpi = 100, min_precision = -1, max_precision = -1, raw_format = False, only_new = False):
+    def __init__(self, dpi = 100, min_precision = -1, max_precision = -1, raw_format = False, only_new = False,
+                 writers: list[OutputWriter] = None, image_format = "png", render_cache: RenderCache = None):
         """
         Generate performance outputs based on input data in graphical format (*.png files)
 
@@ -42,14 +41,18 @@ class GraphPerformance(GraphBase):
         :param max_precision:   maximal precision in graph (-1 is without setting)
         :param raw_format:      use raw format (default is True)
         :param only_new:        generate only new/not existing outputs (default is False, rewrite/regenerate all)
+        :param writers:         list of output writers, the data are aggregated only once and handed
+                                to all writers e.g. [GraphWriter(), CsvWriter(), TxtWriter()]
+                                (default is None, only graphical format)
+        :param image_format:    format of graphs "png" or "svg" (default is "png"), it is used without writers
+        :param render_cache:    cache of rendered graphs (default is None, without cache), see RenderCache
         """
-        super().__init__(dpi)
+        super().__init__(dpi, render_cache)
         self._min_precision = min_precision if min_precision >= 0 else GraphPerformance.MIN_PRECISION
         self._max_precision = max_precision if max_precision >= 0 else GraphPerformance.MAX_PRECISION
-        self._max_precision_format = "{num:." + str(self._max_precision) + "f}"
         self._raw_format = raw_format
         self._only_new = only_new
-        self._output_file_format = ("PRF", ".png")
+        self._writers = writers if writers is not None else [GraphWriter(image_format)]
 
     def _get_executor_list(self, collections=None, collection=None):
         """
@@ -71,15 +74,17 @@ class GraphPerformance(GraphBase):
                         list.append(executor)
         return list
 
-    def _expected_round(self, avrg_time):
+    def _expected_round(self, avrg_time, context: RenderContext = None):
         """Calculation amount of precisions for number presentation"""
+        if context is None:
+            context = self._render_context()
 
         # calc max by number precision
         max_len = 0
-        min_zero = self._max_precision
-        max_zero = self._min_precision
+        min_zero = context.max_precision
+        max_zero = context.min_precision
         for a in avrg_time:
-            split = self._max_precision_format.format(num=a).split('.')
+            split = context.max_precision_format.format(num=a).split('.')
 
             if len(split)>1:
                 decimal_item = split[1].rstrip('0')
@@ -99,16 +104,18 @@ class GraphPerformance(GraphBase):
                     min_zero = min(zero_prefix, min_zero)
                     max_zero = max(zero_prefix, max_zero)
         if max_len == 0:
-            return self._min_precision
+            return context.min_precision
 
         # max by standard deviation
+        from numpy import std, average
+
         deviation = std(avrg_time)
         if deviation > 1:
             return int(average([min_zero,max_zero]))
         else:
             max_stddev = 0
             limit = False
-            split = self._max_precision_format.format(num=deviation).split('.')
+            split = context.max_precision_format.format(num=deviation).split('.')
             if len(split) > 1:
                 # calculation amount of zeros
                 for c in split[1]:
@@ -124,22 +131,26 @@ class GraphPerformance(GraphBase):
                 return max_stddev if max_stddev > max_zero else max_zero
             return max_len
 
-    def _create_output(self, percentiles: {PercentileItem}, title, file_name, output_dir) -> str:
-        return self._create_graph(percentiles, title, file_name, output_dir)
+    def _create_graph(self, percentiles: {PercentileItem}, title, file_name, output_dir,
+                      context: RenderContext = None) -> str:
+        if context is None:
+            context = self._render_context()
+        cache_key = self._render_key(context, file_name, percentiles, title, context.response_time_unit,
+                               context.min_precision, context.max_precision, self._raw_format)
+        output = self._cached_graph(context, cache_key, output_dir, file_name)
+        if output:
+            return output
 
-    def _create_graph(self, percentiles: {PercentileItem}, title, file_name, output_dir) -> str:
         alpha = CircleQueue([0.4, 0.8] if len(percentiles) > 1 else [0.8])
         line_style = CircleQueue(['--','-'] if len(percentiles) > 1 else ['-'])
         color = ColorQueue()
         marker = MarkerQueue()
-        plt.style.use("bmh") #"ggplot" "seaborn-v0_8-poster"
-        fig, ax = plt.subplots(2, 1, sharex='none', squeeze=False, figsize=(15, 6))
-        ax_main: axes.Axes = ax[0][0]
-
-        # view total performance
-        self._watermark(plt, ax_main)
+        fig = self._new_figure(figsize = (15, 6))
+        ax = fig.subplots(2, 1, sharex='none', squeeze=False)
+        ax_main = ax[0][0]
 
-        plt.suptitle("Performance & Response time",weight='bold', fontsize=18, ha="center", va="top")
+        # view total performance (the watermark is only in detail graphs)
+        fig.suptitle("Performance & Response time",weight='bold', fontsize=18, ha="center", va="top")
         ax_main.set_title(title, fontsize=14, ha="center", va="top")
 
         # plot main graph 'Performance [calls/second]' (plus amount of executors)
@@ -177,7 +188,7 @@ class GraphPerformance(GraphBase):
         for key in percentiles[1].executors.keys():
             # view response time
             key_view += 1
-            ax=plt.subplot(2, key_count, key_view)
+            ax=fig.add_subplot(2, key_count, key_view)
 
             for percentile in percentiles.values():
                 if len(percentile.std_deviation)==0:
@@ -188,7 +199,7 @@ class GraphPerformance(GraphBase):
                                 marker = '_' if (len(percentiles) > 1 and percentile.percentile != 1) or (len(percentiles) == 1) else 'none',
                                 linewidth = 2 if (len(percentiles) > 1 and percentile.percentile != 1) or (len(percentiles) == 1) else 1,
                                 capsize = 6 if (len(percentiles) > 1 and percentile.percentile != 1) or (len(percentiles) == 1) else 6)
-                    self._watermark(plt, ax)
+                    self._watermark(ax)
                     ax.legend(['avrg', f"avrg {str(int(percentile.percentile*100))+'ph ' if percentile.percentile != 1 else ''}"],
                               fontsize = 'small')
                 else:
@@ -199,7 +210,7 @@ class GraphPerformance(GraphBase):
                                 marker = '_' if (len(percentiles) > 1 and percentile.percentile != 1) or (len(percentiles) == 1) else 'none',
                                 linewidth = 2 if (len(percentiles) > 1 and percentile.percentile != 1) or (len(percentiles) == 1) else 1,
                                 capsize = 6 if (len(percentiles) > 1 and percentile.percentile != 1) or (len(percentiles) == 1) else 6)
-                    self._watermark(plt, ax)
+                    self._watermark(ax)
                     ax.legend(['avrg ± std', f"avrg ± std {str(int(percentile.percentile*100))+'ph ' if percentile.percentile != 1 else ''}"],
                               fontsize = 'small')
 
@@ -227,7 +238,7 @@ class GraphPerformance(GraphBase):
 
                 # print response time value with relevant precision
                 if (len(percentiles) > 1 and percentile.percentile != 1) or (len(percentiles) == 1):
-                    expected_round = self._expected_round(percentile.avrg_time[key])
+                    expected_round = self._expected_round(percentile.avrg_time[key], context)
                     for x, y in zip(percentile.executors[key], percentile.avrg_time[key]):
                         ax.annotate(round(y,expected_round),
                                     (x,y),
@@ -241,192 +252,86 @@ class GraphPerformance(GraphBase):
 
                 ax.set_xlabel('Executors')
                 if key_count+1 == key_view:
-                    ax.set_ylabel(str.format(f"Response [{GraphSetup().response_time_unit}]"))
+                    ax.set_ylabel(str.format(f"Response [{context.response_time_unit}]"))
                 ax.set_xticks(self._get_executor_list(collection=percentile.executors[key]))
                 ax.grid(visible = True)
             color.next()
             marker.next()
 
-        output_file = os.path.join(output_dir, file_name)
-        plt.savefig(output_file, dpi=self.dpi)
-        logging.info(f"  ... {output_file}")
-        plt.close()
-        return output_file
-
-    def generate_from_dir(self, input_dir: str="input", output_dir: str="output") -> list[str]:
-        """
-        Generate graphs based on input directory
-
-        example::
-
-            import qgate_graph.graph_performance as grp
-
-            graph=grp.GraphPerformance()
-            graph.generate_from_dir("input_adr", "output_adr")
-
-        :param input_dir:       Input directory (default "input")
-        :param output_dir:      Output directory (default "output")
-        :return:                List of generated files
-        """
-        output_list=[]
-
-        for input_file in os.listdir(input_dir):
-            for file in self.generate_from_file(os.path.join(input_dir, input_file), output_dir):
-                output_list.append(file)
-        logging.info("Done")
-        return output_list
-
-    def generate_from_text(self, text: str, output_dir: str = "output", suppress_error = False) -> list[str]:
-
-        logging.info(f"Processing 'text' ...")
-        with StringIO(text) as f:
-            output_list=self._generate_from_stream(f,output_dir, suppress_error)
-        return output_list
-
-    def generate_from_file(self, input_file: str, output_dir: str = "output", suppress_error = False) -> list[str]:
-        """
-        Generate graphs about executors based on input file
-
-        :param input_file:      Input file
-        :param output_dir:      Output directory (default "output")
-        :param suppress_error:  Ability to suppress error (default is False)
-        :return:                List of generated files
-        """
-
-        logging.info(f"Processing '{input_file}' ...")
-        with open(input_file, "r") as f:
-            output_list=self._generate_from_stream(f,output_dir, suppress_error)
-        return output_list
-
-    def _generate_from_stream(self, f, output_dir: str="output", suppress_error = False) -> list[str]:
-        """
-        Generate graphs based on input file
-
-        :param input_file:      Input file
-        :param output_dir:      Output directory (default "output")
-        :param suppress_error:  Ability to suppress error (default is False)
-        :return:                List of generated files
-        """
-        file_name = None
-        output_list = []
-        percentiles = {}
-        percentiles[1] = PercentileItem(1)
-
-        #logging.info(f"Processing '{input_file}' ...")
-
-        # copy dir because the path can be modificated
-        output_dir_target = output_dir
-
-        # create output dir, if not exist
-        if not os.path.exists(output_dir_target):
-            os.makedirs(output_dir_target, mode = 0o777)
-
-        #with open(input_file, "r") as f:
-        while True:
-            line = f.readline()
-            if not line:
-                break
-            if line[0] == '#':
-                if file_name and len(percentiles[1].executors) > 0:
-                    if suppress_error:
-                        try:
-                            output_list.append(self._create_output(percentiles, title, file_name, output_dir_target))
-                        except Exception as ex:
-                            logging.info(f"  ... Error in '{file_name}', '{type(ex)}'")
-                    else:
-                        output_list.append(self._create_output(percentiles, title, file_name, output_dir_target))
-                file_name = None
-                percentiles.clear()
-                percentiles[1] = PercentileItem(1)
+        return self._write_graph(fig, context, cache_key, output_dir, file_name)
+
+    def _render_context(self, target: OutputTarget = None) -> RenderContext:
+        return RenderContext(target, dpi = self.dpi, min_precision = self._min_precision,
+                             max_precision = self._max_precision, render_cache = self.render_cache)
+
+    def _new_state(self, output_dir, suppress_error, manifest = None, context = None) -> PerformanceState:
+        return PerformanceState(output_dir, suppress_error, manifest, context)
+
+    def _record_types(self) -> set:
+        # the detail lines are not used
+        return {const.PRF_HDR_TYPE, const.PRF_CORE_TYPE}
+
+    def _output_key(self) -> str:
+        return "-".join(["".join(writer.output_file_format) for writer in self._writers]) + ("-RAW" if self._raw_format else "")
+
+    def _on_separator(self, state: PerformanceState):
+        if len(state.percentiles[1].executors) > 0:
+            for writer, file_name in state.outputs:
+                self._add_output(state, file_name, writer.create_output,
+                                 self, state.percentiles, state.title, file_name, state.output_dir_target,
+                                 state.context)
+        state.outputs = []
+        state.percentiles.clear()
+        state.percentiles[1] = PercentileItem(1)
+
+    def _on_header(self, state: PerformanceState, record: HeaderRecord):
+        super()._on_header(state, record)
+
+        # add percentile
+        if record.percentile < 1:
+            state.percentiles[record.percentile] = PercentileItem(record.percentile)
+
+        # create file names for all outputs
+        state.outputs = []
+        for writer in self._writers:
+            file_name = self._unique_file_name(writer.output_file_format[0],
+                                               state.label,
+                                               state.report_date,
+                                               state.bulk,
+                                               self._raw_format,
+                                               writer.output_file_format[1])
+
+            # it is necessity to generate file?
+            if self._skip_output(state, file_name):
                 continue
-            input_dict = GraphBase.load_json(line)
-            if not input_dict:
-                continue
-            if input_dict[const.PRF_TYPE] == const.PRF_HDR_TYPE:
-                # header items
-                start_date = input_dict[const.PRF_HDR_NOW]
-                report_date = datetime.datetime.fromisoformat(start_date).strftime("%Y-%m-%d %H-%M-%S")
-                label = input_dict[const.PRF_HDR_LABEL]
-                bulk = input_dict[const.PRF_HDR_BULK]
-                duration = int(input_dict.get(const.PRF_HDR_DURATION, -1))
-                if duration >= 0:
-                    # update output dir based on duration (e.g. 1 min, 5 sec, etc.) and date
-                    output_dir_target = os.path.join(output_dir,
-                                                     self._readable_duration(duration),
-                                                     datetime.datetime.fromisoformat(start_date).strftime("%Y-%m-%d"))
-                    # create subdirectory based on duration
-                    if not os.path.exists(output_dir_target):
-                        os.makedirs(output_dir_target, mode=0o777)
-
-                # setup response unit
-                GraphSetup().response_time_unit=input_dict.get(const.PRF_HDR_RESPONSE_UNIT, "sec")
-
-                # add percentile
-                if input_dict.get(const.PRF_HDR_PERCENTILE, 1) < 1:
-                    percentiles[input_dict[const.PRF_HDR_PERCENTILE]] = PercentileItem(input_dict[const.PRF_HDR_PERCENTILE])
-
-                # create file name and title for graph
-                file_name = self._unique_file_name(self._output_file_format[0],
-                                                   label,
-                                                   report_date,
-                                                   bulk,
-                                                   self._raw_format,
-                                                   self._output_file_format[1])
-
-                # it is necessity to generate file?
-                if self._only_new:
-                    # in case of focusing on only_new and file exists, jump it
-                    if os.path.exists(os.path.join(output_dir_target, file_name)):
-                        file_name = None
-                        continue
-
-                title = f"'{label}', {report_date}, bulk {bulk[0]}/{bulk[1]}, duration '{self._readable_duration(duration)}'"
-            elif (input_dict[const.PRF_TYPE] == const.PRF_CORE_TYPE) and file_name:
-
-                for percentile_key in percentiles.keys():
-                    suffix = f"_{int(percentile_key * 100)}" if percentile_key < 1 else ""
-                    group = input_dict[const.PRF_CORE_GROUP]# if percentile == 1 else f"{input_dict[const.PRF_CORE_GROUP]}, {int(percentile * 100)}ph"
-                    percentile = percentiles[percentile_key]
-
-                    # core items
-                    if group in percentile.executors:
-                        percentile.executors[group].append(input_dict[const.PRF_CORE_REAL_EXECUTOR])
-                        if self._raw_format:
-                            total_calls_sec_raw = input_dict.get(const.PRF_CORE_TOTAL_CALL_PER_SEC_RAW + suffix, None)
-                            if total_calls_sec_raw is None:
-                                total_calls_sec_raw = input_dict[const.PRF_CORE_TOTAL_CALL_PER_SEC + suffix] / bulk[0]
-                            percentile.total_performance[group].append(total_calls_sec_raw)
-                        else:
-                            percentile.total_performance[group].append(input_dict[const.PRF_CORE_TOTAL_CALL_PER_SEC + suffix])
-                        percentile.avrg_time[group].append(input_dict[const.PRF_CORE_AVRG_TIME + suffix])
-                        # optional STD_DEVIATION
-                        if input_dict.get(const.PRF_CORE_STD_DEVIATION + suffix, None):
-                            percentile.std_deviation[group].append(input_dict[const.PRF_CORE_STD_DEVIATION + suffix])
-                        else:
-                            percentile.std_deviation[group].append(0.0)
-                        if input_dict.get(const.PRF_CORE_MIN + suffix, None):
-                            percentile.min[group].append(input_dict[const.PRF_CORE_MIN + suffix])
-                        if input_dict.get(const.PRF_CORE_MAX + suffix, None):
-                            percentile.max[group].append(input_dict[const.PRF_CORE_MAX + suffix])
-                    else:
-                        percentile.executors[group] = [input_dict[const.PRF_CORE_REAL_EXECUTOR]]
-                        if self._raw_format:
-                            total_calls_sec_raw = input_dict.get(const.PRF_CORE_TOTAL_CALL_PER_SEC_RAW + suffix, None)
-                            if total_calls_sec_raw is None:
-                                total_calls_sec_raw = input_dict[const.PRF_CORE_TOTAL_CALL_PER_SEC + suffix] / bulk[0]
-                            percentile.total_performance[group] = [total_calls_sec_raw]
-                        else:
-                            percentile.total_performance[group] = [input_dict[const.PRF_CORE_TOTAL_CALL_PER_SEC + suffix]]
-                        percentile.avrg_time[group] = [input_dict[const.PRF_CORE_AVRG_TIME + suffix]]
-                        # optional STD_DEVIATION
-                        if input_dict.get(const.PRF_CORE_STD_DEVIATION + suffix, None):
-                            percentile.std_deviation[group] = [input_dict[const.PRF_CORE_STD_DEVIATION + suffix]]
-                        else:
-                            percentile.std_deviation[group] = [0.0]
-                        if input_dict.get(const.PRF_CORE_MIN + suffix, None):
-                            percentile.min[group] = [input_dict[const.PRF_CORE_MIN + suffix]]
-                        if input_dict.get(const.PRF_CORE_MAX + suffix, None):
-                            percentile.max[group] = [input_dict[const.PRF_CORE_MAX + suffix]]
-        return output_list
-
-
+            state.outputs.append((writer, file_name))
+
+    def _on_core(self, state: PerformanceState, record: CoreRecord):
+        if not state.outputs:
+            return
+
+        bulk = state.bulk
+        for percentile_key, percentile in state.percentiles.items():
+            metrics = record.metrics(percentile_key)
+            if self._raw_format:
+                total_performance = metrics.total_call_per_sec_raw
+                if total_performance is None:
+                    total_performance = metrics.total_call_per_sec / bulk[0]
+            else:
+                total_performance = metrics.total_call_per_sec
+            try:
+                percentile.append(record.group,
+                                  record.real_executors,
+                                  total_performance,
+                                  metrics.avrg_time,
+                                  metrics.std_deviation,
+                                  metrics.min,
+                                  metrics.max)
+            except TypeError as ex:
+                # invalid value, the outputs of the block are not generated
+                if not state.suppress_error:
+                    raise
+                for writer, file_name in state.outputs:
+                    self._output_error(state, file_name, ex)
+                state.outputs = []
+                return
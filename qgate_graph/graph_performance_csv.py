@@ -1,7 +1,5 @@
 from qgate_graph.graph_performance import GraphPerformance
-from qgate_graph.percentile_item import PercentileItem
-import os.path, os
-import logging
+from qgate_graph.output_writer import CsvWriter
 
 
 class GraphPerformanceCsv(GraphPerformance):
@@ -16,12 +14,4 @@ class GraphPerformanceCsv(GraphPerformance):
         :param only_new:        generate only new/not existing outputs (default is False, rewrite/regenerate all)
         """
 
-        super().__init__(0, min_precision, max_precision, raw_format, only_new)
-        self._output_file_format = ("CSV", ".csv")
-
-    def _create_output(self, percentiles: {PercentileItem}, title, file_name, output_dir) -> str:
-        output_file = os.path.join(output_dir, file_name)
-        with open(output_file, 'w', newline='') as file:
-            file.write(super()._create_table(percentiles).get_csv_string(delimiter=','))
-            logging.info(f"  ... {output_file}")
-        return output_file
+        super().__init__(0, min_precision, max_precision, raw_format, only_new, [CsvWriter()])
@@ -1,7 +1,5 @@
 from qgate_graph.graph_performance import GraphPerformance
-from qgate_graph.percentile_item import PercentileItem
-import os.path, os
-import logging
+from qgate_graph.output_writer import TxtWriter
 
 
 class GraphPerformanceTxt(GraphPerformance):
@@ -16,12 +14,4 @@ class GraphPerformanceTxt(GraphPerformance):
         :param only_new:        generate only new/not existing outputs (default is False, rewrite/regenerate all)
         """
 
-        super().__init__(0, min_precision, max_precision, raw_format, only_new)
-        self._output_file_format = ("TXT", ".txt")
-
-    def _create_output(self, percentiles: {PercentileItem}, title, file_name, output_dir) -> str:
-        output_file = os.path.join(output_dir, file_name)
-        with open(output_file, 'w') as file:
-            file.write(str(super()._create_table(percentiles)))
-            logging.info(f"  ... {output_file}")
-        return output_file
+        super().__init__(0, min_precision, max_precision, raw_format, only_new, [TxtWriter()])
@@ -0,0 +1,52 @@
+from qgate_graph.graph_base import GraphBase
+
+
+class GraphPipeline(GraphBase):
+    """
+    Parse input data only once and send the events to more graphs/outputs (sinks)
+
+        example::
+
+            from qgate_graph.graph_pipeline import GraphPipeline
+            from qgate_graph.graph_performance import GraphPerformance
+            from qgate_graph.graph_executor import GraphExecutor
+
+            pipeline=GraphPipeline([GraphPerformance(), GraphExecutor()])
+            pipeline.generate_from_dir("input_adr", "output_adr")
+    """
+    def __init__(self, sinks: list[GraphBase]):
+        """
+        Generate outputs for all sinks based on one pass of input data
+
+        :param sinks:           List of graphs/outputs such as GraphPerformance, GraphExecutor,
+                                GraphPerformanceCsv, GraphPerformanceTxt
+        """
+        super().__init__()
+        self._sinks = sinks
+
+    def _record_types(self) -> set:
+        return set().union(*[sink._record_types() for sink in self._sinks])
+
+    def _use_manifest(self) -> bool:
+        return len(self._sinks) > 0 and all([sink._use_manifest() for sink in self._sinks])
+
+    def _output_key(self) -> str:
+        return "+".join([sink._output_key() for sink in self._sinks])
+
+    def _open_stream(self, output_dir, suppress_error, manifest = None, target = None):
+        state = [(sink, sink._open_stream(output_dir, suppress_error, manifest, target)) for sink in self._sinks]
+
+        # all sinks share one list of generated files (the files are in order of generation)
+        output_list = []
+        for sink, sink_state in state:
+            sink_state.output_list = output_list
+        return state
+
+    def _close_stream(self, state) -> list[str]:
+        for sink, sink_state in state:
+            sink._close_stream(sink_state)
+        return state[0][1].output_list if state else []
+
+    def _process(self, state, event_type, record):
+        for sink, sink_state in state:
+            sink._process(sink_state, event_type, record)
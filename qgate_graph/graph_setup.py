@@ -8,6 +8,10 @@ class Singleton (type):
         return cls._instances[cls]
 
 class GraphSetup(metaclass=Singleton):
+    """
+    Process-wide setup, it is kept only for compatibility. The graphs use own settings for each
+    processed input stream, see RenderContext (safe for concurrent generation).
+    """
 
     def __init__(self):
         self.response_time_unit = "sec"
@@ -0,0 +1,119 @@
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from prettytable import PrettyTable
+import time
+
+
+# statistics of the running generation (separated for each thread/task)
+_active_stats = ContextVar("qgate_graph_stats", default = None)
+
+
+class GraphStats:
+    """
+    Statistics of generation, duration of stages (exclusive time, without nested stages)
+    and counts of processed items. The stages are:
+     - read         open/read of input (lines or events from parse cache, including update of cache)
+     - decode       JSON decode of lines
+     - aggregate    aggregation of values from events
+     - render       build of figure or table
+     - save         draw, encode and write of output (PNG, CSV, TXT), matplotlib draws the figure in save
+
+    and the counts are files, lines, invalid (lines), blocks, outputs, skipped (outputs without
+    change), unchanged (input files without change), cached (graphs from render cache), identical
+    (outputs with the same content, the files are not rewritten) and errors.
+
+        example::
+
+            from qgate_graph.graph_performance import GraphPerformance
+            from qgate_graph.graph_stats import GraphStats
+
+            stats = GraphStats()
+            GraphPerformance().generate_from_dir("input_adr", "output_adr", stats = stats)
+            print(stats)
+    """
+
+    STAGES = ["read", "decode", "aggregate", "render", "save"]
+    COUNTS = ["files", "lines", "invalid", "blocks", "outputs", "skipped", "unchanged", "cached", "identical", "errors"]
+
+    def __init__(self):
+        self.durations = {stage: 0.0 for stage in GraphStats.STAGES}
+        self.counts = {count: 0 for count in GraphStats.COUNTS}
+        self._nested = []
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Measure duration of stage (the duration of nested stages is excluded)
+
+        :param name:        Name of stage
+        """
+        self._nested.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            nested = self._nested.pop()
+            self.durations[name] = self.durations.get(name, 0.0) + duration - nested
+            if self._nested:
+                self._nested[-1] += duration
+
+    def count(self, name, amount = 1):
+        self.counts[name] = self.counts.get(name, 0) + amount
+
+    def merge(self, stats):
+        """Add statistics from other generation (e.g. from worker process)"""
+        for name, duration in stats.durations.items():
+            self.durations[name] = self.durations.get(name, 0.0) + duration
+        for name, amount in stats.counts.items():
+            self.count(name, amount)
+
+    def to_dict(self) -> dict:
+        return {"durations": dict(self.durations), "counts": dict(self.counts)}
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state):
+        self.durations = state["durations"]
+        self.counts = state["counts"]
+        self._nested = []
+
+    def __str__(self):
+        total = sum(self.durations.values())
+        table = PrettyTable()
+        table.field_names = ["Stage", "Duration [sec]", "Share"]
+        for name, duration in self.durations.items():
+            table.add_row([name, f"{duration:.3f}", f"{duration / total * 100 if total else 0:.1f}%"])
+        table.add_row(["total", f"{total:.3f}", "100.0%" if total else "0.0%"])
+        table.align = "r"
+        table.align["Stage"] = "l"
+        counts = ", ".join([f"{name} {amount}" for name, amount in self.counts.items()])
+        return f"{table}\n{counts}"
+
+    @contextmanager
+    def activate(self):
+        """Collect statistics of the generation in this context (thread/task)"""
+        token = _active_stats.set(self)
+        try:
+            yield self
+        finally:
+            _active_stats.reset(token)
+
+    @staticmethod
+    def current():
+        """Return statistics of the running generation (None, without statistics)"""
+        return _active_stats.get()
+
+    @staticmethod
+    def measure(name):
+        """Measure the stage of the running generation (without statistics, it does nothing)"""
+        stats = _active_stats.get()
+        return stats.stage(name) if stats else nullcontext()
+
+    @staticmethod
+    def increment(name, amount = 1):
+        """Increase the count in the running generation (without statistics, it does nothing)"""
+        stats = _active_stats.get()
+        if stats:
+            stats.count(name, amount)
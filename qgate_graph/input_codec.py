@@ -0,0 +1,95 @@
+import os.path, os
+import io
+
+
+class InputCodec:
+    """
+    Transparent decompression of input files (gzip, bz2, xz, zstd), the compression is detected
+    based on magic bytes (or extension for empty file). The content is decompressed during
+    reading (stream), without temporary files.
+
+        example::
+
+            from qgate_graph.input_codec import InputCodec
+            from qgate_graph.perf_reader import PerfReader
+
+            with InputCodec.open("input/perf_test.txt.gz") as f:
+                for event_type, record in PerfReader(f):
+                    print(event_type, record)
+    """
+
+    GZIP = "gzip"
+    BZ2 = "bz2"
+    XZ = "xz"
+    ZSTD = "zstd"
+
+    # magic bytes on the beginning of compressed file
+    MAGIC = {GZIP: b"\x1f\x8b",
+             BZ2: b"BZh",
+             XZ: b"\xfd7zXZ\x00",
+             ZSTD: b"\x28\xb5\x2f\xfd"}
+
+    EXTENSIONS = {".gz": GZIP,
+                  ".bz2": BZ2,
+                  ".xz": XZ,
+                  ".zst": ZSTD}
+
+    @staticmethod
+    def detect(input_file) -> str:
+        """
+        Detect compression of input file
+
+        :param input_file:      Input file
+        :return:                Compression (gzip, bz2, xz, zstd) or None for plain file
+        """
+        with open(input_file, "rb") as f:
+            head = f.read(6)
+        for compression, magic in InputCodec.MAGIC.items():
+            if head.startswith(magic):
+                return compression
+        if not head:
+            return InputCodec.EXTENSIONS.get(os.path.splitext(input_file)[1].lower())
+        return None
+
+    @staticmethod
+    def open(input_file, binary = False):
+        """
+        Open input file for reading, the compressed file is decompressed during reading
+
+        :param input_file:      Input file
+        :param binary:          Binary stream (default is False, text stream)
+        :return:                File object
+        """
+        compression = InputCodec.detect(input_file)
+        if compression is None:
+            return open(input_file, "rb" if binary else "r")
+
+        stream = InputCodec._open_binary(input_file, compression)
+        if binary:
+            return stream
+        return io.TextIOWrapper(stream, encoding = "utf-8")
+
+    @staticmethod
+    def _open_binary(input_file, compression):
+        if compression == InputCodec.GZIP:
+            import gzip
+            return gzip.open(input_file, "rb")
+        if compression == InputCodec.BZ2:
+            import bz2
+            return bz2.open(input_file, "rb")
+        if compression == InputCodec.XZ:
+            import lzma
+            return lzma.open(input_file, "rb")
+
+        # zstd, optional dependency 'zstandard' (or standard module since Python 3.14)
+        try:
+            import zstandard
+        except ImportError:
+            try:
+                from compression import zstd
+            except ImportError:
+                raise ImportError(f"Missing package 'zstandard' for decompression of '{input_file}', "
+                                  f"use 'pip install zstandard'") from None
+            return zstd.open(input_file, "rb")
+        # the stream reader does not support readline/iteration (buffered reader adds them)
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(open(input_file, "rb"), closefd = True))
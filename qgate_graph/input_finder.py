@@ -0,0 +1,96 @@
+from qgate_graph.block_index import BlockIndex
+from fnmatch import fnmatch
+import os.path, os
+import datetime
+
+
+class InputFinder:
+    """
+    Discovery of input files in input directory (optionally recursive) with filters based on
+    glob patterns and window of modification time. The discovery is lazy (generator), so that
+    processing of huge directory trees can start before the end of the walk.
+
+        example::
+
+            from qgate_graph.input_finder import InputFinder
+
+            # only *.txt files changed in the last day, without directory 'old'
+            finder=InputFinder(recursive = True, include = ["*.txt"], exclude = ["old"],
+                               changed_since = datetime.datetime.now() - datetime.timedelta(days = 1))
+            for input_file in finder.find("input"):
+                print(input_file)
+    """
+
+    def __init__(self, recursive = False, include: list[str] = None, exclude: list[str] = None,
+                 changed_since = None, changed_before = None):
+        """
+        :param recursive:       Scan also subdirectories (default is False)
+        :param include:         Glob patterns of included files e.g. ["*.txt"] (default is None, all files).
+                                The patterns are matched with relative path (with '/') and with file name.
+        :param exclude:         Glob patterns of excluded files and directories e.g. ["*.tmp", "archive"]
+                                (default is None, without exclusion)
+        :param changed_since:   Only files modified since the time, datetime or timestamp (default is None)
+        :param changed_before:  Only files modified before the time, datetime or timestamp (default is None)
+        """
+        self._recursive = recursive
+        self._include = include or []
+        self._exclude = exclude or []
+        self._changed_since = InputFinder._timestamp(changed_since)
+        self._changed_before = InputFinder._timestamp(changed_before)
+
+    @staticmethod
+    def _timestamp(value):
+        if isinstance(value, datetime.datetime):
+            return value.timestamp()
+        return value
+
+    @staticmethod
+    def _match(patterns, relative_path, name) -> bool:
+        for pattern in patterns:
+            if fnmatch(relative_path, pattern) or fnmatch(name, pattern):
+                return True
+        return False
+
+    def _accept_file(self, entry, relative_path) -> bool:
+        if entry.name.endswith(BlockIndex.EXTENSION):
+            return False
+        if self._include and not InputFinder._match(self._include, relative_path, entry.name):
+            return False
+        if self._exclude and InputFinder._match(self._exclude, relative_path, entry.name):
+            return False
+        if self._changed_since is not None or self._changed_before is not None:
+            try:
+                mtime = entry.stat().st_mtime
+            except FileNotFoundError:
+                return False
+            if self._changed_since is not None and mtime < self._changed_since:
+                return False
+            if self._changed_before is not None and mtime >= self._changed_before:
+                return False
+        return True
+
+    def find(self, input_dir: str):
+        """
+        Generate input files in input directory (in order of names, the files of
+        directory before its subdirectories)
+
+        :param input_dir:       Input directory
+        :return:                Generator of paths to input files
+        """
+        yield from self._find(input_dir, "")
+
+    def _find(self, directory, relative_dir):
+        with os.scandir(directory) as entries:
+            entries = sorted(entries, key = lambda entry: entry.name)
+
+        subdirs = []
+        for entry in entries:
+            relative_path = f"{relative_dir}{entry.name}"
+            if entry.is_dir():
+                if self._recursive and not InputFinder._match(self._exclude, relative_path, entry.name):
+                    subdirs.append((entry.path, relative_path))
+            elif entry.is_file() and self._accept_file(entry, relative_path):
+                yield entry.path
+
+        for subdir, relative_path in subdirs:
+            yield from self._find(subdir, relative_path + "/")
@@ -0,0 +1,129 @@
+from qgate_graph.block_index import BlockIndex
+import os.path, os
+import hashlib
+import json
+import logging
+
+
+class OutputManifest:
+    """
+    Manifest of generated outputs in output directory (used for 'only_new'). It maps input
+    file and hash of each its block (run) to the generated outputs, so that:
+     - unchanged input file is skipped before it is opened
+     - changed/new block is regenerated, also in case that the outputs with the same name exist
+     - unchanged block is skipped, if all its outputs exist
+     - block with error (e.g. with suppress_error) is generated again in the next run
+    """
+
+    # subdirectory of output directory with manifests
+    MANIFEST_DIR = ".qgate-manifest"
+
+    def __init__(self, output_dir, output_key, input_file):
+        """
+        :param output_dir:      Output directory
+        :param output_key:      Key of outputs (typically the graph type and its setting)
+        :param input_file:      Input file
+        """
+        self._output_dir = output_dir
+        self._input_file = input_file
+        key = hashlib.sha1(f"{output_key}|{os.path.abspath(input_file)}".encode("utf-8")).hexdigest()[:16]
+        self._manifest_file = os.path.join(output_dir, OutputManifest.MANIFEST_DIR,
+                                           f"{os.path.basename(input_file)}-{key}.json")
+        self._entry = self._load()
+        self._block_hashes = None
+        self._block_outputs = {}
+        self._block_errors = set()
+
+    def _load(self) -> dict:
+        if not os.path.exists(self._manifest_file):
+            return None
+        try:
+            with open(self._manifest_file, "r") as f:
+                return json.load(f)
+        except Exception as ex:
+            logging.info(f"  ... Invalid manifest '{self._manifest_file}', '{type(ex)}'")
+            return None
+
+    def _fingerprint(self) -> dict:
+        stat = os.stat(self._input_file)
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def _outputs_exist(self, outputs) -> bool:
+        for output in outputs:
+            if not os.path.exists(os.path.join(self._output_dir, output)):
+                return False
+        return True
+
+    def known(self) -> bool:
+        """Check, if the manifest for input file exists"""
+        return self._entry is not None
+
+    def unchanged(self) -> bool:
+        """Check (without reading of input file), that the input file and all its outputs are without change"""
+        if not self._entry or self._entry["fingerprint"] != self._fingerprint():
+            return False
+
+        # blocks with error (not in manifest) are generated again
+        if self._entry.get("errors") or self._entry.get("block_count") != len(self._entry["blocks"]):
+            return False
+        for outputs in self._entry["blocks"].values():
+            if not self._outputs_exist(outputs):
+                return False
+        return True
+
+    def scan(self):
+        """Scan input file and calculate hash for each block"""
+        self._block_hashes = [block.hash for block in BlockIndex.build(self._input_file)]
+
+    def block_changed(self, block_number) -> bool:
+        """
+        Check, if the block is new/changed or some its outputs are missing
+
+        :param block_number:    Order of block in input file (starts from 0)
+        :return:                True - generate outputs of the block, False - skip the block
+        """
+        if self._block_hashes is None:
+            self.scan()
+        if block_number < 0 or block_number >= len(self._block_hashes):
+            return True
+        outputs = self._entry["blocks"].get(self._block_hashes[block_number]) if self._entry else None
+        return outputs is None or not self._outputs_exist(outputs)
+
+    def add_output(self, block_number, output_file):
+        """Add generated output to the block"""
+        if self._block_hashes is None:
+            self.scan()
+        if 0 <= block_number < len(self._block_hashes):
+            self._block_outputs.setdefault(self._block_hashes[block_number], []).append(
+                os.path.relpath(output_file, self._output_dir))
+
+    def add_error(self, block_number):
+        """Add error in the block (the block will be generated again in the next run)"""
+        if self._block_hashes is None:
+            self.scan()
+        if 0 <= block_number < len(self._block_hashes):
+            self._block_errors.add(self._block_hashes[block_number])
+
+    def save(self):
+        """Save manifest (outputs of changed blocks and outputs of skipped blocks)"""
+        if self._block_hashes is None:
+            self.scan()
+        blocks = {}
+        previous = self._entry["blocks"] if self._entry else {}
+        for block_number, block_hash in enumerate(self._block_hashes):
+            if block_hash in self._block_errors:
+                continue
+            if block_hash in self._block_outputs:
+                blocks[block_hash] = self._block_outputs[block_hash]
+            elif not self.block_changed(block_number):
+                blocks[block_hash] = previous[block_hash]
+            else:
+                blocks[block_hash] = []
+
+        os.makedirs(os.path.dirname(self._manifest_file), mode = 0o777, exist_ok = True)
+        with open(self._manifest_file, "w") as f:
+            json.dump({"input_file": os.path.abspath(self._input_file),
+                       "fingerprint": self._fingerprint(),
+                       "block_count": len(set(self._block_hashes)),
+                       "blocks": blocks,
+                       "errors": sorted(self._block_errors)}, f, indent = 1)
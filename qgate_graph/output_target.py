@@ -0,0 +1,171 @@
+from qgate_graph.graph_stats import GraphStats
+from io import BytesIO
+import os.path, os
+import hashlib
+import locale
+import logging
+
+
+class OutputTarget:
+    """
+    Target of generated outputs, the default target writes files into output directory
+    (see FileTarget), the MemoryTarget keeps the outputs in memory (without filesystem)
+    """
+
+    # metadata of images without timestamps (the same data produce the same bytes)
+    METADATA = {"svg": {"Date": None}, "pdf": {"CreationDate": None}}
+
+    @staticmethod
+    def figure_bytes(fig, file_name, dpi) -> bytes:
+        """
+        Render figure to bytes (deterministic, without timestamps in metadata)
+
+        :param fig:             Figure (matplotlib)
+        :param file_name:       Output file name, the image format is based on extension (e.g. ".png", ".svg")
+        :param dpi:             Quality of image in DPI
+        :return:                Bytes of image
+        """
+        image_format = os.path.splitext(file_name)[1][1:]
+        with BytesIO() as buffer:
+            fig.savefig(buffer, dpi = dpi, format = image_format, metadata = OutputTarget.METADATA.get(image_format))
+            return buffer.getvalue()
+
+    @staticmethod
+    def text_bytes(content: str, newline = None) -> bytes:
+        """
+        Encode text content with the same translation of line endings and encoding as 'open' in text mode
+
+        :param content:         Text content
+        :param newline:         Handling of line endings, see 'open' (default is None)
+        :return:                Bytes of text content
+        """
+        if newline is None:
+            content = content.replace("\n", os.linesep)
+        elif newline:
+            content = content.replace("\n", newline)
+        return content.encode(locale.getpreferredencoding(False))
+
+    def makedirs(self, output_dir):
+        """Prepare output directory"""
+        pass
+
+    def exists(self, output_dir, file_name) -> bool:
+        """Check, if the output exists (for only_new)"""
+        raise NotImplementedError()
+
+    def write_figure(self, fig, output_dir, file_name, dpi) -> str:
+        """
+        Write figure, the image format is based on extension of file name (e.g. ".png", ".svg")
+
+        :param fig:             Figure (matplotlib)
+        :param output_dir:      Output directory
+        :param file_name:       Output file name
+        :param dpi:             Quality of image in DPI
+        :return:                Generated output (file or key)
+        """
+        raise NotImplementedError()
+
+    def write_text(self, content: str, output_dir, file_name, newline = None) -> str:
+        """
+        Write text content
+
+        :param content:         Text content
+        :param output_dir:      Output directory
+        :param file_name:       Output file name
+        :param newline:         Handling of line endings, see 'open' (default is None)
+        :return:                Generated output (file or key)
+        """
+        raise NotImplementedError()
+
+    def write_bytes(self, content: bytes, output_dir, file_name) -> str:
+        """
+        Write binary content (e.g. rendered graph from render cache)
+
+        :param content:         Binary content
+        :param output_dir:      Output directory
+        :param file_name:       Output file name
+        :return:                Generated output (file or key)
+        """
+        raise NotImplementedError()
+
+
+class FileTarget(OutputTarget):
+    """
+    Write outputs as files into output directory, the file with the same content is not
+    rewritten (it keeps its modification time, e.g. for synchronization to other storage)
+    """
+
+    def makedirs(self, output_dir):
+        if not os.path.exists(output_dir):
+            os.makedirs(output_dir, mode = 0o777, exist_ok = True)
+
+    def exists(self, output_dir, file_name) -> bool:
+        return os.path.exists(os.path.join(output_dir, file_name))
+
+    @staticmethod
+    def _unchanged(output_file, content: bytes) -> bool:
+        """Check, if the existing file has the same content (size and hash)"""
+        try:
+            if os.path.getsize(output_file) != len(content):
+                return False
+            file_hash = hashlib.blake2b(digest_size = 16)
+            with open(output_file, "rb") as f:
+                while True:
+                    data = f.read(1024 * 1024)
+                    if not data:
+                        break
+                    file_hash.update(data)
+        except OSError:
+            return False
+        return file_hash.digest() == hashlib.blake2b(content, digest_size = 16).digest()
+
+    def write_figure(self, fig, output_dir, file_name, dpi) -> str:
+        with GraphStats.measure("save"):
+            content = OutputTarget.figure_bytes(fig, file_name, dpi)
+        return self.write_bytes(content, output_dir, file_name)
+
+    def write_text(self, content: str, output_dir, file_name, newline = None) -> str:
+        return self.write_bytes(OutputTarget.text_bytes(content, newline), output_dir, file_name)
+
+    def write_bytes(self, content: bytes, output_dir, file_name) -> str:
+        output_file = os.path.join(output_dir, file_name)
+        with GraphStats.measure("save"):
+            if FileTarget._unchanged(output_file, content):
+                GraphStats.increment("identical")
+                logging.info(f"  ... {output_file} (without change)")
+                return output_file
+            with open(output_file, 'wb') as file:
+                file.write(content)
+            logging.info(f"  ... {output_file}")
+        return output_file
+
+
+class MemoryTarget(OutputTarget):
+    """
+    Keep outputs in memory as bytes, the outputs are keyed by file names (without output
+    directory), the caller can supply own dictionary (buffers) for outputs
+    """
+
+    def __init__(self, outputs: dict = None):
+        """
+        :param outputs:         Dictionary for outputs, name of output -> bytes (default is None, new dictionary)
+        """
+        self.outputs = outputs if outputs is not None else {}
+
+    def exists(self, output_dir, file_name) -> bool:
+        return file_name in self.outputs
+
+    def write_figure(self, fig, output_dir, file_name, dpi) -> str:
+        with GraphStats.measure("save"):
+            self.outputs[file_name] = OutputTarget.figure_bytes(fig, file_name, dpi)
+        return file_name
+
+    def write_text(self, content: str, output_dir, file_name, newline = None) -> str:
+        with GraphStats.measure("save"):
+            self.outputs[file_name] = OutputTarget.text_bytes(content, newline)
+        return file_name
+
+    def write_bytes(self, content: bytes, output_dir, file_name) -> str:
+        with GraphStats.measure("save"):
+            self.outputs[file_name] = content
+        return file_name
@@ -0,0 +1,70 @@
+from qgate_graph.percentile_item import PercentileItem
+from qgate_graph.render_context import RenderContext
+
+
+class OutputWriter:
+    """
+    Write aggregated performance data (PercentileItem) into one output format. The data
+    are aggregated only once in GraphPerformance and handed to all writers.
+    """
+    def __init__(self, prefix, extension):
+        """
+        :param prefix:          Prefix of output file name (e.g. "PRF", "CSV", etc.)
+        :param extension:       Extension of output file (e.g. ".png", ".csv", etc.)
+        """
+        self.output_file_format = (prefix, extension)
+
+    def create_output(self, graph, percentiles: {PercentileItem}, title, file_name, output_dir,
+                      context: RenderContext = None) -> str:
+        """
+        Create output
+
+        :param graph:           Graph (GraphPerformance) with setting of outputs
+        :param percentiles:     Aggregated data
+        :param title:           Title of output
+        :param file_name:       Output file name
+        :param output_dir:      Output directory
+        :param context:         Settings for rendering incl. target of output (default is None, file
+                                in output directory)
+        :return:                Generated file
+        """
+        raise NotImplementedError()
+
+
+class GraphWriter(OutputWriter):
+    """Write performance graph in graphical format (*.png or *.svg files)"""
+
+    def __init__(self, image_format = "png"):
+        """
+        :param image_format:    Format of graph "png" or "svg" (default is "png")
+        """
+        super().__init__("PRF", f".{image_format}")
+
+    def create_output(self, graph, percentiles: {PercentileItem}, title, file_name, output_dir,
+                      context: RenderContext = None) -> str:
+        return graph._create_graph(percentiles, title, file_name, output_dir, context)
+
+
+class CsvWriter(OutputWriter):
+    """Write performance table in CSV format (*.csv files)"""
+
+    def __init__(self):
+        super().__init__("CSV", ".csv")
+
+    def create_output(self, graph, percentiles: {PercentileItem}, title, file_name, output_dir,
+                      context: RenderContext = None) -> str:
+        content = graph._create_table(percentiles).get_csv_string(delimiter=',')
+        return (context if context else RenderContext()).target.write_text(content, output_dir, file_name,
+                                                                           newline='')
+
+
+class TxtWriter(OutputWriter):
+    """Write performance table in TXT readable format (*.txt files)"""
+
+    def __init__(self):
+        super().__init__("TXT", ".txt")
+
+    def create_output(self, graph, percentiles: {PercentileItem}, title, file_name, output_dir,
+                      context: RenderContext = None) -> str:
+        content = str(graph._create_table(percentiles))
+        return (context if context else RenderContext()).target.write_text(content, output_dir, file_name)
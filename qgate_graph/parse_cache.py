@@ -0,0 +1,236 @@
+from qgate_graph import __version__ as version
+from qgate_graph.file_marker import FileMarker as const
+from qgate_graph.perf_reader import PerfReader
+from qgate_graph.perf_record import PerfRecord, DetailRecord, RECORD_TYPES
+import os.path, os
+import hashlib
+import pickle
+import logging
+
+
+class ParseCache:
+    """
+    Persistent cache of parsed input files (decoded events from PerfReader). The cache
+    is keyed by path of input file and it is valid only for the same size, modification
+    time (or content hash) of input file and for the decoded types of records. The total
+    size of cache is limited, the least recently used items are evicted.
+
+    The events are stored in compact form, the headers and core records as decoded values
+    and the details as columns (init, start, end, err) in separate part of cache item, so that
+    graphs without details (e.g. GraphPerformance) do not load them.
+
+        example::
+
+            from qgate_graph.parse_cache import ParseCache
+            from qgate_graph.graph_performance import GraphPerformance
+
+            graph = GraphPerformance()
+            graph.generate_from_dir("input_adr", "output_adr", cache = ParseCache("cache_adr"))
+    """
+
+    # extension of cache items
+    EXTENSION = ".qgcache"
+
+    # the eviction reduces the size under this ratio of maximal size (the directory is not scanned for each new item)
+    EVICT_RATIO = 0.9
+
+    # format of cached events (change in case of change of events/records)
+    FORMAT = 3
+
+    def __init__(self, cache_dir: str, max_size = 1024 * 1024 * 1024):
+        """
+        :param cache_dir:       Directory for cache items
+        :param max_size:        Maximal size of cache in bytes (default is 1 GB)
+        """
+        self._cache_dir = cache_dir
+        self._max_size = max_size
+        self._disk_size = None
+
+    def _item_file(self, input_file) -> str:
+        key = hashlib.sha1(os.path.abspath(input_file).encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self._cache_dir, f"{os.path.basename(input_file)}-{key}{ParseCache.EXTENSION}")
+
+    @staticmethod
+    def _content_hash(input_file) -> str:
+        content_hash = hashlib.blake2b(digest_size = 16)
+        with open(input_file, "rb") as f:
+            while True:
+                data = f.read(1024 * 1024)
+                if not data:
+                    break
+                content_hash.update(data)
+        return content_hash.hexdigest()
+
+    @staticmethod
+    def _compact(events) -> tuple:
+        """Split events to main events (details as amount of consecutive details) and columns of details"""
+        main = []
+        details = ([], [], [], [])
+        init, start, end, err = details
+        for event_type, record in events:
+            if event_type == const.PRF_DETAIL_TYPE:
+                if main and main[-1][0] == const.PRF_DETAIL_TYPE:
+                    main[-1] = (const.PRF_DETAIL_TYPE, main[-1][1] + 1)
+                else:
+                    main.append((const.PRF_DETAIL_TYPE, 1))
+                init.append(record.init)
+                start.append(record.start)
+                end.append(record.end)
+                err.append(record.err)
+            else:
+                main.append((event_type, record.data if isinstance(record, PerfRecord) else record))
+        return main, details
+
+    @staticmethod
+    def _expand(main, details, record_types):
+        """Create events from main events and columns of details (without details, if they are not loaded)"""
+        index = 0
+        for event_type, data in main:
+            if event_type == const.PRF_DETAIL_TYPE:
+                if details is not None:
+                    for init, start, end, err in zip(*[column[index:index + data] for column in details]):
+                        yield event_type, DetailRecord({const.PRF_DETAIL_TIME_INIT: init,
+                                                        const.PRF_DETAIL_TIME_START: start,
+                                                        const.PRF_DETAIL_TIME_END: end,
+                                                        const.PRF_DETAIL_ERR: err})
+                index += data
+            elif event_type == PerfReader.SEPARATOR:
+                yield event_type, None
+            elif record_types is None or event_type in record_types:
+                record_type = RECORD_TYPES.get(event_type)
+                yield event_type, record_type(data) if record_type else data
+
+    def get(self, input_file, record_types: set = None):
+        """
+        Get parsed events for input file
+
+        :param input_file:      Input file
+        :param record_types:    Types of records, e.g. {'headr', 'core'} (default is None, all types)
+        :return:                Iterable of events or None (missing or invalid cache item, or item
+                                without requested types of records)
+        """
+        item_file = self._item_file(input_file)
+        if not os.path.exists(item_file):
+            return None
+        try:
+            stat = os.stat(input_file)
+            with open(item_file, "rb") as f:
+                fingerprint = pickle.load(f)
+                if (fingerprint["version"] != version or fingerprint.get("format") != ParseCache.FORMAT or
+                        fingerprint["size"] != stat.st_size):
+                    return None
+                cached_types = fingerprint["record_types"]
+                if cached_types is not None and (record_types is None or not set(record_types) <= set(cached_types)):
+                    return None
+                if fingerprint["mtime_ns"] != stat.st_mtime_ns:
+                    # touched file, check the content
+                    if fingerprint["hash"] != ParseCache._content_hash(input_file):
+                        return None
+                main = pickle.load(f)
+
+                # the details are loaded only on request
+                details = None
+                if record_types is None or const.PRF_DETAIL_TYPE in record_types:
+                    details = pickle.load(f)
+
+            # update time of usage (for eviction of least recently used items)
+            os.utime(item_file)
+            return ParseCache._expand(main, details, record_types)
+        except Exception as ex:
+            logging.info(f"  ... Invalid cache item '{item_file}', '{type(ex)}'")
+            return None
+
+    def put(self, input_file, events, record_types: set = None):
+        """
+        Store parsed events for input file
+
+        :param input_file:      Input file
+        :param events:          Iterable of events
+        :param record_types:    Types of decoded records in events (default is None, all types)
+        """
+        os.makedirs(self._cache_dir, mode = 0o777, exist_ok = True)
+        stat = os.stat(input_file)
+        fingerprint = {"version": version,
+                       "format": ParseCache.FORMAT,
+                       "path": os.path.abspath(input_file),
+                       "size": stat.st_size,
+                       "mtime_ns": stat.st_mtime_ns,
+                       "hash": ParseCache._content_hash(input_file),
+                       "record_types": sorted(record_types) if record_types is not None else None}
+        main, details = ParseCache._compact(events)
+
+        # write to temporary file and replace (safe for more processes)
+        item_file = self._item_file(input_file)
+        tmp_file = f"{item_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "wb") as f:
+            pickle.dump(fingerprint, f, protocol = pickle.HIGHEST_PROTOCOL)
+            pickle.dump(main, f, protocol = pickle.HIGHEST_PROTOCOL)
+            pickle.dump(details, f, protocol = pickle.HIGHEST_PROTOCOL)
+        old_size = ParseCache._file_size(item_file)
+        os.replace(tmp_file, item_file)
+
+        # running total of size (the directory is scanned only for the first time and for eviction)
+        if self._disk_size is None:
+            self._scan()
+        else:
+            self._disk_size += ParseCache._file_size(item_file) - old_size
+        if self._disk_size > self._max_size:
+            self.evict()
+
+    def _scan(self) -> list:
+        """Scan cache items (time of usage, size, path) and update the total size"""
+        items = []
+        total_size = 0
+        if os.path.exists(self._cache_dir):
+            for entry in os.scandir(self._cache_dir):
+                if entry.name.endswith(ParseCache.EXTENSION):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    items.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                    total_size += stat.st_size
+        self._disk_size = total_size
+        return items
+
+    @staticmethod
+    def _file_size(path) -> int:
+        try:
+            return os.path.getsize(path)
+        except FileNotFoundError:
+            return 0
+
+    def evict(self):
+        """Remove the least recently used items , if the size of cache is over the limit"""
+        items = self._scan()
+        if self._disk_size <= self._max_size:
+            return
+        for mtime_ns, size, path in sorted(items):
+            if self._disk_size <= self._max_size * ParseCache.EVICT_RATIO:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self._disk_size -= size
+
+    def clear(self, input_file = None):
+        """
+        Invalidate cache
+
+        :param input_file:      Invalidate only the item for this input file (default is None, all items)
+        """
+        if input_file:
+            item_files = [self._item_file(input_file)]
+        elif os.path.exists(self._cache_dir):
+            item_files = [entry.path for entry in os.scandir(self._cache_dir) if entry.name.endswith(ParseCache.EXTENSION)]
+        else:
+            item_files = []
+        for item_file in item_files:
+            try:
+                os.remove(item_file)
+            except FileNotFoundError:
+                pass
+
+        # the total size is scanned again in the next put
+        self._disk_size = None
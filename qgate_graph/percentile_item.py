@@ -1,6 +1,14 @@
+from array import array
 
 
 class PercentileItem:
+    """
+    Aggregated values for one percentile, each series is stored for each group in compact
+    array (the arrays support buffer protocol, so matplotlib/numpy use them without copy).
+    The series with integral values (e.g. 'total_call_per_sec': 12) are stored in list,
+    so that the values are formatted in tables and labels the same as in input (12, not 12.0).
+    """
+    __slots__ = ("percentile", "executors", "total_performance", "avrg_time", "std_deviation", "min", "max")
 
     def __init__(self, percentile):
 
@@ -12,3 +20,40 @@ class PercentileItem:
         self.min = {}
         self.max = {}
 
+    def append(self, group, executors, total_performance, avrg_time, std_deviation = None, min = None, max = None):
+        """
+        Append values of one plan to all series of the group
+
+        :param group:               Group (line in graph)
+        :param executors:           Amount of executors
+        :param total_performance:   Total performance (calls per second)
+        :param avrg_time:           Average response time
+        :param std_deviation:       Optional standard deviation of response time (0.0 for missing value)
+        :param min:                 Optional minimal response time (missing value is not appended)
+        :param max:                 Optional maximal response time (missing value is not appended)
+        """
+        if group not in self.executors:
+            self.executors[group] = array("q")
+        self.executors[group].append(executors)
+        PercentileItem._append(self.total_performance, group, total_performance)
+        PercentileItem._append(self.avrg_time, group, avrg_time)
+        PercentileItem._append(self.std_deviation, group, std_deviation if std_deviation else 0.0)
+        if min:
+            PercentileItem._append(self.min, group, min)
+        if max:
+            PercentileItem._append(self.max, group, max)
+
+    @staticmethod
+    def _append(series, group, value):
+        """Append value to series of the group (array of floats, list after first integral value)"""
+        values = series.get(group)
+        if values is None:
+            values = series[group] = array("d")
+        if isinstance(values, array):
+            if not isinstance(value, int):
+                values.append(value)
+                return
+            values = series[group] = list(values)
+        elif not isinstance(value, (int, float)):
+            raise TypeError(f"must be real number, not {type(value).__name__}")
+        values.append(value)
@@ -0,0 +1,79 @@
+import json
+
+
+class PerfDecoder:
+    """
+    Decoder of JSON lines with the fastest available backend, 'orjson' or 'msgspec'
+    (optional packages, see extra 'fast') with fallback to standard 'json'. The line,
+    which is not valid for fast backend (e.g. NaN values), is decoded by standard 'json'.
+
+        example::
+
+            from qgate_graph.perf_decoder import PerfDecoder
+
+            decoder = PerfDecoder("json")
+            print(decoder.backend, decoder.decode('{"type": "headr"}'))
+    """
+
+    # backends in order of preference
+    BACKENDS = ["orjson", "msgspec", "json"]
+
+    _default = None
+
+    def __init__(self, backend = "auto"):
+        """
+        :param backend:     Name of backend 'orjson', 'msgspec', 'json' or 'auto' (default, the fastest
+                            available backend)
+        """
+        if backend == "auto":
+            for name in PerfDecoder.BACKENDS:
+                if PerfDecoder._load_backend(name):
+                    backend = name
+                    break
+        loads = PerfDecoder._load_backend(backend)
+        if loads is None:
+            raise ValueError(f"Unknown or missing decoder backend '{backend}', expected one of {PerfDecoder.BACKENDS}")
+        self.backend = backend
+        self._loads = loads
+
+    @staticmethod
+    def _load_backend(name):
+        """Return decode function of backend (None, backend is not available)"""
+        try:
+            if name == "orjson":
+                import orjson
+                return orjson.loads
+            if name == "msgspec":
+                import msgspec
+                return msgspec.json.Decoder().decode
+            if name == "json":
+                return json.loads
+        except ImportError:
+            pass
+        return None
+
+    @staticmethod
+    def default():
+        """Shared decoder with the fastest available backend"""
+        if PerfDecoder._default is None:
+            PerfDecoder._default = PerfDecoder()
+        return PerfDecoder._default
+
+    def decode(self, line: str):
+        """
+        Decode JSON line
+
+        :param line:        Line with JSON
+        :return:            Decoded value
+        :raise ValueError:  Invalid JSON
+        """
+        try:
+            return self._loads(line)
+        except Exception as ex:
+            if self._loads is json.loads:
+                raise ValueError(str(ex)) from ex
+        # value without support in fast backend (e.g. NaN, Infinity, large integer)
+        try:
+            return json.loads(line)
+        except Exception as ex:
+            raise ValueError(str(ex)) from ex
@@ -0,0 +1,129 @@
+from qgate_graph.file_marker import FileMarker as const
+from qgate_graph.graph_stats import GraphStats
+from qgate_graph.perf_decoder import PerfDecoder
+from qgate_graph.perf_record import RECORD_TYPES
+import logging
+
+
+class PerfReader:
+    """
+    Read input stream (output from qgate-perf) and provide typed events (header, detail,
+    core and separator) with decoded records (HeaderRecord, DetailRecord, CoreRecord). The
+    stream is parsed only once and the events can be shared by more graphs/outputs. The
+    invalid lines are reported (with line number) and skipped.
+
+        example::
+
+            from qgate_graph.perf_reader import PerfReader
+
+            with open("input/perf_test.txt") as f:
+                for event_type, record in PerfReader(f):
+                    print(event_type, record)
+    """
+
+    # event type for separator line (line with prefix '#')
+    SEPARATOR = "#"
+
+    def __init__(self, stream, decoder: PerfDecoder = None, record_types: set = None, first_line = 1):
+        """
+        :param stream:          Input text stream (file, StringIO, etc.)
+        :param decoder:         Decoder of JSON lines (default is None, the fastest available decoder)
+        :param record_types:    Types of records for decoding, e.g. {'headr', 'core'} (default is None,
+                                all types). The lines with other types are skipped without decoding
+                                (based on cheap detection of line type).
+        :param first_line:      Number of the first line in stream, e.g. for part of input file (default is 1)
+        """
+        self._stream = stream
+        self._decoder = decoder if decoder else PerfDecoder.default()
+        self._record_types = record_types
+        self._first_line = first_line
+        self.invalid_lines = []
+
+    @staticmethod
+    def load_json(line):
+        try:
+            return PerfDecoder.default().decode(line)
+        except Exception as ex:
+            pass
+
+    @staticmethod
+    def line_type(line):
+        """
+        Cheap detection of line type without JSON decoding
+
+        :param line:        Line from input stream
+        :return:            Type of line (SEPARATOR, value of 'type' or None for unknown line)
+        """
+        if line[:1] == '#':
+            return PerfReader.SEPARATOR
+        pos = line.find('"type"')
+        if pos < 0:
+            return None
+        start = line.find('"', line.find(':', pos + 6) + 1)
+        if start < 0:
+            return None
+        end = line.find('"', start + 1)
+        return line[start + 1:end] if end > 0 else None
+
+    def _event(self, line_number, line):
+        """Decode line to event (event type, record), None for empty, invalid or skipped line"""
+        if self._record_types is not None:
+            line_type = PerfReader.line_type(line)
+            if line_type is not None and line_type not in self._record_types:
+                return None
+        try:
+            input_dict = self._decoder.decode(line)
+        except ValueError:
+            input_dict = None
+        if not isinstance(input_dict, dict):
+            if line.strip():
+                self._invalid(line_number, line)
+            return None
+        if not input_dict:
+            return None
+        event_type = input_dict.get(const.PRF_TYPE)
+        record_type = RECORD_TYPES.get(event_type)
+        return event_type, record_type(input_dict) if record_type else input_dict
+
+    def _invalid(self, line_number, line):
+        """Report invalid line (the line is skipped)"""
+        self.invalid_lines.append(line_number)
+        GraphStats.increment("invalid")
+        logging.warning(f"  ... Invalid line {line_number}: '{line.strip()[:80]}'")
+
+    def __iter__(self):
+        stats = GraphStats.current()
+        if stats:
+            yield from self._iter_stats(stats)
+            return
+
+        line_number = self._first_line - 1
+        while True:
+            line = self._stream.readline()
+            if not line:
+                break
+            line_number += 1
+            if line[0] == '#':
+                yield PerfReader.SEPARATOR, None
+                continue
+            event = self._event(line_number, line)
+            if event:
+                yield event
+
+    def _iter_stats(self, stats: GraphStats):
+        """The same iteration with measurement of read and decode"""
+        line_number = self._first_line - 1
+        while True:
+            with stats.stage("read"):
+                line = self._stream.readline()
+            if not line:
+                break
+            line_number += 1
+            stats.count("lines")
+            if line[0] == '#':
+                yield PerfReader.SEPARATOR, None
+                continue
+            with stats.stage("decode"):
+                event = self._event(line_number, line)
+            if event:
+                yield event
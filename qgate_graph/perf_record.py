@@ -0,0 +1,112 @@
+from qgate_graph.file_marker import FileMarker as const
+
+
+class PerfRecord:
+    """
+    Decoded line of input (output from qgate-perf) with typed access to the used values.
+    All values are available also via dict access (e.g. record[const.PRF_HDR_HOST]) for
+    compatibility with processing of decoded dict.
+    """
+    __slots__ = ("data",)
+
+    def __init__(self, data: dict):
+        """
+        :param data:        Decoded JSON line
+        """
+        self.data = data
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def get(self, key, default = None):
+        return self.data.get(key, default)
+
+    def __getstate__(self):
+        return self.data
+
+    def __setstate__(self, state):
+        self.__init__(state)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.data == other.data
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.data})"
+
+
+class HeaderRecord(PerfRecord):
+    """Header of run (label, date, bulk, duration, response unit and percentile)"""
+    __slots__ = ("label", "now", "bulk", "duration", "response_unit", "percentile")
+
+    def __init__(self, data: dict):
+        super().__init__(data)
+        self.label = data.get(const.PRF_HDR_LABEL)
+        self.now = data.get(const.PRF_HDR_NOW)
+        self.bulk = data.get(const.PRF_HDR_BULK)
+        self.duration = int(data.get(const.PRF_HDR_DURATION, -1))
+        self.response_unit = data.get(const.PRF_HDR_RESPONSE_UNIT, "sec")
+        self.percentile = data.get(const.PRF_HDR_PERCENTILE, 1)
+
+
+class DetailRecord(PerfRecord):
+    """Detail of one executor (error and times of init, start and end)"""
+    __slots__ = ("err", "init", "start", "end")
+
+    def __init__(self, data: dict):
+        super().__init__(data)
+        self.err = data.get(const.PRF_DETAIL_ERR)
+        self.init = data.get(const.PRF_DETAIL_TIME_INIT)
+        self.start = data.get(const.PRF_DETAIL_TIME_START)
+        self.end = data.get(const.PRF_DETAIL_TIME_END)
+
+
+class CoreMetrics:
+    """Core values for one percentile (None for missing value)"""
+    __slots__ = ("total_call_per_sec", "total_call_per_sec_raw", "avrg_time", "std_deviation", "min", "max")
+
+    def __init__(self, data: dict, suffix = ""):
+        """
+        :param data:        Decoded core line
+        :param suffix:      Suffix of keys for percentile (e.g. '_95', '' for all values)
+        """
+        self.total_call_per_sec = data.get(const.PRF_CORE_TOTAL_CALL_PER_SEC + suffix)
+        self.total_call_per_sec_raw = data.get(const.PRF_CORE_TOTAL_CALL_PER_SEC_RAW + suffix)
+        self.avrg_time = data.get(const.PRF_CORE_AVRG_TIME + suffix)
+        self.std_deviation = data.get(const.PRF_CORE_STD_DEVIATION + suffix)
+        self.min = data.get(const.PRF_CORE_MIN + suffix)
+        self.max = data.get(const.PRF_CORE_MAX + suffix)
+
+
+class CoreRecord(PerfRecord):
+    """Core output of one plan (group, executors, end time and values for percentiles)"""
+    __slots__ = ("group", "real_executors", "plan_executors_detail", "end", "_metrics")
+
+    def __init__(self, data: dict):
+        super().__init__(data)
+        self.group = data.get(const.PRF_CORE_GROUP)
+        self.real_executors = data.get(const.PRF_CORE_REAL_EXECUTOR)
+        self.plan_executors_detail = data.get(const.PRF_CORE_PLAN_EXECUTOR)
+        self.end = data.get(const.PRF_CORE_TIME_END)
+        self._metrics = {}
+
+    def metrics(self, percentile = 1) -> CoreMetrics:
+        """
+        Return values for percentile (keys with suffix such as '_95' for percentile 0.95)
+
+        :param percentile:  Percentile (1 is without percentile)
+        :return:            Values for percentile
+        """
+        metrics = self._metrics.get(percentile)
+        if metrics is None:
+            metrics = CoreMetrics(self.data, f"_{int(percentile * 100)}" if percentile < 1 else "")
+            self._metrics[percentile] = metrics
+        return metrics
+
+
+# record type for each type of line
+RECORD_TYPES = {const.PRF_HDR_TYPE: HeaderRecord,
+                const.PRF_DETAIL_TYPE: DetailRecord,
+                const.PRF_CORE_TYPE: CoreRecord}
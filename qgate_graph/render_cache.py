@@ -0,0 +1,223 @@
+from qgate_graph import __version__ as version
+from collections import OrderedDict
+import os.path, os
+import hashlib
+import threading
+import logging
+
+
+class RenderCache:
+    """
+    Content addressed cache of rendered graphs (bytes of PNG/SVG). The cache is keyed by hash
+    of aggregated data, title and render parameters (see key), so that the same graph is not
+    rendered again by matplotlib (e.g. rerun with other output directory). The items are kept
+    in memory and optionally on disk, the total size of both levels is limited and the least
+    recently used items are evicted.
+
+        example::
+
+            from qgate_graph.render_cache import RenderCache
+            from qgate_graph.graph_performance import GraphPerformance
+
+            graph = GraphPerformance(render_cache = RenderCache("cache_adr"))
+            graph.generate_from_dir("input_adr", "output_adr")
+    """
+
+    # extension of cache items (on disk)
+    EXTENSION = ".qgrender"
+
+    # the eviction reduces the size under this ratio of maximal size (the directory is not scanned for each new item)
+    EVICT_RATIO = 0.9
+
+    def __init__(self, cache_dir: str = None, max_size = 256 * 1024 * 1024, memory_size = 32 * 1024 * 1024):
+        """
+        :param cache_dir:       Directory for cache items (default is None, only in memory)
+        :param max_size:        Maximal size of cache on disk in bytes (default is 256 MB)
+        :param memory_size:     Maximal size of cache in memory in bytes (default is 32 MB, 0 is without memory)
+        """
+        self._cache_dir = cache_dir
+        self._max_size = max_size
+        self._memory_size = memory_size
+        self._memory = OrderedDict()
+        self._memory_used = 0
+        self._disk_size = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # the memory and lock are not shared with other processes (only the disk)
+        state = self.__dict__.copy()
+        state["_memory"] = OrderedDict()
+        state["_memory_used"] = 0
+        state["_disk_size"] = None
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _update(key_hash, part):
+        if hasattr(part, "tobytes"):
+            # array of values (array, numpy)
+            key_hash.update(f"{type(part).__name__}:{getattr(part, 'typecode', '')}:{len(part)}:".encode("utf-8"))
+            key_hash.update(part.tobytes())
+        elif isinstance(part, dict):
+            key_hash.update(f"dict:{len(part)}:".encode("utf-8"))
+            for key, value in part.items():
+                RenderCache._update(key_hash, key)
+                RenderCache._update(key_hash, value)
+        elif isinstance(part, (list, tuple)):
+            key_hash.update(f"list:{len(part)}:".encode("utf-8"))
+            for value in part:
+                RenderCache._update(key_hash, value)
+        elif hasattr(part, "__slots__"):
+            # aggregated values (e.g. PercentileItem)
+            key_hash.update(f"{type(part).__name__}:".encode("utf-8"))
+            for name in part.__slots__:
+                RenderCache._update(key_hash, getattr(part, name))
+        else:
+            key_hash.update(f"{type(part).__name__}:{part!r};".encode("utf-8"))
+
+    @staticmethod
+    def key(*parts) -> str:
+        """
+        Create key of cache item, the order of items in dictionaries and lists is significant
+        (it influences the rendering)
+
+        :param parts:           Parts of key e.g. aggregated data, title, dpi, precision, etc.
+        :return:                Key (hexadecimal hash)
+        """
+        key_hash = hashlib.blake2b(digest_size = 20)
+        RenderCache._update(key_hash, version)
+        for part in parts:
+            RenderCache._update(key_hash, part)
+        return key_hash.hexdigest()
+
+    def _item_file(self, key) -> str:
+        return os.path.join(self._cache_dir, f"{key}{RenderCache.EXTENSION}")
+
+    def _remember(self, key, content: bytes):
+        if len(content) > self._memory_size:
+            return
+        with self._lock:
+            old = self._memory.pop(key, None)
+            if old is not None:
+                self._memory_used -= len(old)
+            self._memory[key] = content
+            self._memory_used += len(content)
+            while self._memory_used > self._memory_size:
+                _, evicted = self._memory.popitem(last = False)
+                self._memory_used -= len(evicted)
+
+    def get(self, key) -> bytes:
+        """
+        Get rendered output
+
+        :param key:             Key of cache item, see key
+        :return:                Bytes of rendered output or None (missing item)
+        """
+        with self._lock:
+            content = self._memory.get(key)
+            if content is not None:
+                self._memory.move_to_end(key)
+                return content
+
+        if not self._cache_dir:
+            return None
+        item_file = self._item_file(key)
+        try:
+            with open(item_file, "rb") as f:
+                content = f.read()
+
+            # update time of usage (for eviction of least recently used items)
+            os.utime(item_file)
+        except FileNotFoundError:
+            return None
+        except Exception as ex:
+            logging.info(f"  ... Invalid cache item '{item_file}', '{type(ex)}'")
+            return None
+        self._remember(key, content)
+        return content
+
+    def put(self, key, content: bytes):
+        """
+        Store rendered output
+
+        :param key:             Key of cache item, see key
+        :param content:         Bytes of rendered output
+        """
+        self._remember(key, content)
+        if not self._cache_dir:
+            return
+
+        # write to temporary file and replace (safe for more processes)
+        os.makedirs(self._cache_dir, mode = 0o777, exist_ok = True)
+        item_file = self._item_file(key)
+        tmp_file = f"{item_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(content)
+        old_size = RenderCache._file_size(item_file)
+        os.replace(tmp_file, item_file)
+
+        # running total of size (the directory is scanned only for the first time and for eviction)
+        with self._lock:
+            if self._disk_size is None:
+                self._scan()
+            else:
+                self._disk_size += RenderCache._file_size(item_file) - old_size
+            if self._disk_size > self._max_size:
+                self.evict()
+
+    def _scan(self) -> list:
+        """Scan cache items (time of usage, size, path) and update the total size"""
+        items = []
+        total_size = 0
+        if os.path.exists(self._cache_dir):
+            for entry in os.scandir(self._cache_dir):
+                if entry.name.endswith(RenderCache.EXTENSION):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    items.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                    total_size += stat.st_size
+        self._disk_size = total_size
+        return items
+
+    @staticmethod
+    def _file_size(path) -> int:
+        try:
+            return os.path.getsize(path)
+        except FileNotFoundError:
+            return 0
+
+    def evict(self):
+        """Remove the least recently used items on disk, if the size of cache is over the limit"""
+        if not self._cache_dir or not os.path.exists(self._cache_dir):
+            return
+        items = self._scan()
+        if self._disk_size <= self._max_size:
+            return
+        for mtime_ns, size, path in sorted(items):
+            if self._disk_size <= self._max_size * RenderCache.EVICT_RATIO:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self._disk_size -= size
+
+    def clear(self):
+        """Invalidate cache (in memory and on disk)"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_used = 0
+            self._disk_size = None
+        if self._cache_dir and os.path.exists(self._cache_dir):
+            for entry in os.scandir(self._cache_dir):
+                if entry.name.endswith(RenderCache.EXTENSION):
+                    try:
+                        os.remove(entry.path)
+                    except FileNotFoundError:
+                        pass
@@ -0,0 +1,29 @@
+from qgate_graph.output_target import OutputTarget, FileTarget
+from qgate_graph.render_cache import RenderCache
+
+
+class RenderContext:
+    """
+    Settings for rendering of outputs of one processed input stream (target of outputs, response
+    time unit, dpi and precision). Each stream has its own context, so that concurrent generation
+    in more threads (or async tasks) in one process does not share mutable settings.
+    """
+
+    def __init__(self, target: OutputTarget = None, response_time_unit = "sec", dpi = 100,
+                 min_precision = 0, max_precision = 4, render_cache: RenderCache = None):
+        """
+        :param target:              Target of outputs (default is None, files in output directory)
+        :param response_time_unit:  Unit of response time, it is updated based on header of each block
+                                    (default is "sec")
+        :param dpi:                 Quality of graphs in DPI (default is 100 DPI)
+        :param min_precision:       Minimal precision of numbers in graph (default is 0)
+        :param max_precision:       Maximal precision of numbers in graph (default is 4)
+        :param render_cache:        Cache of rendered graphs (default is None, without cache)
+        """
+        self.target = target if target else FileTarget()
+        self.response_time_unit = response_time_unit
+        self.dpi = dpi
+        self.min_precision = min_precision
+        self.max_precision = max_precision
+        self.max_precision_format = "{num:." + str(max_precision) + "f}"
+        self.render_cache = render_cache
@@ -0,0 +1,48 @@
+from qgate_graph.percentile_item import PercentileItem
+from qgate_graph.render_context import RenderContext
+
+
+class StreamState:
+    """State of one processed input stream (the common part for all graphs)"""
+
+    def __init__(self, output_dir, suppress_error = False, manifest = None, context: RenderContext = None):
+        self.output_dir = output_dir
+        # copy dir because the path can be modificated (based on duration and date)
+        self.output_dir_target = output_dir
+        self.suppress_error = suppress_error
+        self.output_list = []
+        # settings for rendering (target of outputs, response time unit, etc.)
+        self.context = context if context else RenderContext()
+
+        # manifest of outputs (for only_new) and order of current block in input
+        self.manifest = manifest
+        self.block_number = -1
+
+        # items from header
+        self.file_name = None
+        self.title = None
+        self.start_date = None
+        self.report_date = None
+        self.label = None
+        self.bulk = None
+        self.duration = -1
+
+
+class PerformanceState(StreamState):
+    """State of one processed input stream for performance graphs"""
+
+    def __init__(self, output_dir, suppress_error = False, manifest = None, context: RenderContext = None):
+        super().__init__(output_dir, suppress_error, manifest, context)
+        self.percentiles = {1: PercentileItem(1)}
+        # pairs (writer, file name) for outputs of current block
+        self.outputs = []
+
+
+class ExecutorState(StreamState):
+    """State of one processed input stream for executors graphs"""
+
+    def __init__(self, output_dir, suppress_error = False, manifest = None, context: RenderContext = None):
+        super().__init__(output_dir, suppress_error, manifest, context)
+        self.executors = {}
+        self.executor = []
+        self.end_date = None
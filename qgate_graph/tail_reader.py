@@ -0,0 +1,100 @@
+import os.path, os
+import logging
+import time
+
+
+class TailReader:
+    """
+    Read growing file (such as live output from qgate-perf) line by line, the reader
+    waits for new complete lines. The reader tracks offset of processed bytes, so that
+    the earlier bytes are not read again (also after restart with the offset).
+
+        example::
+
+            from qgate_graph.tail_reader import TailReader
+            from qgate_graph.perf_reader import PerfReader
+
+            with TailReader("input/perf_test.txt", idle_timeout = 60) as f:
+                for event_type, record in PerfReader(f):
+                    print(event_type, record)
+                print(f.separator_offset)
+    """
+
+    def __init__(self, input_file, offset = 0, poll_interval = 1.0, idle_timeout = None, stop = None):
+        """
+        :param input_file:      Input file
+        :param offset:          Byte offset for start of reading (default is 0, from the beginning),
+                                it has to be on the start of line
+        :param poll_interval:   Interval in seconds for check of new data (default is 1 second)
+        :param idle_timeout:    End of reading after the time in seconds without new data (default is None,
+                                without end)
+        :param stop:            Event for end of reading such as threading.Event (default is None)
+        """
+        self._input_file = input_file
+        self._poll_interval = poll_interval
+        self._idle_timeout = idle_timeout
+        self._stop = stop
+        self._buffer = b""
+        self._file = open(input_file, "rb")
+        self._file.seek(offset)
+        self._last_data = time.monotonic()
+
+        # offset after the last complete line
+        self.offset = offset
+        # offset after the last separator line (safe point for restart of processing)
+        self.separator_offset = offset
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        self._file.close()
+
+    def _line(self, data: bytes) -> str:
+        self.offset += len(data)
+        line = data.decode("utf-8")
+        if line[:1] == '#':
+            self.separator_offset = self.offset
+        return line
+
+    def _finished(self) -> bool:
+        if self._stop is not None and self._stop.is_set():
+            return True
+        return self._idle_timeout is not None and time.monotonic() - self._last_data >= self._idle_timeout
+
+    def _check_truncate(self):
+        """Start from the beginning, if the file was truncated (e.g. new run of tests)"""
+        if os.path.getsize(self._input_file) < self.offset + len(self._buffer):
+            logging.info(f"  ... '{self._input_file}' was truncated, reading from the beginning")
+            self._file.seek(0)
+            self._buffer = b""
+            self.offset = 0
+            self.separator_offset = 0
+
+    def readline(self) -> str:
+        """
+        Return the next complete line, wait for new data if needed
+
+        :return:        Line or empty string for end of reading (stop or idle timeout)
+        """
+        while True:
+            data = self._file.readline()
+            if data:
+                self._last_data = time.monotonic()
+                self._buffer += data
+                if self._buffer.endswith(b"\n"):
+                    data, self._buffer = self._buffer, b""
+                    return self._line(data)
+                continue
+
+            if self._finished():
+                # the last line without end of line
+                if self._buffer:
+                    data, self._buffer = self._buffer, b""
+                    return self._line(data)
+                return ""
+            self._check_truncate()
+            time.sleep(self._poll_interval)
@@ -0,0 +1,76 @@
+import os
+import unittest
+import logging
+from os import path
+import shutil
+from io import StringIO
+from benchmarks.synthetic_log import SyntheticLog
+from benchmarks.bench import Benchmark
+from qgate_graph.graph_performance import GraphPerformance
+from qgate_graph.graph_executor import GraphExecutor
+from qgate_graph.perf_reader import PerfReader
+
+
+class TestCaseBenchmark(unittest.TestCase):
+
+    OUTPUT_ADR = "output/test_benchmark/"
+    INPUT_FILE = "input/prf_cassandra_02.txt"
+    PREFIX = "."
+
+    @classmethod
+    def setUpClass(cls):
+        logging.basicConfig()
+        logging.getLogger().setLevel(logging.INFO)
+
+        # setup relevant path
+        prefix = "."
+        if not os.path.isfile(path.join(prefix, TestCaseBenchmark.INPUT_FILE)):
+            prefix=".."
+        TestCaseBenchmark.OUTPUT_ADR = path.join(prefix,TestCaseBenchmark.OUTPUT_ADR)
+
+        # clean directory
+        shutil.rmtree(TestCaseBenchmark.OUTPUT_ADR, True)
+        os.makedirs(TestCaseBenchmark.OUTPUT_ADR, exist_ok = True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def test_synthetic_log(self):
+        """Synthetic log in the same format as the input files"""
+        log = SyntheticLog(runs = 3, groups = 2, executors = [1, 2, 4], percentile = 0.95)
+        events = list(PerfReader(StringIO(log.text())))
+        self.assertTrue(len([event for event in events if event[0] == "headr"]) == 3)
+        self.assertTrue(len([event for event in events if event[0] == "core"]) == 3 * 2 * 3)
+        self.assertTrue(len([event for event in events if event[0] == "detail"]) == 3 * 2 * (1 + 2 + 4))
+
+        # the same seed, the same log
+        self.assertTrue(log.text() == SyntheticLog(runs = 3, groups = 2, executors = [1, 2, 4], percentile = 0.95).text())
+
+        input_file = path.join(self.OUTPUT_ADR, "synthetic.txt")
+        log.write(input_file)
+        self.assertTrue(len(GraphPerformance().generate_from_file(input_file, self.OUTPUT_ADR)) == 3)
+        self.assertTrue(len(GraphExecutor().generate_from_file(input_file, self.OUTPUT_ADR)) == 3 * 2 * 3)
+
+    def test_details(self):
+        """Synthetic log with fixed amount of details"""
+        log = SyntheticLog(runs = 1, groups = 1, executors = [8, 16], details = 2)
+        events = list(PerfReader(StringIO(log.text())))
+        self.assertTrue(len([event for event in events if event[0] == "detail"]) == 4)
+
+    def test_benchmark(self):
+        """Measure all stages and compare with baseline"""
+        result = Benchmark(SyntheticLog(runs = 2, groups = 1, executors = [1, 2]), repeat = 1, render_limit = 1).run()
+        self.assertTrue(list(result["stages"].keys()) == ["parse", "aggregate_performance", "aggregate_executor",
+                                                          "create_table", "create_graph", "show_graph"])
+        for stage in result["stages"].values():
+            self.assertTrue(stage["seconds"] > 0)
+
+        self.assertTrue(Benchmark.compare(result, result) == [])
+        slower = {"stages": {"parse": dict(result["stages"]["parse"],
+                                           per_item = result["stages"]["parse"]["per_item"] * 2)}}
+        self.assertTrue(Benchmark.compare(slower, result) == ["parse"])
+
+        baseline_file = path.join(self.OUTPUT_ADR, "baseline.json")
+        Benchmark.save_baseline(result, baseline_file)
+        self.assertTrue(Benchmark.load_baseline(baseline_file) == result)
@@ -0,0 +1,73 @@
+import os
+import unittest
+import logging
+from os import path
+import shutil
+from qgate_graph.block_index import BlockIndex
+from qgate_graph.graph_performance import GraphPerformance
+from qgate_graph.graph_executor import GraphExecutor
+
+
+class TestCaseBlockIndex(unittest.TestCase):
+
+    OUTPUT_ADR = "output/test_block_index/"
+    INPUT_FILE = "input/prf_cassandra_02.txt"
+    INPUT_ADR = "input"
+    PREFIX = "."
+
+    @classmethod
+    def setUpClass(cls):
+        logging.basicConfig()
+        logging.getLogger().setLevel(logging.INFO)
+
+        # setup relevant path
+        prefix = "."
+        if not os.path.isfile(path.join(prefix, TestCaseBlockIndex.INPUT_FILE)):
+            prefix=".."
+        TestCaseBlockIndex.OUTPUT_ADR = path.join(prefix,TestCaseBlockIndex.OUTPUT_ADR)
+        TestCaseBlockIndex.INPUT_FILE = path.join(prefix, TestCaseBlockIndex.INPUT_FILE)
+        TestCaseBlockIndex.INPUT_ADR = path.join(prefix, TestCaseBlockIndex.INPUT_ADR)
+
+        # clean directory
+        shutil.rmtree(TestCaseBlockIndex.OUTPUT_ADR, True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def test_build(self):
+        """Offsets, labels and bulks of blocks"""
+        blocks = BlockIndex.build(TestCaseBlockIndex.INPUT_FILE)
+        self.assertTrue(len(blocks) == 3)
+        self.assertTrue([block.label for block in blocks] == ["CassandraERRFile", "Cassandra", "Cassandra"])
+        self.assertTrue([block.bulk for block in blocks] == [[1, 10], [1, 10], [200, 10]])
+        self.assertTrue(blocks[-1].offset + blocks[-1].size == os.path.getsize(TestCaseBlockIndex.INPUT_FILE))
+        for block in blocks:
+            self.assertTrue(BlockIndex.read_block(TestCaseBlockIndex.INPUT_FILE, block).startswith('{"type": "headr"'))
+
+    def test_store_in_cache_dir(self):
+        """Index is stored, reused and rebuilt after change of input file"""
+        cache_dir = path.join(self.OUTPUT_ADR, "cache")
+        input_file = path.join(self.OUTPUT_ADR, "input.txt")
+        os.makedirs(self.OUTPUT_ADR, exist_ok = True)
+        shutil.copyfile(TestCaseBlockIndex.INPUT_FILE, input_file)
+
+        index = BlockIndex(input_file, cache_dir)
+        self.assertTrue(os.path.exists(BlockIndex.index_file(input_file, cache_dir)))
+        self.assertTrue(len(BlockIndex(input_file, cache_dir).blocks) == 3)
+
+        with open(input_file, "a") as f:
+            f.write('{"type": "headr", "label": "new", "bulk": [1, 1], "now": "2024-10-07 09:06:51"}\n')
+        self.assertTrue(len(index.blocks) == 3)
+        self.assertTrue(len(BlockIndex(input_file, cache_dir).blocks) == 4)
+
+    def test_generate_from_block(self):
+        """Regenerate only one block"""
+        index = BlockIndex(TestCaseBlockIndex.INPUT_FILE, path.join(self.OUTPUT_ADR, "cache"))
+
+        output = GraphPerformance().generate_from_block(TestCaseBlockIndex.INPUT_FILE, index.blocks[2], self.OUTPUT_ADR)
+        self.assertTrue(len(output) == 1)
+        self.assertTrue(output[0].find("bulk-200x10") != -1)
+
+        output = GraphExecutor().generate_from_block(TestCaseBlockIndex.INPUT_FILE, index.blocks[1], self.OUTPUT_ADR)
+        self.assertTrue(len(output) == 6)
@@ -0,0 +1,98 @@
+import os
+import unittest
+import logging
+from os import path
+import shutil
+import threading
+import time
+from qgate_graph.graph_performance_csv import GraphPerformanceCsv
+from qgate_graph.graph_stats import GraphStats
+from qgate_graph.dir_watcher import DirWatcher
+
+
+class TestCaseDirWatcher(unittest.TestCase):
+
+    OUTPUT_ADR = "output/test_dir_watcher/"
+    INPUT_ADR = "input"
+    PREFIX = "."
+
+    @classmethod
+    def setUpClass(cls):
+        logging.basicConfig()
+        logging.getLogger().setLevel(logging.INFO)
+
+        # setup relevant path
+        prefix = "."
+        if not os.path.isdir(path.join(prefix, TestCaseDirWatcher.INPUT_ADR)):
+            prefix=".."
+        TestCaseDirWatcher.OUTPUT_ADR = path.join(prefix,TestCaseDirWatcher.OUTPUT_ADR)
+        TestCaseDirWatcher.INPUT_ADR = path.join(prefix, TestCaseDirWatcher.INPUT_ADR)
+
+        # clean directory
+        shutil.rmtree(TestCaseDirWatcher.OUTPUT_ADR, True)
+        os.makedirs(TestCaseDirWatcher.OUTPUT_ADR, exist_ok = True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def copy_input(self, input_dir, file_name):
+        shutil.copy(path.join(self.INPUT_ADR, file_name), path.join(input_dir, file_name))
+
+    def test_changes(self):
+        """Generation of new/changed files after debounce"""
+        input_dir = path.join(self.OUTPUT_ADR, "changes_input")
+        output_dir = path.join(self.OUTPUT_ADR, "changes")
+        os.makedirs(input_dir, exist_ok = True)
+        self.copy_input(input_dir, "prf_cassandra_02.txt")
+        self.copy_input(input_dir, "prf_cassandra-W1-low-percentile-three-lines.txt")
+        watcher = DirWatcher(GraphPerformanceCsv(only_new = True), input_dir, output_dir, debounce = 0.3)
+
+        # recently written files are waiting for debounce
+        self.assertTrue(watcher.poll() == [])
+        time.sleep(0.4)
+        output = watcher.poll()
+        self.assertTrue(len(output) == 3)
+        self.assertTrue(watcher.poll() == [])
+
+        # only the new block of changed file is generated
+        with open(path.join(self.INPUT_ADR, "prf_cassandra-W1-low-percentile-three-lines.txt")) as f:
+            text = f.read()
+        with open(path.join(input_dir, "prf_cassandra_02.txt"), "a") as f:
+            f.write(text.replace("cassandra-163551-W1-low", "cassandra-163551-W1-new"))
+        time.sleep(0.4)
+        output = watcher.poll()
+        self.assertTrue(len(output) == 1 and "W1-new" in output[0])
+
+        # files without change for longer time are generated immediately
+        self.copy_input(input_dir, "prf_cassandra-W2-med-percentile-one-line.txt")
+        os.utime(path.join(input_dir, "prf_cassandra-W2-med-percentile-one-line.txt"),
+                 (time.time() - 60, time.time() - 60))
+        self.assertTrue(len(watcher.poll()) == 1)
+
+    def test_run(self):
+        """Watching with process pool until stop"""
+        input_dir = path.join(self.OUTPUT_ADR, "run_input")
+        output_dir = path.join(self.OUTPUT_ADR, "run")
+        os.makedirs(input_dir, exist_ok = True)
+        self.copy_input(input_dir, "prf_cassandra_02.txt")
+
+        stop = threading.Event()
+        stats = GraphStats()
+        watcher = DirWatcher(GraphPerformanceCsv(only_new = True), input_dir, output_dir, poll_interval = 0.1,
+                             debounce = 0.2, workers = 2)
+        thread = threading.Thread(target = watcher.run, args = (stop, stats))
+        thread.start()
+
+        start = time.monotonic()
+        while time.monotonic() - start < 30 and stats.counts["outputs"] < 2:
+            time.sleep(0.1)
+        self.copy_input(input_dir, "prf_cassandra-W1-low-percentile-three-lines.txt")
+        while time.monotonic() - start < 30 and stats.counts["outputs"] < 3:
+            time.sleep(0.1)
+        stop.set()
+        thread.join()
+
+        self.assertTrue(stats.counts["outputs"] == 3 and stats.counts["files"] == 2)
+        self.assertTrue(len([file for root, dirs, files in os.walk(output_dir)
+                             for file in files if file.endswith(".csv")]) == 3)
@@ -3,6 +3,7 @@ import unittest
 import logging
 from os import path
 import shutil
+import warnings
 from qgate_graph.graph_executor import GraphExecutor
 
 
@@ -42,4 +43,68 @@ class TestCaseExecutor(unittest.TestCase):
             self.assertTrue(file.find("RAW") == -1)
 
         output = graph.generate_from_file(TestCaseExecutor.INPUT_FILE, os.path.join(self.OUTPUT_ADR,"only_new"))
-        self.assertTrue(len(output) == 0)
\ No newline at end of file
+        self.assertTrue(len(output) == 0)
+
+    def test_executors_in_time(self):
+        """Amount of executors in time (sweep-line)"""
+        graph = GraphExecutor()
+        times, counts = graph._executors_in_time({"001x02": [
+            ["2024-10-07 09:06:50.100000", "2024-10-07 09:06:51.200000", "2024-10-07 09:06:55.900000"],
+            ["2024-10-07 09:06:50.500000", "2024-10-07 09:06:51.700000", "2024-10-07 09:06:53.100000"],
+            ["2024-10-07 09:06:52.000000", "2024-10-07 09:06:52.300000", "2024-10-07 09:06:55.100000"]]})
+
+        self.assertTrue([str(time) for time in times] == ["2024-10-07T09:06:50", "2024-10-07T09:06:51",
+                                                          "2024-10-07T09:06:52", "2024-10-07T09:06:53",
+                                                          "2024-10-07T09:06:55"])
+        self.assertTrue(list(counts) == [0, 2, 3, 2, 0])
+
+        # time zone
+        times, counts = graph._executors_in_time({"001x01": [
+            ["2024-10-07T09:06:50+02:00", "2024-10-07T09:06:51+02:00", "2024-10-07T09:06:52+02:00"]]})
+        self.assertTrue([str(time) for time in times] == ["2024-10-07T07:06:50", "2024-10-07T07:06:51",
+                                                          "2024-10-07T07:06:52"])
+        self.assertTrue(list(counts) == [0, 1, 0])
+
+        # time zone 'Z', without change of global filter of warnings
+        filters = list(warnings.filters)
+        times = graph._parse_times(["2024-10-07T09:06:50Z", "2024-10-07 09:06:51.500000+0100", "2024-10-07"])
+        self.assertTrue([str(time) for time in times] == ["2024-10-07T09:06:50.000000", "2024-10-07T08:06:51.500000",
+                                                          "2024-10-07T00:00:00.000000"])
+        self.assertTrue(warnings.filters == filters)
+
+        times, counts = graph._executors_in_time({})
+        self.assertTrue(len(times) == 0 and len(counts) == 0)
+
+    def test_resolution(self):
+        """Time resolution of executors in time"""
+        executors = {"001x02": [
+            ["2024-10-07 09:06:50.100000", "2024-10-07 09:06:50.120000", "2024-10-07 09:06:50.950000"],
+            ["2024-10-07 09:06:50.150000", "2024-10-07 09:06:50.170000", "2024-10-07 09:06:50.600000"]]}
+
+        times, counts = GraphExecutor(resolution = 1)._executors_in_time(executors)
+        self.assertTrue(len(times) == 1)
+
+        times, counts = GraphExecutor(resolution = 0.1)._executors_in_time(executors)
+        self.assertTrue([str(time) for time in times] == ["2024-10-07T09:06:50.100000", "2024-10-07T09:06:50.600000",
+                                                          "2024-10-07T09:06:50.900000"])
+        self.assertTrue(list(counts) == [2, 1, 0])
+
+        times, counts = GraphExecutor(resolution = 0.001)._executors_in_time(executors)
+        self.assertTrue(len(times) == 6)
+        self.assertTrue(list(counts) == [0, 1, 1, 2, 1, 0])
+
+        # duration 0.85 second, 10 ms is the first resolution with 50 points
+        graph = GraphExecutor(resolution = "auto")
+        times, counts = graph._executors_in_time(executors)
+        self.assertTrue(len(times) == 6)
+        self.assertTrue(graph._auto_resolution(graph._parse_times(["2024-10-07 09:06:50", "2024-10-07 09:07:50"])) == 1)
+
+        with self.assertRaises(ValueError):
+            GraphExecutor(resolution = 0)
+
+    def test_resolution_graph(self):
+        """Executors graphs with resolution"""
+        graph = GraphExecutor(resolution = "auto")
+        output = graph.generate_from_file(path.join(path.dirname(TestCaseExecutor.INPUT_FILE), "perf_gil_impact_percentile.txt"),
+                                          os.path.join(self.OUTPUT_ADR, "resolution"))
+        self.assertTrue(len(output) == 2)
@@ -0,0 +1,114 @@
+import os
+import unittest
+import logging
+from os import path
+import shutil
+import threading
+import time
+from qgate_graph.graph_performance import GraphPerformance
+from qgate_graph.graph_performance_csv import GraphPerformanceCsv
+from qgate_graph.tail_reader import TailReader
+
+
+class TestCaseFollow(unittest.TestCase):
+
+    OUTPUT_ADR = "output/test_follow/"
+    INPUT_FILE = "input/prf_cassandra_02.txt"
+    PREFIX = "."
+
+    @classmethod
+    def setUpClass(cls):
+        logging.basicConfig()
+        logging.getLogger().setLevel(logging.INFO)
+
+        # setup relevant path
+        prefix = "."
+        if not os.path.isfile(path.join(prefix, TestCaseFollow.INPUT_FILE)):
+            prefix=".."
+        TestCaseFollow.OUTPUT_ADR = path.join(prefix,TestCaseFollow.OUTPUT_ADR)
+        TestCaseFollow.INPUT_FILE = path.join(prefix, TestCaseFollow.INPUT_FILE)
+
+        # clean directory
+        shutil.rmtree(TestCaseFollow.OUTPUT_ADR, True)
+        os.makedirs(TestCaseFollow.OUTPUT_ADR, exist_ok = True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def blocks(self) -> list[str]:
+        """Split input file to blocks (the block ends with separator)"""
+        blocks = []
+        lines = []
+        with open(TestCaseFollow.INPUT_FILE) as f:
+            for line in f:
+                lines.append(line)
+                if line.startswith("#") and len(lines) > 1:
+                    blocks.append("".join(lines))
+                    lines = []
+        if lines:
+            blocks.append("".join(lines))
+        return blocks
+
+    def wait_for(self, output_dir, amount, timeout = 30) -> bool:
+        start = time.monotonic()
+        while time.monotonic() - start < timeout:
+            if len([file for file in os.listdir(output_dir) if file.endswith(".csv")]) >= amount:
+                return True
+            time.sleep(0.05)
+        return False
+
+    def test_follow(self):
+        """Outputs are generated after each finished block of growing file"""
+        input_file = path.join(self.OUTPUT_ADR, "growing.txt")
+        output_dir = path.join(self.OUTPUT_ADR, "growing")
+        os.makedirs(output_dir, exist_ok = True)
+        blocks = [block for block in self.blocks() if '"core"' in block]
+        open(input_file, "w").close()
+        generated = []
+
+        def write():
+            with open(input_file, "a") as f:
+                for block in blocks:
+                    # write the block in two parts (also with incomplete line)
+                    f.write(block[:len(block) // 2])
+                    f.flush()
+                    time.sleep(0.2)
+                    f.write(block[len(block) // 2:])
+                    f.flush()
+                    # the output is generated before the next block
+                    generated.append(self.wait_for(output_dir, len(generated) + 1))
+
+        writer = threading.Thread(target = write)
+        writer.start()
+        output = GraphPerformanceCsv().generate_from_file(input_file, output_dir, follow = True,
+                                                          poll_interval = 0.05, idle_timeout = 2)
+        writer.join()
+
+        self.assertTrue(generated == [True] * len(blocks))
+        self.assertTrue(len(output) == len(blocks))
+
+        # the same outputs as for finished file
+        expected = GraphPerformanceCsv().generate_from_file(input_file, path.join(self.OUTPUT_ADR, "all"))
+        self.assertTrue([path.basename(file) for file in output] == [path.basename(file) for file in expected])
+
+    def test_offset(self):
+        """Continue from offset of the last separator"""
+        input_file = path.join(self.OUTPUT_ADR, "offset.txt")
+        blocks = self.blocks()
+        with open(input_file, "w") as f:
+            f.write(blocks[0])
+
+        with TailReader(input_file, idle_timeout = 0.2, poll_interval = 0.05) as f:
+            lines = [line for line in iter(f.readline, "")]
+        self.assertTrue("".join(lines) == blocks[0])
+        self.assertTrue(f.offset == f.separator_offset == path.getsize(input_file))
+        offset = f.separator_offset
+
+        with open(input_file, "a") as f:
+            f.write("".join(blocks[1:]))
+        output_dir = path.join(self.OUTPUT_ADR, "offset")
+        output = GraphPerformance(only_new = True).generate_from_file(input_file, output_dir, follow = True,
+                                                                      poll_interval = 0.05, idle_timeout = 0.2,
+                                                                      offset = offset)
+        self.assertTrue(len(output) == len([block for block in blocks[1:] if '"core"' in block]))
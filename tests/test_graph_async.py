@@ -0,0 +1,108 @@
+import os
+import unittest
+import logging
+from os import path
+import shutil
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from qgate_graph.graph_performance_csv import GraphPerformanceCsv
+from qgate_graph.graph_async import GraphAsync
+
+
+class TestCaseGraphAsync(unittest.TestCase):
+
+    OUTPUT_ADR = "output/test_graph_async/"
+    INPUT_ADR = "input"
+    INPUT_FILE = "input/prf_cassandra_02.txt"
+    PREFIX = "."
+
+    @classmethod
+    def setUpClass(cls):
+        logging.basicConfig()
+        logging.getLogger().setLevel(logging.INFO)
+
+        # setup relevant path
+        prefix = "."
+        if not os.path.isfile(path.join(prefix, TestCaseGraphAsync.INPUT_FILE)):
+            prefix=".."
+        TestCaseGraphAsync.OUTPUT_ADR = path.join(prefix,TestCaseGraphAsync.OUTPUT_ADR)
+        TestCaseGraphAsync.INPUT_ADR = path.join(prefix, TestCaseGraphAsync.INPUT_ADR)
+        TestCaseGraphAsync.INPUT_FILE = path.join(prefix, TestCaseGraphAsync.INPUT_FILE)
+
+        # clean directory
+        shutil.rmtree(TestCaseGraphAsync.OUTPUT_ADR, True)
+        os.makedirs(TestCaseGraphAsync.OUTPUT_ADR, exist_ok = True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def test_file(self):
+        """Generation of file and text"""
+        async def generate():
+            graph = GraphAsync(GraphPerformanceCsv())
+            with open(self.INPUT_FILE) as f:
+                text = f.read()
+            return await asyncio.gather(graph.generate_from_file(self.INPUT_FILE, path.join(self.OUTPUT_ADR, "file")),
+                                        graph.generate_from_text(text, path.join(self.OUTPUT_ADR, "text")),
+                                        graph.render_from_text(text),
+                                        graph.render_from_file(self.INPUT_FILE))
+
+        from_file, from_text, rendered_text, rendered_file = asyncio.run(generate())
+        expected = GraphPerformanceCsv().generate_from_file(self.INPUT_FILE, path.join(self.OUTPUT_ADR, "sync"))
+        names = [path.basename(file) for file in expected]
+        self.assertTrue([path.basename(file) for file in from_file] == names)
+        self.assertTrue([path.basename(file) for file in from_text] == names)
+        self.assertTrue(list(rendered_text.keys()) == names and rendered_file == rendered_text)
+
+    def test_dir(self):
+        """Outputs from directory as async iterator with limit of concurrency"""
+        expected = sorted([path.basename(file) for file in
+                           GraphPerformanceCsv().generate_from_dir(self.INPUT_ADR, path.join(self.OUTPUT_ADR, "sync"))])
+
+        async def generate(graph):
+            return [path.basename(file) async for file in graph.generate_from_dir(self.INPUT_ADR,
+                                                                                  path.join(self.OUTPUT_ADR, "dir"))]
+
+        async def render(graph):
+            return [name async for name, content in graph.render_from_dir(self.INPUT_ADR)]
+
+        with ThreadPoolExecutor(max_workers = 2) as executor:
+            self.assertTrue(sorted(asyncio.run(generate(GraphAsync(GraphPerformanceCsv(), executor, 2)))) == expected)
+        with ProcessPoolExecutor(max_workers = 2) as executor:
+            self.assertTrue(sorted(asyncio.run(render(GraphAsync(GraphPerformanceCsv(), executor, 3)))) == expected)
+
+    def test_concurrency(self):
+        """Limit of concurrently processed inputs"""
+        running = []
+        peak = []
+
+        class _Graph(GraphPerformanceCsv):
+            def generate_from_file(self, input_file, output_dir = "output", suppress_error = False, cache = None):
+                running.append(input_file)
+                peak.append(len(running))
+                time.sleep(0.05)
+                running.remove(input_file)
+                return [input_file]
+
+        async def generate(graph):
+            return [file async for file in graph.generate_from_dir(self.INPUT_ADR)]
+
+        with ThreadPoolExecutor(max_workers = 8) as executor:
+            outputs = asyncio.run(generate(GraphAsync(_Graph(), executor, concurrency = 2)))
+        self.assertTrue(len(outputs) == len(os.listdir(self.INPUT_ADR)))
+        self.assertTrue(max(peak) <= 2)
+
+        with self.assertRaises(ValueError):
+            GraphAsync(GraphPerformanceCsv(), concurrency = 0)
+
+    def test_more_loops(self):
+        """The same instance in more event loops"""
+        graph = GraphAsync(GraphPerformanceCsv(), concurrency = 1)
+
+        async def render():
+            return await asyncio.gather(graph.render_from_file(self.INPUT_FILE), graph.render_from_file(self.INPUT_FILE))
+
+        first = asyncio.run(render())
+        self.assertTrue(asyncio.run(render()) == first)
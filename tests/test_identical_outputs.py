@@ -0,0 +1,66 @@
+import os
+import unittest
+import logging
+from os import path
+import shutil
+from qgate_graph.graph_performance import GraphPerformance
+from qgate_graph.graph_executor import GraphExecutor
+from qgate_graph.graph_stats import GraphStats
+from qgate_graph.output_writer import GraphWriter, CsvWriter, TxtWriter
+
+
+class TestCaseIdenticalOutputs(unittest.TestCase):
+
+    OUTPUT_ADR = "output/test_identical_outputs/"
+    INPUT_FILE = "input/prf_cassandra-W1-low-percentile-three-lines.txt"
+    PREFIX = "."
+
+    @classmethod
+    def setUpClass(cls):
+        logging.basicConfig()
+        logging.getLogger().setLevel(logging.INFO)
+
+        # setup relevant path
+        prefix = "."
+        if not os.path.isfile(path.join(prefix, TestCaseIdenticalOutputs.INPUT_FILE)):
+            prefix=".."
+        TestCaseIdenticalOutputs.OUTPUT_ADR = path.join(prefix,TestCaseIdenticalOutputs.OUTPUT_ADR)
+        TestCaseIdenticalOutputs.INPUT_FILE = path.join(prefix, TestCaseIdenticalOutputs.INPUT_FILE)
+
+        # clean directory
+        shutil.rmtree(TestCaseIdenticalOutputs.OUTPUT_ADR, True)
+        os.makedirs(TestCaseIdenticalOutputs.OUTPUT_ADR, exist_ok = True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def test_not_rewritten(self):
+        """The outputs with the same content keep modification time"""
+        output_dir = path.join(self.OUTPUT_ADR, "rerun")
+        graph = GraphPerformance(writers = [GraphWriter(), GraphWriter("svg"), CsvWriter(), TxtWriter()])
+        outputs = graph.generate_from_file(self.INPUT_FILE, output_dir)
+        outputs += GraphExecutor().generate_from_file(self.INPUT_FILE, output_dir)
+        for output_file in outputs:
+            os.utime(output_file, ns = (0, 0))
+
+        # change of one output
+        with open(outputs[0], "ab") as f:
+            f.write(b"x")
+        os.utime(outputs[0], ns = (0, 0))
+
+        stats = GraphStats()
+        self.assertTrue(graph.generate_from_file(self.INPUT_FILE, output_dir, stats = stats) +
+                        GraphExecutor().generate_from_file(self.INPUT_FILE, output_dir, stats = stats) == outputs)
+        self.assertTrue(stats.counts["identical"] == len(outputs) - 1)
+        self.assertTrue(os.stat(outputs[0]).st_mtime_ns != 0)
+        self.assertTrue(all([os.stat(output_file).st_mtime_ns == 0 for output_file in outputs[1:]]))
+
+    def test_deterministic(self):
+        """The same bytes without timestamps"""
+        with open(self.INPUT_FILE) as f:
+            text = f.read()
+        for graph in [GraphPerformance(image_format = "svg"), GraphExecutor(image_format = "svg")]:
+            first = graph.render_from_text(text)
+            self.assertTrue(len(first) > 0 and graph.render_from_text(text) == first)
+            self.assertTrue(all([b"<dc:date>" not in content for content in first.values()]))
@@ -0,0 +1,133 @@
+import os
+import unittest
+import logging
+from os import path
+import shutil
+import gzip
+import bz2
+import lzma
+from qgate_graph.graph_performance_csv import GraphPerformanceCsv
+from qgate_graph.graph_executor import GraphExecutor
+from qgate_graph.block_index import BlockIndex
+from qgate_graph.input_codec import InputCodec
+
+
+def _zstd_compress(content: bytes) -> bytes:
+    """Compression by zstd (None without package 'zstandard' or module 'compression.zstd')"""
+    try:
+        import zstandard
+        return zstandard.ZstdCompressor().compress(content)
+    except ImportError:
+        try:
+            from compression import zstd
+            return zstd.compress(content)
+        except ImportError:
+            return None
+
+
+class TestCaseInputCodec(unittest.TestCase):
+
+    OUTPUT_ADR = "output/test_input_codec/"
+    INPUT_FILE = "input/prf_cassandra_02.txt"
+    PREFIX = "."
+
+    @classmethod
+    def setUpClass(cls):
+        logging.basicConfig()
+        logging.getLogger().setLevel(logging.INFO)
+
+        # setup relevant path
+        prefix = "."
+        if not os.path.isfile(path.join(prefix, TestCaseInputCodec.INPUT_FILE)):
+            prefix=".."
+        TestCaseInputCodec.OUTPUT_ADR = path.join(prefix,TestCaseInputCodec.OUTPUT_ADR)
+        TestCaseInputCodec.INPUT_FILE = path.join(prefix, TestCaseInputCodec.INPUT_FILE)
+
+        # clean directory
+        shutil.rmtree(TestCaseInputCodec.OUTPUT_ADR, True)
+        os.makedirs(TestCaseInputCodec.OUTPUT_ADR, exist_ok = True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def compressed_files(self) -> dict:
+        """Compressed copies of input file"""
+        with open(self.INPUT_FILE, "rb") as f:
+            content = f.read()
+        files = {}
+        for compression, module, extension in [(InputCodec.GZIP, gzip, ".gz"),
+                                               (InputCodec.BZ2, bz2, ".bz2"),
+                                               (InputCodec.XZ, lzma, ".xz")]:
+            file_name = path.join(self.OUTPUT_ADR, path.basename(self.INPUT_FILE) + extension)
+            with open(file_name, "wb") as f:
+                f.write(module.compress(content))
+            files[compression] = file_name
+        return files
+
+    def read_outputs(self, output) -> list:
+        contents = []
+        for file in output:
+            with open(file, "rb") as f:
+                contents.append((path.basename(file), f.read()))
+        return contents
+
+    def test_detect(self):
+        """Detection based on magic bytes"""
+        self.assertTrue(InputCodec.detect(self.INPUT_FILE) is None)
+        for compression, file_name in self.compressed_files().items():
+            self.assertTrue(InputCodec.detect(file_name) == compression)
+
+            # without extension
+            renamed = file_name + ".log"
+            shutil.copy(file_name, renamed)
+            self.assertTrue(InputCodec.detect(renamed) == compression)
+            with InputCodec.open(renamed) as f, open(self.INPUT_FILE) as expected:
+                self.assertTrue(f.read() == expected.read())
+
+    def test_generate(self):
+        """The same outputs for compressed and plain input file"""
+        expected_csv = self.read_outputs(GraphPerformanceCsv().generate_from_file(
+            self.INPUT_FILE, path.join(self.OUTPUT_ADR, "plain")))
+        expected_exe = len(GraphExecutor().generate_from_file(self.INPUT_FILE, path.join(self.OUTPUT_ADR, "plain")))
+
+        for compression, file_name in self.compressed_files().items():
+            output_dir = path.join(self.OUTPUT_ADR, compression)
+            self.assertTrue(self.read_outputs(GraphPerformanceCsv().generate_from_file(file_name, output_dir)) ==
+                            expected_csv)
+            self.assertTrue(len(GraphExecutor().generate_from_file(file_name, output_dir)) == expected_exe)
+
+    def test_block_index(self):
+        """Index of compressed file with offsets in decompressed content"""
+        plain = BlockIndex(self.INPUT_FILE, store = False)
+        compressed = BlockIndex(self.compressed_files()[InputCodec.GZIP], store = False)
+        self.assertTrue([block.to_dict() for block in plain.blocks] == [block.to_dict() for block in compressed.blocks])
+        self.assertTrue(compressed.read(compressed.blocks[-1]) == plain.read(plain.blocks[-1]))
+
+        # only new outputs based on manifest
+        file_name = self.compressed_files()[InputCodec.XZ]
+        output_dir = path.join(self.OUTPUT_ADR, "only_new")
+        self.assertTrue(len(GraphPerformanceCsv(only_new = True).generate_from_file(file_name, output_dir)) == 2)
+        self.assertTrue(len(GraphPerformanceCsv(only_new = True).generate_from_file(file_name, output_dir)) == 0)
+
+    @unittest.skipIf(_zstd_compress(b"") is None, "Missing package 'zstandard'")
+    def test_zstd(self):
+        """Reading, index and only new outputs for zstd"""
+        with open(self.INPUT_FILE, "rb") as f:
+            content = f.read()
+        file_name = path.join(self.OUTPUT_ADR, path.basename(self.INPUT_FILE) + ".zst")
+        with open(file_name, "wb") as f:
+            f.write(_zstd_compress(content))
+
+        self.assertTrue(InputCodec.detect(file_name) == InputCodec.ZSTD)
+        with InputCodec.open(file_name) as f, open(self.INPUT_FILE) as expected:
+            self.assertTrue(f.readline() == expected.readline())
+            self.assertTrue(f.read() == expected.read())
+
+        plain = BlockIndex(self.INPUT_FILE, store = False)
+        compressed = BlockIndex(file_name, store = False)
+        self.assertTrue([block.to_dict() for block in plain.blocks] == [block.to_dict() for block in compressed.blocks])
+
+        output_dir = path.join(self.OUTPUT_ADR, "zstd")
+        self.assertTrue(len(GraphPerformanceCsv(only_new = True).generate_from_file(file_name, output_dir)) == 2)
+        self.assertTrue(len(GraphPerformanceCsv(only_new = True).generate_from_file(file_name, output_dir)) == 0)
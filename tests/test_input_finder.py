@@ -0,0 +1,96 @@
+import os
+import unittest
+import logging
+from os import path
+import shutil
+import datetime
+import time
+from qgate_graph.graph_performance_csv import GraphPerformanceCsv
+from qgate_graph.input_finder import InputFinder
+
+
+class TestCaseInputFinder(unittest.TestCase):
+
+    OUTPUT_ADR = "output/test_input_finder/"
+    INPUT_ADR = "input"
+    PREFIX = "."
+
+    @classmethod
+    def setUpClass(cls):
+        logging.basicConfig()
+        logging.getLogger().setLevel(logging.INFO)
+
+        # setup relevant path
+        prefix = "."
+        if not os.path.isdir(path.join(prefix, TestCaseInputFinder.INPUT_ADR)):
+            prefix=".."
+        TestCaseInputFinder.OUTPUT_ADR = path.join(prefix,TestCaseInputFinder.OUTPUT_ADR)
+        TestCaseInputFinder.INPUT_ADR = path.join(prefix, TestCaseInputFinder.INPUT_ADR)
+
+        # clean directory
+        shutil.rmtree(TestCaseInputFinder.OUTPUT_ADR, True)
+        os.makedirs(TestCaseInputFinder.OUTPUT_ADR, exist_ok = True)
+
+        # tree of inputs, env/date/*.txt
+        tree = path.join(TestCaseInputFinder.OUTPUT_ADR, "tree")
+        for file_name, target in [("prf_cassandra_02.txt", "prf_cassandra_02.txt"),
+                                  ("prf_cassandra-W1-low-percentile-three-lines.txt", "dev/2024-10-07/w1.txt"),
+                                  ("prf_cassandra-W2-med-percentile-one-line.txt", "dev/2024-10-11/w2.txt"),
+                                  ("prf_cassandra-without-std.txt", "old/2023-09-08/without-std.txt")]:
+            os.makedirs(path.dirname(path.join(tree, target)), exist_ok = True)
+            shutil.copy(path.join(TestCaseInputFinder.INPUT_ADR, file_name), path.join(tree, target))
+        with open(path.join(tree, "dev", "notes.md"), "w") as f:
+            f.write("notes")
+        with open(path.join(tree, "prf_cassandra_02.txt.qgidx"), "w") as f:
+            f.write("index")
+
+        # older file
+        old = time.time() - 10 * 24 * 3600
+        os.utime(path.join(tree, "dev", "2024-10-07", "w1.txt"), (old, old))
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def relative(self, files) -> list[str]:
+        tree = path.join(self.OUTPUT_ADR, "tree")
+        return [path.relpath(file, tree).replace(os.sep, "/") for file in files]
+
+    def test_find(self):
+        """Recursive discovery with filters"""
+        tree = path.join(self.OUTPUT_ADR, "tree")
+        self.assertTrue(self.relative(InputFinder().find(tree)) == ["prf_cassandra_02.txt"])
+        self.assertTrue(self.relative(InputFinder(recursive = True).find(tree)) ==
+                        ["prf_cassandra_02.txt", "dev/notes.md", "dev/2024-10-07/w1.txt",
+                         "dev/2024-10-11/w2.txt", "old/2023-09-08/without-std.txt"])
+        self.assertTrue(self.relative(InputFinder(recursive = True, include = ["*.txt"], exclude = ["old"]).find(tree)) ==
+                        ["prf_cassandra_02.txt", "dev/2024-10-07/w1.txt", "dev/2024-10-11/w2.txt"])
+        self.assertTrue(self.relative(InputFinder(recursive = True, include = ["dev/*/*.txt"]).find(tree)) ==
+                        ["dev/2024-10-07/w1.txt", "dev/2024-10-11/w2.txt"])
+
+        # window of modification time
+        since = datetime.datetime.now() - datetime.timedelta(days = 1)
+        self.assertTrue(self.relative(InputFinder(recursive = True, include = ["*.txt"],
+                                                  changed_since = since).find(tree)) ==
+                        ["prf_cassandra_02.txt", "dev/2024-10-11/w2.txt", "old/2023-09-08/without-std.txt"])
+        self.assertTrue(self.relative(InputFinder(recursive = True, changed_before = since.timestamp()).find(tree)) ==
+                        ["dev/2024-10-07/w1.txt"])
+
+    def test_lazy(self):
+        """The files are generated before the end of the walk"""
+        files = InputFinder(recursive = True).find(path.join(self.OUTPUT_ADR, "tree"))
+        self.assertTrue(self.relative([next(files)]) == ["prf_cassandra_02.txt"])
+
+    def test_generate(self):
+        """Generation from directory with subdirectories"""
+        tree = path.join(self.OUTPUT_ADR, "tree")
+        output = GraphPerformanceCsv().generate_from_dir(tree, path.join(self.OUTPUT_ADR, "flat"))
+        self.assertTrue(len(output) == 2)
+
+        finder = InputFinder(recursive = True, include = ["*.txt"], exclude = ["old"])
+        output = GraphPerformanceCsv().generate_from_dir(tree, path.join(self.OUTPUT_ADR, "recursive"),
+                                                         finder = finder)
+        parallel = GraphPerformanceCsv().generate_from_dir(tree, path.join(self.OUTPUT_ADR, "parallel"),
+                                                           workers = 2, finder = finder)
+        self.assertTrue(len(output) == 4)
+        self.assertTrue([path.basename(file) for file in output] == [path.basename(file) for file in parallel])
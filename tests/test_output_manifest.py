@@ -0,0 +1,133 @@
+import os
+import unittest
+import logging
+from os import path
+import shutil
+from qgate_graph.graph_performance import GraphPerformance
+from qgate_graph.graph_executor import GraphExecutor
+from qgate_graph.output_manifest import OutputManifest
+
+
+class _FailingGraph(GraphPerformance):
+    """Graph with error in generation of the first output"""
+
+    def __init__(self, failures = 1):
+        super().__init__(only_new = True)
+        self.failures = failures
+
+    def _create_graph(self, percentiles, title, file_name, output_dir, context = None) -> str:
+        if self.failures > 0:
+            self.failures -= 1
+            raise OSError("Simulated error")
+        return super()._create_graph(percentiles, title, file_name, output_dir, context)
+
+
+class TestCaseOutputManifest(unittest.TestCase):
+
+    OUTPUT_ADR = "output/test_output_manifest/"
+    INPUT_FILE = "input/prf_cassandra_02.txt"
+    INPUT_ADR = "input"
+    PREFIX = "."
+
+    @classmethod
+    def setUpClass(cls):
+        logging.basicConfig()
+        logging.getLogger().setLevel(logging.INFO)
+
+        # setup relevant path
+        prefix = "."
+        if not os.path.isfile(path.join(prefix, TestCaseOutputManifest.INPUT_FILE)):
+            prefix=".."
+        TestCaseOutputManifest.OUTPUT_ADR = path.join(prefix,TestCaseOutputManifest.OUTPUT_ADR)
+        TestCaseOutputManifest.INPUT_FILE = path.join(prefix, TestCaseOutputManifest.INPUT_FILE)
+        TestCaseOutputManifest.INPUT_ADR = path.join(prefix, TestCaseOutputManifest.INPUT_ADR)
+
+        # clean directory
+        shutil.rmtree(TestCaseOutputManifest.OUTPUT_ADR, True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def copy_input(self, name) -> str:
+        input_file = path.join(self.OUTPUT_ADR, name)
+        os.makedirs(self.OUTPUT_ADR, exist_ok = True)
+        shutil.copyfile(TestCaseOutputManifest.INPUT_FILE, input_file)
+        return input_file
+
+    def test_perf_manifest(self):
+        """Skip unchanged file/blocks and regenerate changed blocks"""
+        input_file = self.copy_input("perf.txt")
+        output_dir = path.join(self.OUTPUT_ADR, "perf")
+        graph = GraphPerformance(only_new = True)
+
+        output = graph.generate_from_file(input_file, output_dir)
+        self.assertTrue(len(output) == 2)
+        self.assertTrue(len(graph.generate_from_file(input_file, output_dir)) == 0)
+
+        # touch without change of content
+        os.utime(input_file, ns = (0, 0))
+        self.assertTrue(len(graph.generate_from_file(input_file, output_dir)) == 0)
+
+        # change of the last block, the output with the same name is regenerated
+        with open(input_file, "r") as f:
+            content = f.read()
+        with open(input_file, "w") as f:
+            f.write(content.replace('"total_call_per_sec": 48165', '"total_call_per_sec": 49165'))
+        output_changed = graph.generate_from_file(input_file, output_dir)
+        self.assertTrue(len(output_changed) == 1)
+        self.assertTrue(output_changed[0] == output[1])
+
+        # removed output
+        os.remove(output[0])
+        self.assertTrue(graph.generate_from_file(input_file, output_dir) == [output[0]])
+        self.assertTrue(len(graph.generate_from_file(input_file, output_dir)) == 0)
+
+    def test_exec_manifest(self):
+        """Skip unchanged file for executors graphs"""
+        input_file = self.copy_input("exec.txt")
+        output_dir = path.join(self.OUTPUT_ADR, "exec")
+        graph = GraphExecutor(only_new = True)
+
+        self.assertTrue(len(graph.generate_from_file(input_file, output_dir)) == 11)
+        self.assertTrue(len(graph.generate_from_file(input_file, output_dir)) == 0)
+
+        # new block
+        with open(TestCaseOutputManifest.INPUT_FILE, "r") as f:
+            lines = f.readlines()
+        with open(input_file, "a") as f:
+            f.writelines([line.replace("2023-", "2022-") for line in lines[2:]])
+        self.assertTrue(len(graph.generate_from_file(input_file, output_dir)) == 11)
+        self.assertTrue(len(graph.generate_from_file(input_file, output_dir)) == 0)
+
+    def test_adopt_outputs(self):
+        """Existing outputs without manifest are not regenerated"""
+        input_file = self.copy_input("adopt.txt")
+        output_dir = path.join(self.OUTPUT_ADR, "adopt")
+        self.assertTrue(len(GraphPerformance().generate_from_file(input_file, output_dir)) == 2)
+
+        graph = GraphPerformance(only_new = True)
+        self.assertTrue(len(graph.generate_from_file(input_file, output_dir)) == 0)
+        self.assertTrue(len(os.listdir(path.join(output_dir, OutputManifest.MANIFEST_DIR))) == 1)
+
+    def test_image_format(self):
+        """Other image format into the same output directory"""
+        input_file = self.copy_input("format.txt")
+        output_dir = path.join(self.OUTPUT_ADR, "format")
+        for graph, amount in [(GraphPerformance, 2), (GraphExecutor, 11)]:
+            self.assertTrue(len(graph(only_new = True).generate_from_file(input_file, output_dir)) == amount)
+            svg = graph(only_new = True, image_format = "svg").generate_from_file(input_file, output_dir)
+            self.assertTrue(len(svg) == amount and all([file.endswith(".svg") for file in svg]))
+            self.assertTrue(len(graph(only_new = True, image_format = "svg").generate_from_file(input_file, output_dir)) == 0)
+
+    def test_retry_error(self):
+        """Block with error is generated again in the next run"""
+        input_file = self.copy_input("retry.txt")
+        output_dir = path.join(self.OUTPUT_ADR, "retry")
+
+        output = _FailingGraph().generate_from_file(input_file, output_dir, suppress_error = True)
+        self.assertTrue(len(output) == 1)
+        retry = _FailingGraph(failures = 0).generate_from_file(input_file, output_dir, suppress_error = True)
+        self.assertTrue(len(retry) == 1 and retry != output)
+        self.assertTrue(len(_FailingGraph(failures = 0).generate_from_file(input_file, output_dir,
+                                                                           suppress_error = True)) == 0)
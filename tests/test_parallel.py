@@ -0,0 +1,157 @@
+import os
+import unittest
+import logging
+from os import path
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from qgate_graph.graph_performance import GraphPerformance
+from qgate_graph.graph_executor import GraphExecutor
+from qgate_graph.graph_pipeline import GraphPipeline
+from qgate_graph.graph_stats import GraphStats
+from qgate_graph.block_index import BlockIndex
+from qgate_graph.perf_reader import PerfReader
+from io import StringIO
+
+
+class TestCaseParallel(unittest.TestCase):
+
+    OUTPUT_ADR = "output/test_parallel/"
+    INPUT_FILE = "input/prf_cassandra_02.txt"
+    INPUT_ADR = "input"
+    PREFIX = "."
+
+    @classmethod
+    def setUpClass(cls):
+        logging.basicConfig()
+        logging.getLogger().setLevel(logging.INFO)
+
+        # setup relevant path
+        prefix = "."
+        if not os.path.isfile(path.join(prefix, TestCaseParallel.INPUT_FILE)):
+            prefix=".."
+        TestCaseParallel.OUTPUT_ADR = path.join(prefix,TestCaseParallel.OUTPUT_ADR)
+        TestCaseParallel.INPUT_FILE = path.join(prefix, TestCaseParallel.INPUT_FILE)
+        TestCaseParallel.INPUT_ADR = path.join(prefix, TestCaseParallel.INPUT_ADR)
+
+        # clean directory
+        shutil.rmtree(TestCaseParallel.OUTPUT_ADR, True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def relative(self, output, output_dir):
+        return [path.relpath(file, output_dir) for file in output]
+
+    def test_perf_dir_workers(self):
+        """Performance graphs for dir with process pool"""
+        output_dir = path.join(self.OUTPUT_ADR, "serial")
+        output = GraphPerformance().generate_from_dir(TestCaseParallel.INPUT_ADR, output_dir)
+
+        output_dir_parallel = path.join(self.OUTPUT_ADR, "parallel")
+        output_parallel = GraphPerformance().generate_from_dir(TestCaseParallel.INPUT_ADR, output_dir_parallel,
+                                                               workers = 2)
+
+        self.assertTrue(len(output_parallel) == 13)
+        self.assertTrue(self.relative(output, output_dir) == self.relative(output_parallel, output_dir_parallel))
+
+    def test_pipeline_dir_workers_split(self):
+        """Performance and executors graphs with split of files to blocks"""
+        output_dir = path.join(self.OUTPUT_ADR, "serial_split")
+        pipeline = GraphPipeline([GraphPerformance(), GraphExecutor()])
+        output = pipeline.generate_from_dir(TestCaseParallel.INPUT_ADR, output_dir)
+
+        output_dir_parallel = path.join(self.OUTPUT_ADR, "parallel_split")
+        pipeline.PARALLEL_CHUNK_SIZE = 1
+        output_parallel = pipeline.generate_from_dir(TestCaseParallel.INPUT_ADR, output_dir_parallel, workers = 4)
+
+        self.assertTrue(len(output_parallel) == 13 + 69)
+        self.assertTrue(self.relative(output, output_dir) == self.relative(output_parallel, output_dir_parallel))
+
+    def test_split_input(self):
+        """Split of input file on header boundaries"""
+        graph = GraphPerformance()
+        self.assertTrue(graph._split_offsets(TestCaseParallel.INPUT_FILE) == [None])
+
+        graph.PARALLEL_CHUNK_SIZE = 1
+        chunks = [BlockIndex.read_range(TestCaseParallel.INPUT_FILE, offset, size)
+                  for offset, size in graph._split_offsets(TestCaseParallel.INPUT_FILE)]
+        with open(TestCaseParallel.INPUT_FILE) as f:
+            self.assertTrue("".join(chunks) == f.read())
+        for chunk in chunks[1:]:
+            self.assertTrue(chunk.startswith('{"type": "headr"'))
+
+        # expected amount of parts
+        graph.PARALLEL_CHUNK_SIZE = 100
+        self.assertTrue(len(graph._split_offsets(TestCaseParallel.INPUT_FILE, 2)) == 2)
+
+    def test_split_line_numbers(self):
+        """Line numbers of invalid lines in chunks are relative to input file"""
+        input_file = path.join(self.OUTPUT_ADR, "invalid_lines.txt")
+        os.makedirs(self.OUTPUT_ADR, exist_ok = True)
+        with open(TestCaseParallel.INPUT_FILE) as f:
+            lines = f.readlines()
+        lines.insert(len(lines) - 2, "invalid line\n")
+        with open(input_file, "w") as f:
+            f.writelines(lines)
+        with open(input_file) as f:
+            expected = PerfReader(f)
+            list(expected)
+
+        graph = GraphPerformance()
+        graph.PARALLEL_CHUNK_SIZE = 1
+        chunks = graph._number_lines(input_file, graph._split_offsets(input_file))
+        self.assertTrue(len(chunks) > 1 and chunks[0][2] == 1)
+        invalid_lines = []
+        for offset, size, first_line in chunks:
+            reader = PerfReader(StringIO(BlockIndex.read_range(input_file, offset, size)), first_line = first_line)
+            list(reader)
+            invalid_lines.extend(reader.invalid_lines)
+        self.assertTrue(invalid_lines == expected.invalid_lines == [len(lines) - 2])
+
+    def test_file_workers(self):
+        """Split of one file to chunks for process pool"""
+        pipeline = GraphPipeline([GraphPerformance(), GraphExecutor()])
+        stats = GraphStats()
+        output_dir = path.join(self.OUTPUT_ADR, "serial_file")
+        output = pipeline.generate_from_file(TestCaseParallel.INPUT_FILE, output_dir)
+
+        output_dir_parallel = path.join(self.OUTPUT_ADR, "parallel_file")
+        pipeline.PARALLEL_CHUNK_SIZE = 1
+        output_parallel = pipeline.generate_from_file(TestCaseParallel.INPUT_FILE, output_dir_parallel,
+                                                      stats = stats, workers = 3)
+        self.assertTrue(self.relative(output, output_dir) == self.relative(output_parallel, output_dir_parallel))
+        self.assertTrue(stats.counts["files"] == 1 and stats.counts["outputs"] == len(output))
+
+    def test_suppress_error_workers(self):
+        """Errors in workers behave in the same way as without parallel processing"""
+        input_dir = path.join(self.OUTPUT_ADR, "input_error")
+        os.makedirs(input_dir, exist_ok = True)
+        with open(path.join(input_dir, "error.txt"), "w") as f:
+            f.write('{"type": "headr", "label": "error", "bulk": [1, 1], "now": "2024-10-07 09:06:51"}\n'
+                    '  {"type": "core", "real_executors": 1, "group": "g", "total_call_per_sec": "x", "avrg_time": 1}\n'
+                    '###\n')
+
+        graph = GraphPerformance()
+        with self.assertRaises(TypeError):
+            graph.generate_from_dir(input_dir, path.join(self.OUTPUT_ADR, "error"), workers = 2)
+        output = graph.generate_from_dir(input_dir, path.join(self.OUTPUT_ADR, "error"), suppress_error = True,
+                                         workers = 2)
+        self.assertTrue(len(output) == 0)
+
+    def test_render_threads(self):
+        """Rendering of graphs in threads of one process (without global state of pyplot)"""
+        pipeline = GraphPipeline([GraphPerformance(), GraphExecutor()])
+        output_dir = path.join(self.OUTPUT_ADR, "serial_render")
+        output = pipeline.generate_from_file(TestCaseParallel.INPUT_FILE, output_dir)
+
+        output_dirs = [path.join(self.OUTPUT_ADR, f"threads_render_{i}") for i in range(4)]
+        with ThreadPoolExecutor(max_workers = 4) as executor:
+            outputs = list(executor.map(lambda dir: pipeline.generate_from_file(TestCaseParallel.INPUT_FILE, dir),
+                                        output_dirs))
+
+        for output_threads, output_dir_threads in zip(outputs, output_dirs):
+            self.assertTrue(self.relative(output, output_dir) == self.relative(output_threads, output_dir_threads))
+            for file, file_threads in zip(output, output_threads):
+                with open(file, "rb") as f, open(file_threads, "rb") as f_threads:
+                    self.assertTrue(f.read() == f_threads.read())
@@ -0,0 +1,126 @@
+import os
+import unittest
+import logging
+from os import path
+import shutil
+from qgate_graph.parse_cache import ParseCache
+from qgate_graph.graph_performance_csv import GraphPerformanceCsv
+from qgate_graph.graph_executor import GraphExecutor
+from qgate_graph.perf_reader import PerfReader
+from qgate_graph.file_marker import FileMarker as const
+
+
+class TestCaseParseCache(unittest.TestCase):
+
+    OUTPUT_ADR = "output/test_parse_cache/"
+    INPUT_FILE = "input/prf_cassandra_02.txt"
+    INPUT_ADR = "input"
+    PREFIX = "."
+
+    @classmethod
+    def setUpClass(cls):
+        logging.basicConfig()
+        logging.getLogger().setLevel(logging.INFO)
+
+        # setup relevant path
+        prefix = "."
+        if not os.path.isfile(path.join(prefix, TestCaseParseCache.INPUT_FILE)):
+            prefix=".."
+        TestCaseParseCache.OUTPUT_ADR = path.join(prefix,TestCaseParseCache.OUTPUT_ADR)
+        TestCaseParseCache.INPUT_FILE = path.join(prefix, TestCaseParseCache.INPUT_FILE)
+        TestCaseParseCache.INPUT_ADR = path.join(prefix, TestCaseParseCache.INPUT_ADR)
+
+        # clean directory
+        shutil.rmtree(TestCaseParseCache.OUTPUT_ADR, True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def normalize(self, events) -> list:
+        """Comparable events (the details are compared by values)"""
+        return [(event_type, (record.init, record.start, record.end, record.err))
+                if event_type == const.PRF_DETAIL_TYPE else (event_type, record) for event_type, record in events]
+
+    def test_cache_hit(self):
+        """The same outputs with and without cache"""
+        cache = ParseCache(path.join(self.OUTPUT_ADR, "cache_hit"))
+        self.assertTrue(cache.get(TestCaseParseCache.INPUT_FILE) is None)
+
+        graph = GraphPerformanceCsv()
+        output = graph.generate_from_dir(TestCaseParseCache.INPUT_ADR, path.join(self.OUTPUT_ADR, "hit"), cache = cache)
+        self.assertTrue(cache.get(TestCaseParseCache.INPUT_FILE, graph._record_types()) is not None)
+        output_cache = graph.generate_from_dir(TestCaseParseCache.INPUT_ADR, path.join(self.OUTPUT_ADR, "hit"), cache = cache)
+
+        self.assertTrue(len(output) == 13)
+        self.assertTrue(output == output_cache)
+
+        output = GraphExecutor().generate_from_file(TestCaseParseCache.INPUT_FILE, self.OUTPUT_ADR, cache = cache)
+        self.assertTrue(len(output) == 11)
+
+    def test_cache_invalidation(self):
+        """Changed input file and explicit invalidation"""
+        cache = ParseCache(path.join(self.OUTPUT_ADR, "cache_invalidation"))
+        record_types = GraphPerformanceCsv()._record_types()
+        input_file = path.join(self.OUTPUT_ADR, "input.txt")
+        os.makedirs(self.OUTPUT_ADR, exist_ok = True)
+        shutil.copyfile(TestCaseParseCache.INPUT_FILE, input_file)
+
+        GraphPerformanceCsv().generate_from_file(input_file, self.OUTPUT_ADR, cache = cache)
+        self.assertTrue(cache.get(input_file, record_types) is not None)
+
+        # touch without change of content
+        os.utime(input_file, ns = (0, 0))
+        self.assertTrue(cache.get(input_file, record_types) is not None)
+
+        # change of content
+        with open(input_file, "a") as f:
+            f.write("##########\n")
+        self.assertTrue(cache.get(input_file, record_types) is None)
+
+        GraphPerformanceCsv().generate_from_file(input_file, self.OUTPUT_ADR, cache = cache)
+        self.assertTrue(cache.get(input_file, record_types) is not None)
+        cache.clear(input_file)
+        self.assertTrue(cache.get(input_file, record_types) is None)
+
+    def test_cache_eviction(self):
+        """Size limit of cache"""
+        cache_dir = path.join(self.OUTPUT_ADR, "cache_eviction")
+        cache = ParseCache(cache_dir, max_size = 1)
+        GraphPerformanceCsv().generate_from_dir(TestCaseParseCache.INPUT_ADR, path.join(self.OUTPUT_ADR, "eviction"),
+                                                cache = cache)
+        self.assertTrue(len(os.listdir(cache_dir)) == 0)
+
+        # the directory is scanned only for the first time (under the limit)
+        scans = []
+        cache = ParseCache(cache_dir)
+        cache._scan = lambda scan = cache._scan: scans.append(1) or scan()
+        GraphPerformanceCsv().generate_from_dir(TestCaseParseCache.INPUT_ADR, path.join(self.OUTPUT_ADR, "eviction"),
+                                                cache = cache)
+        self.assertTrue(len(os.listdir(cache_dir)) == len(os.listdir(TestCaseParseCache.INPUT_ADR)))
+        self.assertTrue(len(scans) == 1)
+        cache.clear()
+        self.assertTrue(len(os.listdir(cache_dir)) == 0)
+
+    def test_record_types(self):
+        """Cache item with types of records, the details are loaded only on request"""
+        cache = ParseCache(path.join(self.OUTPUT_ADR, "cache_types"))
+        with open(TestCaseParseCache.INPUT_FILE) as f:
+            events = list(PerfReader(f))
+        performance_types = {const.PRF_HDR_TYPE, const.PRF_CORE_TYPE}
+
+        # only headers and cores, the details are missing
+        with open(TestCaseParseCache.INPUT_FILE) as f:
+            cache.put(TestCaseParseCache.INPUT_FILE, PerfReader(f, record_types = performance_types), performance_types)
+        self.assertTrue(cache.get(TestCaseParseCache.INPUT_FILE) is None)
+        self.assertTrue(list(cache.get(TestCaseParseCache.INPUT_FILE, performance_types)) ==
+                        [event for event in events if event[0] != const.PRF_DETAIL_TYPE])
+
+        # executors graph needs details, the item is replaced by all types
+        GraphExecutor().generate_from_file(TestCaseParseCache.INPUT_FILE, self.OUTPUT_ADR, cache = cache)
+        self.assertTrue(len(list(cache.get(TestCaseParseCache.INPUT_FILE, performance_types))) <
+                        len(list(cache.get(TestCaseParseCache.INPUT_FILE, GraphExecutor()._record_types()))))
+
+        # all events in the same order
+        cache.put(TestCaseParseCache.INPUT_FILE, events)
+        self.assertTrue(self.normalize(cache.get(TestCaseParseCache.INPUT_FILE)) == self.normalize(events))
@@ -0,0 +1,45 @@
+import unittest
+import numpy as np
+from qgate_graph.percentile_item import PercentileItem
+
+
+class TestCasePercentileItem(unittest.TestCase):
+
+    def test_append(self):
+        """Append values to series of groups"""
+        item = PercentileItem(0.95)
+        item.append("1x threads", 8, 1000.5, 0.02, 0.005, None, 0.4)
+        item.append("1x threads", 16, 1500.5, 0.03, None, 0.001, 0.5)
+        item.append("2x threads", 8, 900.5, 0.04)
+
+        self.assertTrue(list(item.executors.keys()) == ["1x threads", "2x threads"])
+        self.assertTrue(list(item.executors["1x threads"]) == [8, 16])
+        self.assertTrue(list(item.total_performance["1x threads"]) == [1000.5, 1500.5])
+        self.assertTrue(list(item.avrg_time["2x threads"]) == [0.04])
+
+        # missing standard deviation is 0.0, missing min/max are skipped
+        self.assertTrue(list(item.std_deviation["1x threads"]) == [0.005, 0.0])
+        self.assertTrue(list(item.min["1x threads"]) == [0.001])
+        self.assertTrue(list(item.max["1x threads"]) == [0.4, 0.5])
+        self.assertTrue("2x threads" not in item.min and "2x threads" not in item.max)
+
+    def test_compact(self):
+        """Slotted item and series without copy for numpy"""
+        item = PercentileItem(1)
+        with self.assertRaises(AttributeError):
+            item.other = 1
+
+        item.append("g", 1, 10.0, 0.1)
+        series = np.asarray(item.avrg_time["g"])
+        series[0] = 0.2
+        self.assertTrue(item.avrg_time["g"][0] == 0.2)
+
+    def test_integral(self):
+        """Integral values are kept (formatting without decimal part)"""
+        item = PercentileItem(1)
+        item.append("g", 1, 10.5, 1)
+        item.append("g", 2, 12, 0.5)
+        self.assertTrue(item.total_performance["g"] == [10.5, 12] and isinstance(item.total_performance["g"][1], int))
+        self.assertTrue(item.avrg_time["g"] == [1, 0.5] and isinstance(item.avrg_time["g"][0], int))
+        with self.assertRaises(TypeError):
+            item.append("g", 3, "12", 0.5)
@@ -0,0 +1,117 @@
+import os
+import unittest
+import logging
+from os import path
+import pickle
+from io import StringIO
+from qgate_graph.file_marker import FileMarker as const
+from qgate_graph.perf_decoder import PerfDecoder
+from qgate_graph.perf_reader import PerfReader
+from qgate_graph.perf_record import HeaderRecord, CoreRecord, DetailRecord
+from qgate_graph.graph_stats import GraphStats
+from qgate_graph.graph_performance_csv import GraphPerformanceCsv
+from qgate_graph.graph_executor import GraphExecutor
+from qgate_graph.graph_pipeline import GraphPipeline
+
+
+class TestCasePerfDecoder(unittest.TestCase):
+
+    OUTPUT_ADR = "output/test_perf_decoder/"
+    INPUT_FILE = "input/prf_cassandra-W1-low-percentile-three-lines.txt"
+    PREFIX = "."
+
+    @classmethod
+    def setUpClass(cls):
+        logging.basicConfig()
+        logging.getLogger().setLevel(logging.INFO)
+
+        # setup relevant path
+        prefix = "."
+        if not os.path.isfile(path.join(prefix, TestCasePerfDecoder.INPUT_FILE)):
+            prefix=".."
+        TestCasePerfDecoder.OUTPUT_ADR = path.join(prefix,TestCasePerfDecoder.OUTPUT_ADR)
+        TestCasePerfDecoder.INPUT_FILE = path.join(prefix, TestCasePerfDecoder.INPUT_FILE)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def available_backends(self):
+        return [backend for backend in PerfDecoder.BACKENDS if PerfDecoder._load_backend(backend)]
+
+    def test_backends(self):
+        """The same events for all available backends"""
+        with open(TestCasePerfDecoder.INPUT_FILE) as f:
+            text = f.read()
+        expected = list(PerfReader(StringIO(text), PerfDecoder("json")))
+        for backend in self.available_backends():
+            self.assertTrue(list(PerfReader(StringIO(text), PerfDecoder(backend))) == expected)
+        self.assertTrue(PerfDecoder().backend == self.available_backends()[0])
+
+        with self.assertRaises(ValueError):
+            PerfDecoder("unknown")
+
+    def test_fallback(self):
+        """Values without support in fast backends are decoded by standard json"""
+        for backend in self.available_backends():
+            decoder = PerfDecoder(backend)
+            self.assertTrue(decoder.decode('  {"type": "core", "std_deviation": NaN}\n')["type"] == "core")
+            with self.assertRaises(ValueError):
+                decoder.decode('{"type": "core", ')
+
+    def test_records(self):
+        """Typed records with dict access"""
+        with open(TestCasePerfDecoder.INPUT_FILE) as f:
+            events = list(PerfReader(f))
+
+        header = events[1][1]
+        self.assertTrue(isinstance(header, HeaderRecord))
+        self.assertTrue(header.label == "cassandra-163551-W1-low" and header.bulk == [200, 10])
+        self.assertTrue(header.duration == 60 and header.percentile == 0.95 and header.response_unit == "sec")
+        self.assertTrue(header[const.PRF_HDR_AVIALABLE_CPU] == 8)
+
+        detail = events[2][1]
+        self.assertTrue(isinstance(detail, DetailRecord))
+        self.assertTrue(detail.start == detail.get(const.PRF_DETAIL_TIME_START) and not detail.err)
+
+        core = [record for event_type, record in events if event_type == const.PRF_CORE_TYPE][0]
+        self.assertTrue(isinstance(core, CoreRecord))
+        self.assertTrue(core.group == "1x threads" and core.plan_executors_detail == [8, 1])
+        self.assertTrue(core.metrics(0.95).avrg_time == core[const.PRF_CORE_AVRG_TIME + "_95"])
+        self.assertTrue(core.metrics().total_call_per_sec == core[const.PRF_CORE_TOTAL_CALL_PER_SEC])
+        self.assertTrue(core.metrics().min is None)
+
+        # records in parse cache
+        self.assertTrue(pickle.loads(pickle.dumps(events)) == events)
+
+    def test_invalid_lines(self):
+        """Invalid lines are reported with line number"""
+        text = ('{"type": "headr", "label": "invalid", "bulk": [1, 1], "now": "2024-10-07 09:06:51"}\n'
+                '\n'
+                '  {"type": "core", "real_executors": 1, \n'
+                '  {"type": "core", "real_executors": 1, "group": "g", "total_call_per_sec": 1, "avrg_time": 1}\n'
+                'text\n'
+                '###\n')
+        stats = GraphStats()
+        with stats.activate():
+            reader = PerfReader(StringIO(text))
+            events = list(reader)
+        self.assertTrue(reader.invalid_lines == [3, 5])
+        self.assertTrue(stats.counts["invalid"] == 2)
+        self.assertTrue([event[0] for event in events] == ["headr", "core", "#"])
+
+        output = GraphPerformanceCsv().generate_from_text(text, self.OUTPUT_ADR)
+        self.assertTrue(len(output) == 1)
+
+    def test_record_types(self):
+        """Lines with unused types of records are not decoded"""
+        with open(TestCasePerfDecoder.INPUT_FILE) as f:
+            text = f.read()
+        events = list(PerfReader(StringIO(text)))
+        filtered = list(PerfReader(StringIO(text), record_types = {const.PRF_HDR_TYPE, const.PRF_CORE_TYPE}))
+        self.assertTrue(filtered == [event for event in events if event[0] != const.PRF_DETAIL_TYPE])
+
+        self.assertTrue(GraphPerformanceCsv()._record_types() == {const.PRF_HDR_TYPE, const.PRF_CORE_TYPE})
+        self.assertTrue(GraphPipeline([GraphPerformanceCsv(), GraphExecutor()])._record_types() ==
+                        {const.PRF_HDR_TYPE, const.PRF_CORE_TYPE, const.PRF_DETAIL_TYPE})
+
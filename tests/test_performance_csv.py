@@ -3,7 +3,11 @@ import unittest
 import logging
 from os import path
 import shutil
+import subprocess
+import sys
 from qgate_graph.graph_performance_csv import GraphPerformanceCsv
+from qgate_graph.graph_performance import GraphPerformance
+from qgate_graph.output_writer import GraphWriter, CsvWriter, TxtWriter
 
 
 class TestCasePerformanceCsv(unittest.TestCase):
@@ -111,3 +115,34 @@ class TestCasePerformanceCsv(unittest.TestCase):
 
         output = graph.generate_from_file(TestCasePerformanceCsv.INPUT_FILE, os.path.join(self.OUTPUT_ADR,"only_new"))
         self.assertTrue(len(output) == 0)
+
+    def test_more_writers(self):
+        """Graph, CSV and TXT outputs from one aggregation"""
+        graph = GraphPerformance(writers=[GraphWriter(), CsvWriter(), TxtWriter()])
+        output = graph.generate_from_file(TestCasePerformanceCsv.INPUT_FILE, os.path.join(self.OUTPUT_ADR, "writers"))
+        self.assertTrue(len(output) == 6)
+        self.assertTrue(len([file for file in output if file.endswith(".png")]) == 2)
+        self.assertTrue(len([file for file in output if file.endswith(".txt")]) == 2)
+
+        output_csv = GraphPerformanceCsv().generate_from_file(TestCasePerformanceCsv.INPUT_FILE,
+                                                              os.path.join(self.OUTPUT_ADR, "writers_csv"))
+        for file, file_csv in zip([file for file in output if file.endswith(".csv")], output_csv):
+            self.assertTrue(os.path.basename(file) == os.path.basename(file_csv))
+            with open(file) as f, open(file_csv) as f_csv:
+                self.assertTrue(f.read() == f_csv.read())
+
+    def test_lazy_import(self):
+        """CSV/TXT outputs without import of matplotlib and numpy"""
+        code = ("import sys\n"
+                "from qgate_graph.graph_performance_csv import GraphPerformanceCsv\n"
+                "from qgate_graph.graph_performance_txt import GraphPerformanceTxt\n"
+                f"GraphPerformanceCsv().generate_from_file({TestCasePerformanceCsv.INPUT_FILE!r}, "
+                f"{path.join(self.OUTPUT_ADR, 'lazy')!r})\n"
+                f"GraphPerformanceTxt().generate_from_file({TestCasePerformanceCsv.INPUT_FILE!r}, "
+                f"{path.join(self.OUTPUT_ADR, 'lazy')!r})\n"
+                "print([name for name in ('matplotlib', 'numpy') if name in sys.modules])")
+        root = path.dirname(path.dirname(path.abspath(__file__)))
+        result = subprocess.run([sys.executable, "-c", code], capture_output = True, text = True,
+                                env = dict(os.environ, PYTHONPATH = root))
+        self.assertTrue(result.returncode == 0)
+        self.assertTrue(result.stdout.strip() == "[]")
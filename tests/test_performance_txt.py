@@ -1,4 +1,5 @@
 from qgate_graph.graph_performance_txt import GraphPerformanceTxt
+from qgate_graph.graph_performance_csv import GraphPerformanceCsv
 from os import path
 import unittest
 import logging
@@ -72,6 +73,19 @@ class TestCasePerformanceTxt(unittest.TestCase):
             self.assertTrue(file.find("RAW") == -1)
             self.assertTrue(file.find("TXT-PRF-") == -1)
 
+    def test_txt_integral(self):
+        """Integral metrics without decimal part (the same as in input)"""
+        text = "\n".join([
+            "############### 2024-10-11 14:36:07.799293 ###############",
+            '{"type":"headr","label":"int","bulk":[1,1],"duration":5,"percentile":1,"now":"2024-10-11 14:36:07.799293"}',
+            '  {"type":"core","plan_executors":1,"real_executors":1,"group":"1x threads","total_calls":60,'
+            '"total_call_per_sec_raw":12,"total_call_per_sec":12,"avrg_time":1,"std_deviation":0,"endexec":"2024-10-11 14:37:17.983998"}',
+            "############### State: OK,  Duration: 1 min 10 sec (70.1 seconds) ###############"])
+        txt = list(GraphPerformanceTxt().render_from_text(text).values())
+        csv = list(GraphPerformanceCsv().render_from_text(text).values())
+        self.assertTrue(len(txt) == 1 and b"|          12 |    1 |" in txt[0])
+        self.assertTrue(len(csv) == 1 and b"1,1x threads,12,1,0.0" in csv[0])
+
     def test_perf_txt_onlynew1(self):
         """Test setting 'only_new'"""
         graph = GraphPerformanceTxt(only_new=True)
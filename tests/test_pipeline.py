@@ -0,0 +1,73 @@
+import os
+import unittest
+import logging
+from os import path
+import shutil
+from qgate_graph.graph_pipeline import GraphPipeline
+from qgate_graph.graph_performance import GraphPerformance
+from qgate_graph.graph_performance_csv import GraphPerformanceCsv
+from qgate_graph.graph_executor import GraphExecutor
+
+
+class TestCasePipeline(unittest.TestCase):
+
+    OUTPUT_ADR = "output/test_pipeline/"
+    INPUT_FILE = "input/prf_cassandra_02.txt"
+    INPUT_ADR = "input"
+    PREFIX = "."
+
+    @classmethod
+    def setUpClass(cls):
+        logging.basicConfig()
+        logging.getLogger().setLevel(logging.INFO)
+
+        # setup relevant path
+        prefix = "."
+        if not os.path.isfile(path.join(prefix, TestCasePipeline.INPUT_FILE)):
+            prefix=".."
+        TestCasePipeline.OUTPUT_ADR = path.join(prefix,TestCasePipeline.OUTPUT_ADR)
+        TestCasePipeline.INPUT_FILE = path.join(prefix, TestCasePipeline.INPUT_FILE)
+        TestCasePipeline.INPUT_ADR = path.join(prefix, TestCasePipeline.INPUT_ADR)
+
+        # clean directory
+        shutil.rmtree(TestCasePipeline.OUTPUT_ADR, True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def test_pipeline_file(self):
+        """Performance and executors graphs from one pass"""
+        pipeline = GraphPipeline([GraphPerformance(), GraphExecutor()])
+        output = pipeline.generate_from_file(TestCasePipeline.INPUT_FILE, self.OUTPUT_ADR)
+
+        self.assertTrue(len(output) == 13)
+        self.assertTrue(len([file for file in output if path.basename(file).startswith("PRF-")]) == 2)
+        self.assertTrue(len([file for file in output if path.basename(file).startswith("EXE-")]) == 11)
+
+    def test_pipeline_same_outputs(self):
+        """Pipeline generates the same outputs as separate graphs"""
+        output = GraphPerformanceCsv().generate_from_file(TestCasePipeline.INPUT_FILE,
+                                                          path.join(self.OUTPUT_ADR, "single"))
+        output += GraphExecutor().generate_from_file(TestCasePipeline.INPUT_FILE,
+                                                     path.join(self.OUTPUT_ADR, "single"))
+
+        pipeline = GraphPipeline([GraphPerformanceCsv(), GraphExecutor()])
+        output_pipeline = pipeline.generate_from_file(TestCasePipeline.INPUT_FILE,
+                                                      path.join(self.OUTPUT_ADR, "pipeline"))
+
+        output.sort()
+        output_pipeline.sort()
+        self.assertTrue([path.basename(file) for file in output] ==
+                        [path.basename(file) for file in output_pipeline])
+        for file, file_pipeline in zip(output, output_pipeline):
+            if file.endswith(".csv"):
+                with open(file) as f, open(file_pipeline) as f_pipeline:
+                    self.assertTrue(f.read() == f_pipeline.read())
+
+    def test_pipeline_dir(self):
+        """Performance and executors graphs for dir"""
+        pipeline = GraphPipeline([GraphPerformance(), GraphExecutor()])
+        output = pipeline.generate_from_dir(TestCasePipeline.INPUT_ADR, self.OUTPUT_ADR)
+
+        self.assertTrue(len(output) == 13 + 69)
@@ -0,0 +1,117 @@
+import os
+import unittest
+import logging
+from os import path
+import shutil
+from qgate_graph.graph_performance import GraphPerformance
+from qgate_graph.graph_executor import GraphExecutor
+from qgate_graph.graph_stats import GraphStats
+from qgate_graph.percentile_item import PercentileItem
+from qgate_graph.render_cache import RenderCache
+
+
+class _CountingGraph(GraphPerformance):
+    """Graph with count of rendered figures"""
+
+    figures = 0
+
+    def _new_figure(self, figsize):
+        _CountingGraph.figures += 1
+        return super()._new_figure(figsize)
+
+
+class TestCaseRenderCache(unittest.TestCase):
+
+    OUTPUT_ADR = "output/test_render_cache/"
+    INPUT_FILE = "input/prf_cassandra-W1-low-percentile-three-lines.txt"
+    PREFIX = "."
+
+    @classmethod
+    def setUpClass(cls):
+        logging.basicConfig()
+        logging.getLogger().setLevel(logging.INFO)
+
+        # setup relevant path
+        prefix = "."
+        if not os.path.isfile(path.join(prefix, TestCaseRenderCache.INPUT_FILE)):
+            prefix=".."
+        TestCaseRenderCache.OUTPUT_ADR = path.join(prefix,TestCaseRenderCache.OUTPUT_ADR)
+        TestCaseRenderCache.INPUT_FILE = path.join(prefix, TestCaseRenderCache.INPUT_FILE)
+
+        # clean directory
+        shutil.rmtree(TestCaseRenderCache.OUTPUT_ADR, True)
+        os.makedirs(TestCaseRenderCache.OUTPUT_ADR, exist_ok = True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def content(self, file) -> bytes:
+        with open(file, "rb") as f:
+            return f.read()
+
+    def test_rerun(self):
+        """Rerun to other output directory without rendering"""
+        cache_dir = path.join(self.OUTPUT_ADR, "cache")
+        _CountingGraph.figures = 0
+        first = _CountingGraph(render_cache = RenderCache(cache_dir)).generate_from_file(
+            self.INPUT_FILE, path.join(self.OUTPUT_ADR, "first"))
+        self.assertTrue(len(first) > 0 and _CountingGraph.figures == len(first))
+
+        # new instance of cache, the items are on disk
+        stats = GraphStats()
+        second = _CountingGraph(render_cache = RenderCache(cache_dir)).generate_from_file(
+            self.INPUT_FILE, path.join(self.OUTPUT_ADR, "second"), stats = stats)
+        self.assertTrue(_CountingGraph.figures == len(first))
+        self.assertTrue(stats.counts["cached"] == len(second))
+        self.assertTrue([self.content(file) for file in first] == [self.content(file) for file in second])
+
+        # other render parameters
+        _CountingGraph(dpi = 50, render_cache = RenderCache(cache_dir)).generate_from_file(
+            self.INPUT_FILE, path.join(self.OUTPUT_ADR, "dpi"))
+        self.assertTrue(_CountingGraph.figures == 2 * len(first))
+
+    def test_same_output(self):
+        """The same outputs with and without cache"""
+        cache = RenderCache()
+        for graph in [GraphPerformance, GraphExecutor]:
+            expected = graph().render_from_text(open(self.INPUT_FILE).read())
+            self.assertTrue(graph(render_cache = cache).render_from_text(open(self.INPUT_FILE).read()) == expected)
+            self.assertTrue(graph(render_cache = cache).render_from_text(open(self.INPUT_FILE).read()) == expected)
+
+    def test_key(self):
+        """Key based on aggregated data"""
+        first = PercentileItem(1)
+        first.append("group", 1, 10.0, 0.1, 0.01)
+        second = PercentileItem(1)
+        second.append("group", 1, 10.0, 0.1, 0.02)
+        self.assertTrue(RenderCache.key({1: first}, "title") != RenderCache.key({1: second}, "title"))
+        self.assertTrue(RenderCache.key({1: first}, "title") != RenderCache.key({1: first}, "other"))
+        second.std_deviation["group"][0] = 0.01
+        self.assertTrue(RenderCache.key({1: first}, "title") == RenderCache.key({1: second}, "title"))
+
+    def test_eviction(self):
+        """Eviction of least recently used items"""
+        cache = RenderCache(memory_size = 20)
+        cache.put("a", b"0123456789")
+        cache.put("b", b"0123456789")
+        cache.get("a")
+        cache.put("c", b"0123456789")
+        self.assertTrue(cache.get("a") and cache.get("c") and cache.get("b") is None)
+
+        cache_dir = path.join(self.OUTPUT_ADR, "eviction")
+        cache = RenderCache(cache_dir, max_size = 25, memory_size = 0)
+        for key in ["a", "b", "c"]:
+            cache.put(key, b"0123456789")
+            os.utime(path.join(cache_dir, f"{key}{RenderCache.EXTENSION}"), ns = (0, len(os.listdir(cache_dir))))
+        self.assertTrue(cache.get("a") is None and cache.get("b") and cache.get("c"))
+
+        # the directory is scanned only for the first time (under the limit)
+        scans = []
+        cache = RenderCache(cache_dir, memory_size = 0)
+        cache._scan = lambda scan = cache._scan: scans.append(1) or scan()
+        for key in range(20):
+            cache.put(str(key), b"0123456789")
+        self.assertTrue(len(scans) == 1 and cache._disk_size == 22 * 10)
+        cache.clear()
+        self.assertTrue(len(os.listdir(cache_dir)) == 0)
@@ -0,0 +1,68 @@
+import os
+import unittest
+import logging
+from os import path
+import time
+from concurrent.futures import ThreadPoolExecutor
+from qgate_graph.file_marker import FileMarker as const
+from qgate_graph.graph_performance import GraphPerformance
+from qgate_graph.render_context import RenderContext
+from qgate_graph.output_target import MemoryTarget
+
+
+class _UnitGraph(GraphPerformance):
+    """Graph without rendering, it records response time unit for each output"""
+
+    def _create_graph(self, percentiles, title, file_name, output_dir, context: RenderContext = None) -> str:
+        # wider window for other threads
+        time.sleep(0.01)
+        return context.target.write_text(context.response_time_unit, output_dir, file_name)
+
+
+class TestCaseRenderContext(unittest.TestCase):
+
+    INPUT_FILE = "input/prf_cassandra-W1-low-percentile-three-lines.txt"
+    PREFIX = "."
+
+    @classmethod
+    def setUpClass(cls):
+        logging.basicConfig()
+        logging.getLogger().setLevel(logging.INFO)
+
+        # setup relevant path
+        prefix = "."
+        if not os.path.isfile(path.join(prefix, TestCaseRenderContext.INPUT_FILE)):
+            prefix=".."
+        TestCaseRenderContext.INPUT_FILE = path.join(prefix, TestCaseRenderContext.INPUT_FILE)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def text(self, unit) -> str:
+        with open(self.INPUT_FILE) as f:
+            text = f.read()
+        return text.replace(f'"type":"{const.PRF_HDR_TYPE}",',
+                            f'"type":"{const.PRF_HDR_TYPE}","{const.PRF_HDR_RESPONSE_UNIT}":"{unit}",')
+
+    def test_concurrent_units(self):
+        """Each concurrent generation uses own response time unit"""
+        units = [f"unit{i}" for i in range(8)]
+        texts = [self.text(unit) for unit in units]
+        self.assertTrue(all([f'"{unit}"' in text for unit, text in zip(units, texts)]))
+
+        graph = _UnitGraph()
+        with ThreadPoolExecutor(max_workers = len(units)) as executor:
+            results = list(executor.map(lambda text: graph.render_from_text(text), texts * 4))
+        for unit, outputs in zip(units * 4, results):
+            self.assertTrue(len(outputs) > 0)
+            self.assertTrue(all([content == unit.encode() for content in outputs.values()]))
+
+    def test_context(self):
+        """Settings of graph in context"""
+        context = GraphPerformance(dpi = 50, min_precision = 1, max_precision = 3)._render_context()
+        self.assertTrue(context.dpi == 50 and context.min_precision == 1 and context.max_precision == 3)
+        self.assertTrue(context.response_time_unit == "sec")
+
+        target = MemoryTarget()
+        self.assertTrue(GraphPerformance()._render_context(target).target is target)
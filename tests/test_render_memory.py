@@ -0,0 +1,77 @@
+import os
+import unittest
+import logging
+from os import path
+import shutil
+from qgate_graph.graph_performance import GraphPerformance
+from qgate_graph.graph_executor import GraphExecutor
+from qgate_graph.graph_pipeline import GraphPipeline
+from qgate_graph.output_writer import GraphWriter, CsvWriter, TxtWriter
+from qgate_graph.output_target import FileTarget, MemoryTarget
+
+
+class TestCaseRenderMemory(unittest.TestCase):
+
+    OUTPUT_ADR = "output/test_render_memory/"
+    INPUT_FILE = "input/prf_cassandra_02.txt"
+    PREFIX = "."
+
+    @classmethod
+    def setUpClass(cls):
+        logging.basicConfig()
+        logging.getLogger().setLevel(logging.INFO)
+
+        # setup relevant path
+        prefix = "."
+        if not os.path.isfile(path.join(prefix, TestCaseRenderMemory.INPUT_FILE)):
+            prefix=".."
+        TestCaseRenderMemory.OUTPUT_ADR = path.join(prefix,TestCaseRenderMemory.OUTPUT_ADR)
+        TestCaseRenderMemory.INPUT_FILE = path.join(prefix, TestCaseRenderMemory.INPUT_FILE)
+
+        # clean directory
+        shutil.rmtree(TestCaseRenderMemory.OUTPUT_ADR, True)
+        os.makedirs(TestCaseRenderMemory.OUTPUT_ADR, exist_ok = True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def read_text(self):
+        with open(self.INPUT_FILE) as f:
+            return f.read()
+
+    def test_same_content(self):
+        """The same names and content as the generated files"""
+        graph = GraphPipeline([GraphPerformance(writers = [GraphWriter(), CsvWriter(), TxtWriter()]),
+                               GraphExecutor()])
+        files = graph.generate_from_text(self.read_text(), self.OUTPUT_ADR)
+        outputs = graph.render_from_text(self.read_text())
+
+        self.assertTrue(list(outputs.keys()) == [path.basename(file) for file in files])
+        for file in files:
+            with open(file, "rb") as f:
+                self.assertTrue(outputs[path.basename(file)] == f.read())
+
+    def test_svg(self):
+        """Graphs in SVG format into caller-supplied dictionary"""
+        buffers = {}
+        with open(self.INPUT_FILE) as f:
+            outputs = GraphPerformance(image_format = "svg").render_from_stream(f, buffers)
+        self.assertTrue(outputs is buffers)
+        self.assertTrue(len(buffers) == 2)
+        for name, content in buffers.items():
+            self.assertTrue(name.startswith("PRF-") and name.endswith(".svg"))
+            self.assertTrue(b"<svg" in content)
+
+        outputs = GraphExecutor(image_format = "svg").render_from_text(self.read_text())
+        self.assertTrue(len(outputs) > 0 and all([name.endswith(".svg") for name in outputs.keys()]))
+
+    def test_text_content(self):
+        """The same line endings and encoding for memory and file"""
+        content = "name;value\nčas;1\n"
+        for newline in [None, "", "\r\n"]:
+            output_file = FileTarget().write_text(content, self.OUTPUT_ADR, "text.csv", newline)
+            memory = MemoryTarget()
+            memory.write_text(content, self.OUTPUT_ADR, "text.csv", newline)
+            with open(output_file, "rb") as f:
+                self.assertTrue(memory.outputs["text.csv"] == f.read())
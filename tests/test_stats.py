@@ -0,0 +1,104 @@
+import os
+import unittest
+import logging
+from os import path
+import shutil
+from qgate_graph.graph_performance import GraphPerformance
+from qgate_graph.graph_performance_csv import GraphPerformanceCsv
+from qgate_graph.graph_executor import GraphExecutor
+from qgate_graph.graph_pipeline import GraphPipeline
+from qgate_graph.graph_stats import GraphStats
+
+
+class TestCaseStats(unittest.TestCase):
+
+    OUTPUT_ADR = "output/test_stats/"
+    INPUT_FILE = "input/prf_cassandra_02.txt"
+    INPUT_ADR = "input"
+    PREFIX = "."
+
+    @classmethod
+    def setUpClass(cls):
+        logging.basicConfig()
+        logging.getLogger().setLevel(logging.INFO)
+
+        # setup relevant path
+        prefix = "."
+        if not os.path.isfile(path.join(prefix, TestCaseStats.INPUT_FILE)):
+            prefix=".."
+        TestCaseStats.OUTPUT_ADR = path.join(prefix,TestCaseStats.OUTPUT_ADR)
+        TestCaseStats.INPUT_FILE = path.join(prefix, TestCaseStats.INPUT_FILE)
+        TestCaseStats.INPUT_ADR = path.join(prefix, TestCaseStats.INPUT_ADR)
+
+        # clean directory
+        shutil.rmtree(TestCaseStats.OUTPUT_ADR, True)
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+    def test_file(self):
+        """Stages and counts for one file"""
+        stats = GraphStats()
+        output = GraphPipeline([GraphPerformance(), GraphExecutor()]).generate_from_file(
+            TestCaseStats.INPUT_FILE, path.join(self.OUTPUT_ADR, "file"), stats = stats)
+
+        with open(TestCaseStats.INPUT_FILE) as f:
+            lines = len(f.readlines())
+        self.assertTrue(stats.counts["files"] == 1)
+        self.assertTrue(stats.counts["lines"] == lines)
+        self.assertTrue(stats.counts["blocks"] == 3)
+        self.assertTrue(stats.counts["outputs"] == len(output))
+        for stage in GraphStats.STAGES:
+            self.assertTrue(stats.durations[stage] > 0)
+        self.assertTrue(GraphStats.current() is None)
+
+    def test_dir_workers(self):
+        """Statistics from worker processes are merged"""
+        stats = GraphStats()
+        output = GraphPerformanceCsv().generate_from_dir(TestCaseStats.INPUT_ADR, path.join(self.OUTPUT_ADR, "workers"),
+                                                         workers = 2, stats = stats)
+
+        stats_serial = GraphStats()
+        GraphPerformanceCsv().generate_from_dir(TestCaseStats.INPUT_ADR, path.join(self.OUTPUT_ADR, "serial"),
+                                                stats = stats_serial)
+        self.assertTrue(stats.counts["outputs"] == len(output))
+        self.assertTrue(stats.counts == stats_serial.counts)
+
+    def test_skipped_errors(self):
+        """Skipped outputs, unchanged files and errors"""
+        input_dir = path.join(self.OUTPUT_ADR, "input_error")
+        os.makedirs(input_dir, exist_ok = True)
+        with open(path.join(input_dir, "error.txt"), "w") as f:
+            f.write('{"type": "headr", "label": "error", "bulk": [1, 1], "now": "2024-10-07 09:06:51"}\n'
+                    '  {"type": "core", "real_executors": 1, "group": "g", "total_call_per_sec": "x", "avrg_time": 1}\n'
+                    '###\n')
+        stats = GraphStats()
+        GraphPerformance().generate_from_dir(input_dir, path.join(self.OUTPUT_ADR, "error"), suppress_error = True,
+                                             stats = stats)
+        self.assertTrue(stats.counts["errors"] == 1 and stats.counts["outputs"] == 0)
+
+        output_dir = path.join(self.OUTPUT_ADR, "only_new")
+        GraphPerformance(only_new = True).generate_from_file(TestCaseStats.INPUT_FILE, output_dir)
+        stats = GraphStats()
+        GraphPerformance(only_new = True).generate_from_file(TestCaseStats.INPUT_FILE, output_dir, stats = stats)
+        self.assertTrue(stats.counts["unchanged"] == 1 and stats.counts["outputs"] == 0)
+
+        stats = GraphStats()
+        GraphPerformance(only_new = True).generate_from_text(open(TestCaseStats.INPUT_FILE).read(), output_dir,
+                                                             stats = stats)
+        self.assertTrue(stats.counts["skipped"] == 2 and stats.counts["outputs"] == 0)
+
+    def test_nested_stages(self):
+        """Duration of nested stage is excluded from outer stage"""
+        stats = GraphStats()
+        with stats.stage("aggregate"):
+            with stats.stage("render"):
+                pass
+        self.assertTrue(stats.durations["render"] > 0 and stats.durations["aggregate"] > 0)
+
+        merged = GraphStats()
+        merged.merge(stats)
+        merged.merge(stats)
+        self.assertTrue(merged.durations["render"] == 2 * stats.durations["render"])
+        self.assertTrue("render" in str(merged))